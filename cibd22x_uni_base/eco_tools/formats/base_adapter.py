@@ -4,12 +4,19 @@ Abstract base class for format adapters
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Any
 import xml.etree.ElementTree as ET
 from eco_tools.core.internal_repr import InternalRepresentation, Zone, Surface, Opening
 from eco_tools.core.id_registry import IDRegistry
 
 
+@lru_cache(maxsize=4096)
+def _strip_namespace(tag: str) -> str:
+    """Strip namespace from tag (cached; a document reuses a few hundred tags)"""
+    return tag.split('}', 1)[-1] if '}' in tag else tag
+
+
 class BaseAdapter(ABC):
     """Abstract base for format-specific adapters"""
     
@@ -39,7 +46,7 @@ class BaseAdapter(ABC):
     
     def _local_tag(self, tag: str) -> str:
         """Strip namespace from tag"""
-        return tag.split('}', 1)[-1] if '}' in tag else tag
+        return _strip_namespace(tag)
     
     def _to_float(self, value: Any) -> float:
         """Safe float conversion"""
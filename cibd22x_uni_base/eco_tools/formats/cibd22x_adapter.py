@@ -4,13 +4,30 @@ Handles CIBD22X format parsing and serialization
 """
 
 import xml.etree.ElementTree as ET
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from eco_tools.formats.base_adapter import BaseAdapter
 from eco_tools.core.internal_repr import (
     InternalRepresentation, Zone, ZoneGroup, Surface, Opening,
     HVACSystem, IAQFan, DHWSystem, Material, Construction, WindowType, PVArray
 )
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # lxml is optional; fall back to ElementTree parsing
+    _lxml_etree = None
+
+
+def _parse_tree(file_path: str):
+    """Parse an XML file with lxml's C parser when available, else ElementTree"""
+    if _lxml_etree is None:
+        return ET.parse(file_path)
+    # Drop comments/PIs so iter() only yields elements, as with ElementTree
+    parser = _lxml_etree.XMLParser(
+        huge_tree=True, remove_comments=True, remove_pis=True, resolve_entities=False
+    )
+    return _lxml_etree.parse(file_path, parser)
+
 
 class CIBD22XAdapter(BaseAdapter):
     """CIBD22X format: name as child <n> element"""
@@ -38,9 +55,12 @@ class CIBD22XAdapter(BaseAdapter):
     
     def parse(self, file_path: str) -> InternalRepresentation:
         """Parse CIBD22X file"""
-        tree = ET.parse(file_path)
+        tree = _parse_tree(file_path)
         root = tree.getroot()
 
+        # One walk of the document serves every catalog/system lookup below
+        self._index_tags(root)
+
         internal = InternalRepresentation()
 
         # Parse zone groups first (for hierarchy)
@@ -70,13 +90,35 @@ class CIBD22XAdapter(BaseAdapter):
         internal.pv_arrays = self._parse_pv_arrays(root)
         internal.du_types = self._parse_du_types(root)
 
+        self._tag_index = None
         return internal
+
+    def _index_tags(self, root: ET.Element) -> Dict[str, List[ET.Element]]:
+        """Group root's descendants by tag, in document order (one tree walk)"""
+        by_tag = defaultdict(list)
+        elements = root.iter()
+        next(elements, None)  # findall('.//Tag') does not match root itself
+        for elem in elements:
+            by_tag[elem.tag].append(elem)
+        self._tag_index = (root, by_tag)
+        return by_tag
+
+    def _find_all(self, root: ET.Element, *tags: str) -> List[ET.Element]:
+        """
+        Descendants of root with the given tags, grouped by tag in argument order.
+
+        Same result as concatenating root.findall('.//Tag') for each tag, but
+        served from the tag index built once per document.
+        """
+        index = getattr(self, '_tag_index', None)
+        by_tag = index[1] if index is not None and index[0] is root else self._index_tags(root)
+        return [elem for tag in tags for elem in by_tag.get(tag, ())]
     
     def _parse_zone_groups(self, root: ET.Element) -> List[ZoneGroup]:
         """Parse zone groups (ResZnGrp) from CIBD22X"""
         zone_groups = []
 
-        for zg_elem in root.findall('.//ResZnGrp'):
+        for zg_elem in self._find_all(root, 'ResZnGrp'):
             name = self.get_name(zg_elem)
             if not name:
                 name = "Zone Group"
@@ -361,7 +403,7 @@ class CIBD22XAdapter(BaseAdapter):
         """Parse HVAC systems with equipment references"""
         systems = []
 
-        for sys_elem in root.findall('.//ResHVACSys') + root.findall('.//ComHVACSys'):
+        for sys_elem in self._find_all(root, 'ResHVACSys', 'ComHVACSys'):
             name = self.get_name(sys_elem)
             if not name:
                 continue
@@ -465,7 +507,7 @@ class CIBD22XAdapter(BaseAdapter):
         """Parse DHW systems"""
         systems = []
 
-        for sys_elem in root.findall('.//ResDHWSys'):
+        for sys_elem in self._find_all(root, 'ResDHWSys'):
             name = self.get_name(sys_elem)
             if not name:
                 continue
@@ -538,7 +580,7 @@ class CIBD22XAdapter(BaseAdapter):
         ]
 
         for tag in fenestration_tags:
-            for wt_elem in root.findall(f'.//{tag}'):
+            for wt_elem in self._find_all(root, tag):
                 name = self.get_name(wt_elem)
                 if not name:
                     name = f"Window Type {len(window_types) + 1}"
@@ -633,7 +675,7 @@ class CIBD22XAdapter(BaseAdapter):
         ]
 
         for tag in construction_tags:
-            for cons_elem in root.findall(f'.//{tag}'):
+            for cons_elem in self._find_all(root, tag):
                 name = self.get_name(cons_elem)
                 if not name:
                     name = f"Construction {len(constructions) + 1}"
@@ -723,7 +765,7 @@ class CIBD22XAdapter(BaseAdapter):
         """Parse dwelling unit types"""
         types = []
 
-        for du_elem in root.findall('.//DwellUnitType'):
+        for du_elem in self._find_all(root, 'DwellUnitType'):
             name = self.get_name(du_elem)
             if not name:
                 continue
@@ -740,7 +782,7 @@ class CIBD22XAdapter(BaseAdapter):
         """Parse IAQ fan systems (ResIAQFan)"""
         iaq_fans = []
 
-        for fan_elem in root.findall('.//ResIAQFan'):
+        for fan_elem in self._find_all(root, 'ResIAQFan'):
             name = self.get_name(fan_elem)
             if not name:
                 name = "IAQ Fan"
@@ -800,7 +842,7 @@ class CIBD22XAdapter(BaseAdapter):
         material_tags = ['ResMat', 'Mat']
 
         for tag in material_tags:
-            for mat_elem in root.findall(f'.//{tag}'):
+            for mat_elem in self._find_all(root, tag):
                 name = self.get_name(mat_elem)
                 if not name:
                     name = "Material"
@@ -872,7 +914,7 @@ class CIBD22XAdapter(BaseAdapter):
         pv_tags = ['ResPVSys', 'PVArray', 'PVSys']
 
         for tag in pv_tags:
-            for pv_elem in root.findall(f'.//{tag}'):
+            for pv_elem in self._find_all(root, tag):
                 name = self.get_name(pv_elem)
                 if not name:
                     name = f"PV Array {len(pv_arrays) + 1}"
@@ -18,6 +18,9 @@ setup(
         "openpyxl>=3.0.0",
     ],
     extras_require={
+        "fast": [
+            "lxml>=4.9",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
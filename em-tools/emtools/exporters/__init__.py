@@ -2,6 +2,6 @@
 # ============================================================================
 """Exporter modules for converting EMJSON to various formats."""
 
-from emtools.exporters.cibd22x_exporter import emjson6_to_cibd22x, write_xml
+from emtools.exporters.cibd22x_exporter import emjson6_to_cibd22x, write_xml, write_xml_bytes
 
-__all__ = ['emjson6_to_cibd22x', 'write_xml']
\ No newline at end of file
+__all__ = ['emjson6_to_cibd22x', 'write_xml', 'write_xml_bytes']
\ No newline at end of file
@@ -7,13 +7,23 @@ Converts EMJSON v6 format back to CIBD22X XML for Title 24 compliance modeling.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, TextIO
+from collections import defaultdict
+import io
 from xml.etree import ElementTree as ET
 
+# EMJSON surface bucket -> CIBD22X element tag, in export order
+_SURFACE_BUCKET_TAGS = (("walls", "ExtWall"), ("roofs", "Roof"), ("floors", "ExtFlr"))
+
+
+def _attrib(attrs: Dict[str, Any]) -> Dict[str, str]:
+    """String attributes from attrs, skipping None values."""
+    return {k: str(v) for k, v in attrs.items() if v is not None} if attrs else {}
+
 
 def _elt(tag: str, text: str | None = None, **attrs) -> ET.Element:
     """Create XML element with optional text and attributes."""
-    e = ET.Element(tag, {k: str(v) for k, v in attrs.items() if v is not None})
+    e = ET.Element(tag, _attrib(attrs))
     if text is not None:
         e.text = str(text)
     return e
@@ -21,8 +31,9 @@ def _elt(tag: str, text: str | None = None, **attrs) -> ET.Element:
 
 def _add(parent: ET.Element, tag: str, text: str | None = None, **attrs) -> ET.Element:
     """Create and append child element."""
-    e = _elt(tag, text, **attrs)
-    parent.append(e)
+    e = ET.SubElement(parent, tag, _attrib(attrs))
+    if text is not None:
+        e.text = str(text)
     return e
 
 
@@ -41,9 +52,17 @@ def emjson6_to_cibd22x(em: Dict[str, Any]) -> ET.Element:
         >>> ET.dump(root)
     """
     root = _elt("Project")
+    root.append(_project_info_element(em))
+    root.append(_catalogs_element(em))
+    bldg = _add(root, "Building")
+    bldg.extend(_iter_building_children(em))
+    return root
 
+
+def _project_info_element(em: Dict[str, Any]) -> ET.Element:
+    """Build the ProjectInfo/Site section."""
     # ProjectInfo / Location
-    info = _add(root, "ProjectInfo")
+    info = _elt("ProjectInfo")
     loc = em.get("project", {}).get("location", {}) or {}
 
     if "building_azimuth_deg" in loc:
@@ -56,9 +75,12 @@ def emjson6_to_cibd22x(em: Dict[str, Any]) -> ET.Element:
         _add(site, "State", loc["state"])
     if loc.get("climate_zone"):
         _add(site, "ClimateZone", loc["climate_zone"])
+    return info
+
 
-    # Catalogs
-    cats = _add(root, "Catalogs")
+def _catalogs_element(em: Dict[str, Any]) -> ET.Element:
+    """Build the Catalogs section (DU, window and construction types)."""
+    cats = _elt("Catalogs")
     catalogs = em.get("catalogs", {})
 
     for du in catalogs.get("du_types", []) or []:
@@ -89,15 +111,22 @@ def emjson6_to_cibd22x(em: Dict[str, Any]) -> ET.Element:
             _add(x, "ApplyTo", ct["apply_to"])
         if ct.get("u_value_btu_ft2_f") is not None:
             _add(x, "UValue", str(ct["u_value_btu_ft2_f"]))
+    return cats
 
-    # Building
-    bldg = _add(root, "Building")
 
+def _iter_building_children(em: Dict[str, Any]) -> Iterator[ET.Element]:
+    """
+    Yield the Building section's children one at a time, in document order.
+
+    PV, then one ResZn/ComZn per zone (with surfaces and openings), then
+    HVAC and DHW systems. Each element is complete when yielded, so callers
+    can serialize and drop it before the next one is built.
+    """
     # PV
     systems = em.get("systems", {})
     pv_systems = systems.get("pv", []) or []
     if pv_systems:
-        pvroot = _add(bldg, "PV")
+        pvroot = _elt("PV")
         for p in pv_systems:
             x = _add(pvroot, "Array", id=p.get("id"))
             _add(x, "Name", p.get("name"))
@@ -107,16 +136,32 @@ def emjson6_to_cibd22x(em: Dict[str, Any]) -> ET.Element:
                 _add(x, "Tilt", str(p["tilt_deg"]))
             if p.get("azimuth_deg") is not None:
                 _add(x, "Azimuth", str(p["azimuth_deg"]))
+        yield pvroot
 
     # Zones + Surfaces + Openings
     zones = em.get("geometry", {}).get("zones", []) or []
     surfs = em.get("geometry", {}).get("surfaces", {}) or {}
     opens = em.get("geometry", {}).get("openings", {}) or {}
 
+    # Surfaces grouped by zone_id (walls, then roofs, then floors, each in list order)
+    surfaces_by_zone: Dict[Any, List[tuple]] = defaultdict(list)
+    for bucket, tag in _SURFACE_BUCKET_TAGS:
+        for s in surfs.get(bucket, []) or []:
+            surfaces_by_zone[s.get("zone_id")].append((tag, s))
+
+    # Opening lookup from all opening types (surfaces store opening IDs)
+    all_openings = {}
+    for win in opens.get("windows", []) or []:
+        all_openings[win.get("id")] = ("window", win)
+    for dr in opens.get("doors", []) or []:
+        all_openings[dr.get("id")] = ("door", dr)
+    for sk in opens.get("skylights", []) or []:
+        all_openings[sk.get("id")] = ("skylight", sk)
+
     for z in zones:
         # Determine if residential based on du_ref or building_type
         is_res = bool(z.get("du_ref") or z.get("building_type") == "MF")
-        zn = _add(bldg, "ResZn" if is_res else "ComZn", id=z.get("id"))
+        zn = _elt("ResZn" if is_res else "ComZn", id=z.get("id"))
         _add(zn, "Name", z.get("name") or z.get("id"))
 
         # Convert floor area from m² to ft²
@@ -140,78 +185,61 @@ def emjson6_to_cibd22x(em: Dict[str, Any]) -> ET.Element:
 
         s_node = _add(zn, "Surfaces")
 
-        for bucket, arr in (("walls", surfs.get("walls", [])),
-                            ("roofs", surfs.get("roofs", [])),
-                            ("floors", surfs.get("floors", []))):
-            tag = {"walls": "ExtWall", "roofs": "Roof", "floors": "ExtFlr"}[bucket]
+        for tag, s in surfaces_by_zone.get(z.get("id"), ()):
+            se = _add(s_node, tag)
+            # Surfaces may not have 'name', use ID from annotation if needed
+            surf_name = (s.get("annotation", {}).get("source_name") or
+                         s.get("id") or "Surface")
+            _add(se, "Name", surf_name)
 
-            for s in arr or []:
-                # Match by zone_id (not parent_zone_ref)
-                if s.get("zone_id") != z.get("id"):
+            # Convert area from m² to ft²
+            if s.get("area_m2") is not None:
+                _add(se, "Area", str(s["area_m2"] / 0.092903))
+
+            # Openings are stored as ID references; look them up in global collections
+            opening_ids = s.get("openings", [])
+
+            for opening_id in opening_ids:
+                if opening_id not in all_openings:
                     continue
 
-                se = _add(s_node, tag)
-                # Surfaces may not have 'name', use ID from annotation if needed
-                surf_name = (s.get("annotation", {}).get("source_name") or 
-                            s.get("id") or "Surface")
-                _add(se, "Name", surf_name)
-
-                # Convert area from m² to ft²
-                if s.get("area_m2") is not None:
-                    _add(se, "Area", str(s["area_m2"] / 0.092903))
-
-                # Openings are stored as ID references; look them up in global collections
-                opening_ids = s.get("openings", [])
-                
-                # Build opening lookup from all opening types
-                all_openings = {}
-                for win in opens.get("windows", []) or []:
-                    all_openings[win.get("id")] = ("window", win)
-                for dr in opens.get("doors", []) or []:
-                    all_openings[dr.get("id")] = ("door", dr)
-                for sk in opens.get("skylights", []) or []:
-                    all_openings[sk.get("id")] = ("skylight", sk)
-                
-                for opening_id in opening_ids:
-                    if opening_id not in all_openings:
-                        continue
-                    
-                    opening_type, opening = all_openings[opening_id]
-                    
-                    if opening_type == "window":
-                        we = _add(se, "Window")
-                        opening_name = (opening.get("annotation", {}).get("source_name") or
-                                      opening.get("id") or "Window")
-                        _add(we, "Name", opening_name)
-                        # Convert from m² to ft²
-                        if opening.get("area_m2") is not None:
-                            _add(we, "Area", str(opening["area_m2"] / 0.092903))
-                        # Convert from m to ft
-                        if opening.get("height_m") is not None:
-                            _add(we, "Height", str(opening["height_m"] / 0.3048))
-                        if opening.get("width_m") is not None:
-                            _add(we, "Width", str(opening["width_m"] / 0.3048))
-                    
-                    elif opening_type == "door":
-                        de = _add(se, "Door")
-                        opening_name = (opening.get("annotation", {}).get("source_name") or
-                                      opening.get("id") or "Door")
-                        _add(de, "Name", opening_name)
-                        if opening.get("area_m2") is not None:
-                            _add(de, "Area", str(opening["area_m2"] / 0.092903))
-                    
-                    elif opening_type == "skylight":
-                        ke = _add(se, "Skylight")
-                        opening_name = (opening.get("annotation", {}).get("source_name") or
-                                      opening.get("id") or "Skylight")
-                        _add(ke, "Name", opening_name)
-                        if opening.get("area_m2") is not None:
-                            _add(ke, "Area", str(opening["area_m2"] / 0.092903))
+                opening_type, opening = all_openings[opening_id]
+
+                if opening_type == "window":
+                    we = _add(se, "Window")
+                    opening_name = (opening.get("annotation", {}).get("source_name") or
+                                    opening.get("id") or "Window")
+                    _add(we, "Name", opening_name)
+                    # Convert from m² to ft²
+                    if opening.get("area_m2") is not None:
+                        _add(we, "Area", str(opening["area_m2"] / 0.092903))
+                    # Convert from m to ft
+                    if opening.get("height_m") is not None:
+                        _add(we, "Height", str(opening["height_m"] / 0.3048))
+                    if opening.get("width_m") is not None:
+                        _add(we, "Width", str(opening["width_m"] / 0.3048))
+
+                elif opening_type == "door":
+                    de = _add(se, "Door")
+                    opening_name = (opening.get("annotation", {}).get("source_name") or
+                                    opening.get("id") or "Door")
+                    _add(de, "Name", opening_name)
+                    if opening.get("area_m2") is not None:
+                        _add(de, "Area", str(opening["area_m2"] / 0.092903))
+
+                elif opening_type == "skylight":
+                    ke = _add(se, "Skylight")
+                    opening_name = (opening.get("annotation", {}).get("source_name") or
+                                    opening.get("id") or "Skylight")
+                    _add(ke, "Name", opening_name)
+                    if opening.get("area_m2") is not None:
+                        _add(ke, "Area", str(opening["area_m2"] / 0.092903))
+        yield zn
 
     # HVAC
     hvac_list = systems.get("hvac", []) or []
     if hvac_list:
-        hvac_root = _add(bldg, "HVAC")
+        hvac_root = _elt("HVAC")
         for h in hvac_list:
             sys = _add(hvac_root, "System", id=h.get("id"))
             _add(sys, "Name", h.get("name"))
@@ -225,11 +253,12 @@ def emjson6_to_cibd22x(em: Dict[str, Any]) -> ET.Element:
             zr = _add(sys, "Zones")
             for zref in (h.get("zone_refs") or []):
                 _add(zr, "ZoneRef", zref)
+        yield hvac_root
 
     # DHW
     dhw_list = systems.get("dhw", []) or []
     for d in dhw_list:
-        sys = _add(bldg, "ResidentialDHWSystem", id=d.get("id"))
+        sys = _elt("ResidentialDHWSystem", id=d.get("id"))
         _add(sys, "Name", d.get("name") or d.get("id"))
         if d.get("system_type_norm"):
             _add(sys, "SystemType", d["system_type_norm"])
@@ -238,27 +267,84 @@ def emjson6_to_cibd22x(em: Dict[str, Any]) -> ET.Element:
         if d.get("requirements"):
             for req in d["requirements"]:
                 _add(sys, "Note", req)
-
-    return root
+        yield sys
 
 
-def write_xml(em: Dict[str, Any], out_path: str) -> None:
+def write_xml(em: Dict[str, Any], out_path: str, pretty: bool = True) -> None:
     """
     Write EMJSON to CIBD22X XML file with pretty formatting.
 
+    The document is streamed: each top-level section and each Building child
+    (zone, PV, HVAC or DHW system) is built, written and released in turn, so
+    the full tree is never held in memory. The output is identical to
+    indenting and writing emjson6_to_cibd22x(em).
+
     Args:
         em: EMJSON v6 dictionary
         out_path: Output XML file path
+        pretty: Indent the document; False writes compact XML (for files
+            that are only parsed back, e.g. round-trip checks)
 
     Example:
         >>> write_xml(emjson, "output.xml")
     """
-    root = emjson6_to_cibd22x(em)
+    with open(out_path, "w", encoding="utf-8") as f:
+        write_xml_stream(em, f, pretty=pretty)
 
-    from xml.dom import minidom
 
-    xml_str = ET.tostring(root, encoding="utf-8")
-    pretty = minidom.parseString(xml_str).toprettyxml(indent="  ")
+def write_xml_bytes(em: Dict[str, Any], pretty: bool = True) -> bytes:
+    """
+    Serialize EMJSON to CIBD22X XML in memory, with the same bytes write_xml writes.
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(pretty)
\ No newline at end of file
+    Lets round trips hand the document straight back to an importer
+    (translate_cibd22x_to_v6(io.BytesIO(data))) without a temporary file.
+
+    Args:
+        em: EMJSON v6 dictionary
+        pretty: Indent the document (see write_xml)
+
+    Returns:
+        UTF-8 encoded XML document
+    """
+    buf = io.StringIO()
+    write_xml_stream(em, buf, pretty=pretty)
+    return buf.getvalue().encode("utf-8")
+
+
+def write_xml_stream(em: Dict[str, Any], f: TextIO, pretty: bool = True) -> None:
+    """
+    Write EMJSON as CIBD22X XML to an open text stream.
+
+    Args:
+        em: EMJSON v6 dictionary
+        f: Text stream (file opened for writing, io.StringIO, ...)
+        pretty: Indent the document; False writes it without whitespace,
+            as ElementTree.write(xml_declaration=True) would
+    """
+    nl, indent = ("\n", "  ") if pretty else ("", "")
+    f.write(f"<?xml version='1.0' encoding='utf-8'?>\n<Project>{nl}")
+    _write_section(f, _project_info_element(em), 1, pretty)
+    _write_section(f, _catalogs_element(em), 1, pretty)
+
+    children = _iter_building_children(em)
+    first = next(children, None)
+    if first is None:
+        f.write(f"{indent}<Building />{nl}")
+    else:
+        f.write(f"{indent}<Building>{nl}")
+        _write_section(f, first, 2, pretty)
+        for child in children:
+            _write_section(f, child, 2, pretty)
+        f.write(f"{indent}</Building>{nl}")
+    f.write("</Project>")
+
+
+def _write_section(f: TextIO, elem: ET.Element, level: int, pretty: bool) -> None:
+    """Write elem; when pretty, on its own line(s) indented as ET.indent would at level."""
+    if not pretty:
+        f.write(ET.tostring(elem, encoding="unicode"))
+        return
+    ET.indent(elem, space="  ", level=level)
+    f.write("  " * level)
+    f.write(ET.tostring(elem, encoding="unicode"))
+    f.write("\n")
@@ -15,7 +15,8 @@ Key conversions:
 
 from __future__ import annotations
 from typing import Dict, Any, List
-import json
+
+from emtools.utils.json_io import load_json, write_json
 
 
 def _reconstruct_face3d_from_annotation(annotation: Dict[str, Any], area_m2: float) -> Dict[str, Any]:
@@ -77,6 +78,12 @@ def _export_materials(em: Dict[str, Any]) -> List[Dict[str, Any]]:
         elif "hbjson_properties" in annotation:
             # Window material or other - restore from annotation
             hb_materials.append(annotation["hbjson_properties"])
+        else:
+            # Source properties were not kept on import; emit a reference stub
+            hb_materials.append({
+                "type": hbjson_type,
+                "identifier": mat.get("name", mat.get("id", "Material"))
+            })
     
     return hb_materials
 
@@ -87,10 +94,18 @@ def _export_constructions(em: Dict[str, Any]) -> List[Dict[str, Any]]:
     window_types = em.get("catalogs", {}).get("window_types", [])
     hb_constructions = []
     
+    # Layers hold material IDs; HBJSON references materials by identifier
+    mat_names = {
+        mat.get("id"): mat.get("name", mat.get("id"))
+        for mat in em.get("catalogs", {}).get("materials", [])
+    }
+    
     # Opaque constructions
     for cons in constructions:
         annotation = cons.get("annotation", {})
-        hbjson_materials = annotation.get("hbjson_materials", cons.get("layers", []))
+        hbjson_materials = annotation.get("hbjson_materials")
+        if hbjson_materials is None:
+            hbjson_materials = [mat_names.get(m, m) for m in cons.get("layers", [])]
         
         item = {
             "type": "OpaqueConstructionAbridged",
@@ -102,7 +117,9 @@ def _export_constructions(em: Dict[str, Any]) -> List[Dict[str, Any]]:
     # Window constructions
     for wt in window_types:
         annotation = wt.get("annotation", {})
-        hbjson_materials = annotation.get("hbjson_materials", [])
+        hbjson_materials = annotation.get("hbjson_materials")
+        if hbjson_materials is None:
+            hbjson_materials = [mat_names.get(m, m) for m in wt.get("layers", [])]
         
         item = {
             "type": "WindowConstructionAbridged",
@@ -304,8 +321,7 @@ def write_hbjson(em: Dict[str, Any], output_path: str) -> None:
     """
     hbjson = emjson6_to_hbjson(em)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(hbjson, f, indent=4)
+    write_json(hbjson, output_path, indent=4)
 
 
 def main():
@@ -320,8 +336,7 @@ def main():
     output_path = sys.argv[2]
     
     # Load EMJSON
-    with open(input_path, 'r', encoding='utf-8') as f:
-        em = json.load(f)
+    em = load_json(input_path)
     
     # Export to HBJSON
     write_hbjson(em, output_path)
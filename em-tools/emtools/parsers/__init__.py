@@ -2,7 +2,7 @@
 # ============================================================================
 """Parser modules for extracting data from XML sources."""
 
-from emtools.parsers.zones import parse_zones, parse_surfaces, parse_openings
+from emtools.parsers.zones import parse_zones, parse_surfaces, parse_openings, find_zone_nodes
 from emtools.parsers.systems import parse_dhw
 from emtools.parsers.catalogs import (
     parse_location, parse_du_types, parse_window_types,
@@ -11,7 +11,7 @@ from emtools.parsers.catalogs import (
 from emtools.parsers.hvac import parse_hvac
 
 __all__ = [
-    'parse_zones', 'parse_surfaces', 'parse_openings',
+    'parse_zones', 'parse_surfaces', 'parse_openings', 'find_zone_nodes',
     'parse_dhw', 'parse_location', 'parse_du_types',
     'parse_window_types', 'parse_construction_types',
     'parse_pv', 'parse_hvac'
@@ -0,0 +1,131 @@
+"""
+Namespace-agnostic element helpers shared by the CIBD22X parser modules.
+
+Works with both lxml and ElementTree elements (see emtools.utils.xml_backend).
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+import math
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+
+@lru_cache(maxsize=4096)
+def local_name(tag: str) -> str:
+    """Strip a "{namespace}" prefix from an element tag."""
+    return tag.split('}', 1)[-1] if '}' in (tag or '') else (tag or '')
+
+
+@lru_cache(maxsize=4096)
+def _local_lower(tag: str) -> str:
+    return local_name(tag).lower()
+
+
+@lru_cache(maxsize=1024)
+def _wanted(names: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(n.lower() for n in names)
+
+
+def child_text(node: Any, *names: str) -> str | None:
+    """
+    Text of the first direct child whose local tag matches one of names.
+
+    Matching is case-insensitive; children with empty text are skipped.
+
+    Args:
+        node: Parent element (None is allowed)
+        *names: Candidate child tag names
+
+    Returns:
+        Stripped text, or None if no matching child has text
+    """
+    if node is None:
+        return None
+    wanted = _wanted(names)
+    for ch in node:
+        if _local_lower(getattr(ch, "tag", "")) in wanted:
+            txt = (ch.text or "").strip()
+            if txt:
+                return txt
+    return None
+
+
+def child_texts(node: Any) -> Dict[str, str]:
+    """
+    Map each direct child's lowercased local tag to its text, in one scan.
+
+    For parsers that read many fields of the same element:
+    child_texts(node).get("name") equals child_text(node, "Name"), but each
+    further lookup is a dict probe instead of another scan of the children.
+
+    Args:
+        node: Parent element (None is allowed)
+
+    Returns:
+        Dict of lowercase local tag -> stripped text of the first child with
+        that tag whose text is non-empty
+    """
+    texts: Dict[str, str] = {}
+    if node is None:
+        return texts
+    for ch in node:
+        key = _local_lower(getattr(ch, "tag", ""))
+        if key not in texts:
+            txt = (ch.text or "").strip()
+            if txt:
+                texts[key] = txt
+    return texts
+
+
+def first_child(node: Any, *names: str) -> Any:
+    """
+    First direct child whose local tag matches one of names (case-insensitive).
+
+    Args:
+        node: Parent element (None is allowed)
+        *names: Candidate child tag names
+
+    Returns:
+        Matching child element, or None
+    """
+    if node is None:
+        return None
+    wanted = _wanted(names)
+    for ch in node:
+        if _local_lower(getattr(ch, "tag", "")) in wanted:
+            return ch
+    return None
+
+
+def to_float(s: str | None) -> float | None:
+    """Parse a number that may contain thousands separators; None if invalid."""
+    if not s: return None
+    if isinstance(s, str):
+        # Common case: an already-clean number (float() ignores surrounding whitespace)
+        try:
+            return float(s)
+        except ValueError:
+            pass
+    try:
+        return float(str(s).replace(",", "").strip())
+    except Exception:
+        return None
+
+
+def to_int(s: str | None) -> int | None:
+    """Like to_float, truncated to int; None if invalid or not finite."""
+    v = to_float(s)
+    return int(v) if v is not None and math.isfinite(v) else None
+
+
+def diag(em: Dict[str, Any], level: str, code: str, message: str, context: Dict[str, Any] | None = None):
+    """Append a diagnostic record to em["diagnostics"]."""
+    diag_to(em.setdefault("diagnostics", []), level, code, message, context)
+
+
+def diag_to(diagnostics: List[Dict[str, Any]], level: str, code: str, message: str,
+            context: Dict[str, Any] | None = None):
+    """Like diag, appending to a diagnostics list fetched once (for per-element loops)."""
+    diagnostics.append({
+        "level": level, "code": code, "message": message, "context": context or {}
+    })
@@ -2,62 +2,54 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Optional
 from xml.etree import ElementTree as ET
-
-
-def _lt(tag: str) -> str:
-    return tag.split('}', 1)[-1] if '}' in (tag or '') else (tag or '')
-
-
-def _child_text_local(node: ET.Element | None, *names: str) -> str | None:
-    if node is None:
-        return None
-    wanted = {n.lower() for n in names}
-    for ch in list(node):
-        if _lt(getattr(ch, "tag", "")).lower() in wanted:
-            txt = (ch.text or "").strip()
-            if txt:
-                return txt
+from emtools.parsers._xml_helpers import (
+    local_name as _lt, child_text as _child_text_local, child_texts as _child_texts,
+    to_float as _to_float, to_int as _to_int, diag as _diag
+)
+from emtools.parsers.constants import (
+    PROJECT_INFO_TAGS, DU_TYPE_TAGS, WINDOW_TYPE_TAGS, CONSTRUCTION_TYPE_TAGS, PV_TAGS
+)
+from emtools.utils.xml_backend import ElementIndex, descendant_finder
+
+
+# Compiled once: one subtree search per call instead of a find/findall per tag
+_FIND_SITE = descendant_finder(("Site", "Location"))
+_FIND_LAYERS = descendant_finder(("Layer", "Material"))
+
+
+def _first_with_tag(elems: List[Any], *tags: str) -> Any:
+    """First element in elems whose local tag is tags[0], else tags[1], ..."""
+    for tag in tags:
+        for el in elems:
+            if _lt(el.tag) == tag:
+                return el
     return None
 
 
-def _to_float(s: str | None) -> float | None:
-    if not s: return None
-    try:
-        return float(str(s).replace(",", "").strip())
-    except Exception:
-        return None
-
-
-def _diag(em: Dict[str, Any], level: str, code: str, message: str, context: Dict[str, Any] | None = None):
-    em.setdefault("diagnostics", []).append({
-        "level": level, "code": code, "message": message, "context": context or {}
-    })
-
-
-def parse_location(root: ET.Element, em: Dict[str, Any]) -> Dict[str, Any]:
+def parse_location(root: ET.Element, em: Dict[str, Any], index: ElementIndex | None = None) -> Dict[str, Any]:
     """Parse project location information."""
+    index = index or ElementIndex.from_root(root, PROJECT_INFO_TAGS)
     info = {}
-    proj = (root.find(".//ProjectInfo") or root.find(".//Info") or root.find(".//Project"))
+    proj = next((el for el in map(index.find_first, PROJECT_INFO_TAGS) if el is not None), None)
     if proj is not None:
-        bldg_az = (_child_text_local(proj, "BldgAz") or _child_text_local(proj, "BuildingAzimuth")
+        proj_texts = _child_texts(proj)
+        bldg_az = (proj_texts.get("bldgaz") or proj_texts.get("buildingazimuth")
                    or proj.get("BldgAz") or proj.get("BuildingAzimuth"))
-        try:
-            info["building_azimuth_deg"] = float(bldg_az) if bldg_az else None
-        except Exception:
-            pass
+        info["building_azimuth_deg"] = _to_float(bldg_az)
 
-        site = (proj.find(".//Site") or proj.find(".//Location"))
+        site = _first_with_tag(_FIND_SITE(proj), "Site", "Location")
         if site is not None:
-            city = _child_text_local(site, "City") or site.get("City")
-            state = _child_text_local(site, "State") or site.get("State")
-            county = _child_text_local(site, "County") or site.get("County")
-            climate = _child_text_local(site, "ClimateZone") or _child_text_local(site, "CZ") or site.get(
+            texts = _child_texts(site)
+            city = texts.get("city") or site.get("City")
+            state = texts.get("state") or site.get("State")
+            county = texts.get("county") or site.get("County")
+            climate = texts.get("climatezone") or texts.get("cz") or site.get(
                 "ClimateZone") or site.get("CZ")
-            zip_code = _child_text_local(site, "ZipCode") or _child_text_local(site, "Zip") or site.get(
+            zip_code = texts.get("zipcode") or texts.get("zip") or site.get(
                 "ZipCode") or site.get("Zip")
-            weather = _child_text_local(site, "WeatherFile") or _child_text_local(site, "Weather") or site.get(
+            weather = texts.get("weatherfile") or texts.get("weather") or site.get(
                 "WeatherFile") or site.get("Weather")
-            elev = _to_float(_child_text_local(site, "Elevation") or site.get("Elevation"))
+            elev = _to_float(texts.get("elevation") or site.get("Elevation"))
 
             if city: info["city"] = city
             if state: info["state"] = state
@@ -80,39 +72,43 @@ def parse_location(root: ET.Element, em: Dict[str, Any]) -> Dict[str, Any]:
 def parse_du_types(
         root: ET.Element,
         em: Dict[str, Any],
-        id_registry: Any = None  # IDRegistry instance (optional for catalogs)
+        id_registry: Any = None,  # IDRegistry instance (optional for catalogs)
+        index: ElementIndex | None = None
 ) -> List[Dict[str, Any]]:
     """Parse dwelling unit type catalog."""
+    index = index or ElementIndex.from_root(root, DU_TYPE_TAGS)
     out: List[Dict[str, Any]] = []
 
-    for du in root.findall(".//DUType") + root.findall(".//DwellUnitType") + root.findall(".//DwellingUnitType"):
-        name = _child_text_local(du, "Name") or du.get("Name") or du.get("id") or "DU"
+    gen_id = id_registry.generate_id_fast if id_registry else None
+    for du in index.find_all(*DU_TYPE_TAGS):
+        texts = _child_texts(du)
+        name = texts.get("name") or du.get("Name") or du.get("id") or "DU"
 
         # Generate stable ID
-        if id_registry:
-            du_id = id_registry.generate_id("DU", name, context="", source_format="CIBD22X")
+        if gen_id is not None:
+            du_id = gen_id("DU", name, "", "CIBD22X")
         else:
             du_id = du.get("id") or f"du:{name.lower().replace(' ', '_')}"
 
         item = {"id": du_id, "name": name}
 
         # Parse floor area (convert ft² to m²)
-        fa_ft2 = _to_float(_child_text_local(du, "FloorArea") or _child_text_local(du, "Area")
+        fa_ft2 = _to_float(texts.get("floorarea") or texts.get("area")
                            or du.get("FloorArea") or du.get("Area"))
         if fa_ft2 is not None:
             item["floor_area_m2"] = fa_ft2 * 0.092903
 
         # Parse occupants
-        occ = _to_float(_child_text_local(du, "Occupants") or _child_text_local(du, "NumOccupants")
-                        or du.get("Occupants") or du.get("NumOccupants"))
+        occ = _to_int(texts.get("occupants") or texts.get("numoccupants")
+                      or du.get("Occupants") or du.get("NumOccupants"))
         if occ is not None:
-            item["occupants"] = int(occ)
+            item["occupants"] = occ
 
         # Parse bedrooms
-        beds = _to_float(_child_text_local(du, "Bedrooms") or _child_text_local(du, "NumBedrooms")
-                         or du.get("Bedrooms") or du.get("NumBedrooms"))
+        beds = _to_int(texts.get("bedrooms") or texts.get("numbedrooms")
+                       or du.get("Bedrooms") or du.get("NumBedrooms"))
         if beds is not None:
-            item["bedrooms"] = int(beds)
+            item["bedrooms"] = beds
 
         # Store annotation
         item["annotation"] = {
@@ -134,54 +130,58 @@ def parse_du_types(
 def parse_window_types(
         root: ET.Element,
         em: Dict[str, Any],
-        id_registry: Any = None  # IDRegistry instance (optional)
+        id_registry: Any = None,  # IDRegistry instance (optional)
+        index: ElementIndex | None = None
 ) -> List[Dict[str, Any]]:
     """Parse window type catalog with fenestration properties."""
+    index = index or ElementIndex.from_root(root, WINDOW_TYPE_TAGS)
     out: List[Dict[str, Any]] = []
 
-    for wt in root.findall(".//WindowType") + root.findall(".//FenestrationConstruction"):
-        name = _child_text_local(wt, "Name") or wt.get("Name") or wt.get("id") or "WindowType"
+    gen_id = id_registry.generate_id_fast if id_registry else None
+    for wt in index.find_all(*WINDOW_TYPE_TAGS):
+        texts = _child_texts(wt)
+        name = texts.get("name") or wt.get("Name") or wt.get("id") or "WindowType"
 
         # Generate stable ID
-        if id_registry:
-            win_id = id_registry.generate_id("WIN", name, context="", source_format="CIBD22X")
+        if gen_id is not None:
+            win_id = gen_id("WIN", name, "", "CIBD22X")
         else:
             win_id = wt.get("id") or f"win:{name.lower().replace(' ', '_')}"
 
         item = {"id": win_id, "name": name}
 
         # Parse U-factor (convert Btu/h·ft²·°F to W/m²·K)
-        uf_ip = _to_float(_child_text_local(wt, "UFactor") or _child_text_local(wt, "UValue")
+        uf_ip = _to_float(texts.get("ufactor") or texts.get("uvalue")
                           or wt.get("UFactor") or wt.get("UValue"))
         if uf_ip is not None:
             item["u_factor_SI"] = uf_ip * 5.678263
 
         # Parse SHGC (dimensionless)
-        shgc = _to_float(_child_text_local(wt, "SHGC") or _child_text_local(wt, "SolarHeatGainCoeff")
+        shgc = _to_float(texts.get("shgc") or texts.get("solarheatgaincoeff")
                          or wt.get("SHGC") or wt.get("SolarHeatGainCoeff"))
         if shgc is not None:
             item["shgc"] = shgc
 
         # Parse VT (dimensionless)
-        vt = _to_float(_child_text_local(wt, "VT") or _child_text_local(wt, "VisibleTransmittance")
+        vt = _to_float(texts.get("vt") or texts.get("visibletransmittance")
                        or wt.get("VT") or wt.get("VisibleTransmittance"))
         if vt is not None:
             item["vt"] = vt
 
         # Parse frame type
-        frame = _child_text_local(wt, "FrameType") or _child_text_local(wt, "Frame") or wt.get("FrameType") or wt.get(
+        frame = texts.get("frametype") or texts.get("frame") or wt.get("FrameType") or wt.get(
             "Frame")
         if frame:
             item["frame_type"] = frame
 
         # Parse glazing layers
-        layers = _to_float(_child_text_local(wt, "GlazingLayers") or _child_text_local(wt, "NumPanes")
-                           or wt.get("GlazingLayers") or wt.get("NumPanes"))
+        layers = _to_int(texts.get("glazinglayers") or texts.get("numpanes")
+                         or wt.get("GlazingLayers") or wt.get("NumPanes"))
         if layers is not None:
-            item["glazing_layers"] = int(layers)
+            item["glazing_layers"] = layers
 
         # Parse gas fill
-        gas = _child_text_local(wt, "GasFill") or _child_text_local(wt, "Gas") or wt.get("GasFill") or wt.get("Gas")
+        gas = texts.get("gasfill") or texts.get("gas") or wt.get("GasFill") or wt.get("Gas")
         if gas:
             item["gas_fill"] = gas
 
@@ -205,44 +205,49 @@ def parse_window_types(
 def parse_construction_types(
         root: ET.Element,
         em: Dict[str, Any],
-        id_registry: Any = None  # IDRegistry instance (optional)
+        id_registry: Any = None,  # IDRegistry instance (optional)
+        index: ElementIndex | None = None
 ) -> List[Dict[str, Any]]:
     """Parse construction assembly catalog."""
+    index = index or ElementIndex.from_root(root, CONSTRUCTION_TYPE_TAGS)
     out: List[Dict[str, Any]] = []
 
-    for ct in root.findall(".//ConstructionType") + root.findall(".//Construction") + root.findall(
-            ".//ConstructionAssembly"):
-        name = _child_text_local(ct, "Name") or ct.get("Name") or ct.get("id") or "Construction"
+    gen_id = id_registry.generate_id_fast if id_registry else None
+    for ct in index.find_all(*CONSTRUCTION_TYPE_TAGS):
+        texts = _child_texts(ct)
+        name = texts.get("name") or ct.get("Name") or ct.get("id") or "Construction"
 
         # Generate stable ID
-        if id_registry:
-            const_id = id_registry.generate_id("CONST", name, context="", source_format="CIBD22X")
+        if gen_id is not None:
+            const_id = gen_id("CONST", name, "", "CIBD22X")
         else:
             const_id = ct.get("id") or f"const:{name.lower().replace(' ', '_')}"
 
         item = {"id": const_id, "name": name}
 
         # Parse application
-        apply_to = _child_text_local(ct, "ApplyTo") or _child_text_local(ct, "Type") or ct.get("ApplyTo") or ct.get(
+        apply_to = texts.get("applyto") or texts.get("type") or ct.get("ApplyTo") or ct.get(
             "Type")
         if apply_to:
             item["apply_to"] = apply_to.lower()
 
         # Parse U-value (convert Btu/h·ft²·°F to W/m²·K)
-        uval_ip = _to_float(_child_text_local(ct, "UValue") or _child_text_local(ct, "UFactor")
+        uval_ip = _to_float(texts.get("uvalue") or texts.get("ufactor")
                             or ct.get("UValue") or ct.get("UFactor"))
         if uval_ip is not None:
             item["u_value_SI"] = uval_ip * 5.678263
 
         # Parse R-value (convert h·ft²·°F/Btu to m²·K/W)
-        rval_ip = _to_float(_child_text_local(ct, "RValue") or _child_text_local(ct, "Resistance")
+        rval_ip = _to_float(texts.get("rvalue") or texts.get("resistance")
                             or ct.get("RValue") or ct.get("Resistance"))
         if rval_ip is not None:
             item["r_value_SI"] = rval_ip * 0.176110
 
         # Parse layers (simplified)
         layers = []
-        for layer in ct.findall(".//Layer") + ct.findall(".//Material"):
+        found = _FIND_LAYERS(ct)
+        for layer in ([el for el in found if _lt(el.tag) == "Layer"]
+                      + [el for el in found if _lt(el.tag) == "Material"]):
             layer_name = _child_text_local(layer, "Name") or layer.get("Name") or "Layer"
             thickness_in = _to_float(_child_text_local(layer, "Thickness") or layer.get("Thickness"))
 
@@ -276,55 +281,58 @@ def parse_construction_types(
 def parse_pv(
         root: ET.Element,
         em: Dict[str, Any],
-        id_registry: Any = None  # IDRegistry instance (optional)
+        id_registry: Any = None,  # IDRegistry instance (optional)
+        index: ElementIndex | None = None
 ) -> List[Dict[str, Any]]:
     """Parse photovoltaic system catalog."""
+    index = index or ElementIndex.from_root(root, PV_TAGS)
     out: List[Dict[str, Any]] = []
 
-    for pv in root.findall(".//PV") + root.findall(".//Array") + root.findall(".//PVArray") + root.findall(
-            ".//PhotovoltaicArray"):
-        name = _child_text_local(pv, "Name") or pv.get("Name") or pv.get("id") or "PV"
+    gen_id = id_registry.generate_id_fast if id_registry else None
+    for pv in index.find_all(*PV_TAGS):
+        texts = _child_texts(pv)
+        name = texts.get("name") or pv.get("Name") or pv.get("id") or "PV"
 
         # Generate stable ID
-        if id_registry:
-            pv_id = id_registry.generate_id("PV", name, context="", source_format="CIBD22X")
+        if gen_id is not None:
+            pv_id = gen_id("PV", name, "", "CIBD22X")
         else:
             pv_id = pv.get("id") or f"pv:{name.lower().replace(' ', '_')}"
 
         item = {"id": pv_id, "name": name}
 
         # Parse DC capacity
-        cap = _to_float(_child_text_local(pv, "CapacityKW") or _child_text_local(pv, "Capacity")
-                        or _child_text_local(pv, "RatedPowerDC") or pv.get("CapacityKW") or pv.get("Capacity"))
+        cap = _to_float(texts.get("capacitykw") or texts.get("capacity")
+                        or texts.get("ratedpowerdc") or pv.get("CapacityKW") or pv.get("Capacity"))
         if cap is not None:
             item["dc_capacity_kW"] = cap
 
         # Parse tilt
-        tilt = _to_float(_child_text_local(pv, "Tilt") or _child_text_local(pv, "TiltAngle")
+        tilt = _to_float(texts.get("tilt") or texts.get("tiltangle")
                          or pv.get("Tilt") or pv.get("TiltAngle"))
         if tilt is not None:
             item["tilt_deg"] = tilt
 
         # Parse azimuth
-        az = _to_float(_child_text_local(pv, "Azimuth") or _child_text_local(pv, "Az")
+        az = _to_float(texts.get("azimuth") or texts.get("az")
                        or pv.get("Azimuth") or pv.get("Az"))
         if az is not None:
             item["azimuth_deg"] = az
 
         # Parse array type
-        array_type = _child_text_local(pv, "ArrayType") or _child_text_local(pv, "Type") or pv.get(
+        array_type = texts.get("arraytype") or texts.get("type") or pv.get(
             "ArrayType") or pv.get("Type")
         if array_type:
             item["array_type"] = array_type
 
         # Parse module type
-        module = _child_text_local(pv, "ModuleType") or _child_text_local(pv, "Module") or pv.get(
+        module = texts.get("moduletype") or texts.get("module") or pv.get(
             "ModuleType") or pv.get("Module")
         if module:
             item["module_type"] = module
 
         # Parse inverter efficiency
-        inv_eff = _to_float(_child_text_local(pv, "InverterEfficiency") or _child_text_local(pv, "InvEff")
+        inv_eff = _to_float(texts.get("inverterefficiency") or texts.get("inveff")
                             or pv.get("InverterEfficiency") or pv.get("InvEff"))
         if inv_eff is not None:
             item["inverter_efficiency"] = inv_eff
@@ -345,4 +353,3 @@ def parse_pv(
     return out
 
 
-
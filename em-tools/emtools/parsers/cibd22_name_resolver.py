@@ -24,9 +24,16 @@ Common Patterns:
 from __future__ import annotations
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+import re
 
 
-@dataclass
+# Zone-name suffix such as "-1_L01" or "_127" (strategy 4)
+_SUFFIX_RE = re.compile(r'[-_](\d+)(_L\d+)?$', re.IGNORECASE)
+# Trailing segment number such as "Zone_L01 2" (strategy 5)
+_SEGMENT_RE = re.compile(r'^(.+?)\s+\d+$')
+
+
+@dataclass(slots=True)
 class ResolutionResult:
     """Result of heuristic name resolution."""
     resolved_id: Optional[str]
@@ -55,20 +62,79 @@ class CIBD22NameResolver:
         objects by parsing their names according to observed conventions.
     """
     
-    def __init__(self, diagnostics: List[Dict[str, Any]]):
+    def __init__(
+        self,
+        diagnostics: List[Dict[str, Any]],
+        zone_name_to_id: Optional[Dict[str, str]] = None,
+        surfaces_by_name: Optional[Dict[str, str]] = None
+    ):
         """
-        Initialize resolver with diagnostic list.
+        Initialize resolver with diagnostic list and optional lookups.
+        
+        Lookups given here are indexed once and used whenever the matching
+        argument is omitted from a resolve call. A lookup must not be mutated
+        after it has been indexed.
         
         Args:
             diagnostics: List to append diagnostic messages
+            zone_name_to_id: Mapping of zone names to zone IDs
+            surfaces_by_name: Mapping of surface names to surface IDs
         """
         self.diagnostics = diagnostics
         self.zone_separator = " : "
+        self.zone_name_to_id = zone_name_to_id
+        self.surfaces_by_name = surfaces_by_name
+        self._zone_src: Optional[Dict[str, str]] = None
+        self._surf_src: Optional[Dict[str, str]] = None
+        
+        if zone_name_to_id is not None:
+            self._index_zones(zone_name_to_id)
+        if surfaces_by_name is not None:
+            self._index_surfaces(surfaces_by_name)
+    
+    def _index_zones(self, zone_name_to_id: Dict[str, str]) -> None:
+        """Precompute case/space-normalized zone lookups (first name wins)."""
+        self._zone_src = zone_name_to_id
+        self._zones_lower: Dict[str, Tuple[str, str]] = {}
+        self._zones_nospace: Dict[str, Tuple[str, str]] = {}
+        self._zones_lower_list: List[Tuple[str, str, str]] = []
+        self._suffix_candidates: Dict[str, List[Tuple[str, str]]] = {}
+        
+        for zn, zid in zone_name_to_id.items():
+            zn_lower = zn.lower()
+            self._zones_lower.setdefault(zn_lower, (zn, zid))
+            self._zones_nospace.setdefault(zn.replace(" ", "").lower(), (zn, zid))
+            self._zones_lower_list.append((zn_lower, zn, zid))
+    
+    def _index_surfaces(self, surfaces_by_name: Dict[str, str]) -> None:
+        """Index surfaces by every tail that follows a zone separator."""
+        self._surf_src = surfaces_by_name
+        self._surfs_by_tail: Dict[str, List[Tuple[str, str]]] = {}
+        sep = self.zone_separator
+        
+        for surf_name, surf_id in surfaces_by_name.items():
+            pos = surf_name.find(sep)
+            while pos != -1:
+                tail = surf_name[pos + len(sep):]
+                self._surfs_by_tail.setdefault(tail, []).append((surf_name, surf_id))
+                pos = surf_name.find(sep, pos + 1)
+    
+    def _zone_candidates_by_suffix(self, suffix_pattern: str) -> List[Tuple[str, str]]:
+        """Zones whose name ends with suffix_pattern (case-insensitive), memoized."""
+        key = suffix_pattern.lower()
+        candidates = self._suffix_candidates.get(key)
+        if candidates is None:
+            candidates = [
+                (zn, zid) for zn_lower, zn, zid in self._zones_lower_list
+                if zn_lower.endswith(key)
+            ]
+            self._suffix_candidates[key] = candidates
+        return candidates
         
     def resolve_zone_from_name(
         self,
         name: str,
-        zone_name_to_id: Dict[str, str]
+        zone_name_to_id: Optional[Dict[str, str]] = None
     ) -> ResolutionResult:
         """
         Resolve zone ID from object name using naming convention with multiple fallback strategies.
@@ -87,6 +153,7 @@ class CIBD22NameResolver:
         Args:
             name: Object name (surface or opening)
             zone_name_to_id: Mapping of zone names to zone IDs
+                (defaults to the lookup given to the constructor)
             
         Returns:
             ResolutionResult with resolved ID, confidence, and warnings
@@ -100,11 +167,18 @@ class CIBD22NameResolver:
             0.5 = Pattern-based suffix match (ambiguous, first selected)
             0.0 = No match found
         """
+        if zone_name_to_id is None:
+            zone_name_to_id = self.zone_name_to_id or {}
+        if zone_name_to_id is not self._zone_src:
+            self._index_zones(zone_name_to_id)
+        
         warnings = []
+        has_separator = self.zone_separator in name
+        zone_name_raw = name.split(self.zone_separator)[-1].strip() if has_separator else ""
         
         # Strategy 1: Standard separator with exact match
-        if self.zone_separator in name:
-            zone_name = name.split(self.zone_separator)[-1].strip()
+        if has_separator:
+            zone_name = zone_name_raw
             zone_id = zone_name_to_id.get(zone_name)
             
             if zone_id:
@@ -120,66 +194,58 @@ class CIBD22NameResolver:
             warnings.append(f"Name pattern doesn't contain standard separator '{self.zone_separator}'")
         
         # Strategy 2: Case-insensitive fallback
-        if self.zone_separator in name:
-            zone_name = name.split(self.zone_separator)[-1].strip().lower()
-            for zn, zid in zone_name_to_id.items():
-                if zn.lower() == zone_name:
-                    warnings.append("Used case-insensitive matching")
-                    self._add_diagnostic(
-                        "info",
-                        "I-RESOLVER-CASE-INSENSITIVE",
-                        f"Case-insensitive zone match for: {name}",
-                        {"object_name": name, "zone_matched": zn}
-                    )
-                    return ResolutionResult(
-                        resolved_id=zid,
-                        confidence=0.8,
-                        strategy_used="case_insensitive_match",
-                        warnings=warnings
-                    )
+        if has_separator:
+            match = self._zones_lower.get(zone_name_raw.lower())
+            if match:
+                zn, zid = match
+                warnings.append("Used case-insensitive matching")
+                self._add_diagnostic(
+                    "info",
+                    "I-RESOLVER-CASE-INSENSITIVE",
+                    f"Case-insensitive zone match for: {name}",
+                    {"object_name": name, "zone_matched": zn}
+                )
+                return ResolutionResult(
+                    resolved_id=zid,
+                    confidence=0.8,
+                    strategy_used="case_insensitive_match",
+                    warnings=warnings
+                )
         
         # Strategy 3: Space-normalized matching
         # Handle naming inconsistencies like "B2.0MTL_B 13" vs "B2.0 MTL_B 13"
-        if self.zone_separator in name:
-            zone_name_raw = name.split(self.zone_separator)[-1].strip()
+        if has_separator:
             # Normalize by removing all spaces for comparison
-            zone_name_normalized = zone_name_raw.replace(" ", "").lower()
-            for zn, zid in zone_name_to_id.items():
-                zn_normalized = zn.replace(" ", "").lower()
-                if zn_normalized == zone_name_normalized:
-                    warnings.append("Used space-normalized matching")
-                    self._add_diagnostic(
-                        "info",
-                        "I-RESOLVER-SPACE-NORMALIZED",
-                        f"Space-normalized zone match for: {name}",
-                        {"object_name": name, "zone_matched": zn, "surface_ref": zone_name_raw}
-                    )
-                    return ResolutionResult(
-                        resolved_id=zid,
-                        confidence=0.75,
-                        strategy_used="space_normalized_match",
-                        warnings=warnings
-                    )
+            match = self._zones_nospace.get(zone_name_raw.replace(" ", "").lower())
+            if match:
+                zn, zid = match
+                warnings.append("Used space-normalized matching")
+                self._add_diagnostic(
+                    "info",
+                    "I-RESOLVER-SPACE-NORMALIZED",
+                    f"Space-normalized zone match for: {name}",
+                    {"object_name": name, "zone_matched": zn, "surface_ref": zone_name_raw}
+                )
+                return ResolutionResult(
+                    resolved_id=zid,
+                    confidence=0.75,
+                    strategy_used="space_normalized_match",
+                    warnings=warnings
+                )
         
         # Strategy 4: Pattern-based suffix matching
         # Handle data inconsistencies like "Corridor-1_L01" → "Breezeway-1_L01"
         # Match by suffix pattern (number + level indicator)
-        if self.zone_separator in name:
-            zone_name_raw = name.split(self.zone_separator)[-1].strip()
-            
+        if has_separator:
             # Extract suffix pattern: "-N_LNN" or similar
             # Common patterns: "-1_L01", "-2_L02", "_127", etc.
-            import re
-            suffix_match = re.search(r'[-_](\d+)(_L\d+)?$', zone_name_raw, re.IGNORECASE)
+            suffix_match = _SUFFIX_RE.search(zone_name_raw)
             
             if suffix_match:
                 suffix_pattern = suffix_match.group(0)  # e.g., "-1_L01"
                 
                 # Find zones with matching suffix
-                candidates = []
-                for zn, zid in zone_name_to_id.items():
-                    if zn.endswith(suffix_pattern) or zn.lower().endswith(suffix_pattern.lower()):
-                        candidates.append((zn, zid))
+                candidates = self._zone_candidates_by_suffix(suffix_pattern)
                 
                 if len(candidates) == 1:
                     # Single match found - likely correct despite name prefix difference
@@ -226,12 +292,9 @@ class CIBD22NameResolver:
         # Strategy 5: Strip trailing segment numbers
         # Handle interior wall segments like "Res_West Facing_L01 2" → "Res_West Facing_L01"
         # Surfaces may have segment numbers appended with space
-        if self.zone_separator in name:
-            zone_name_raw = name.split(self.zone_separator)[-1].strip()
-            
+        if has_separator:
             # Check if ends with space + digit(s)
-            import re
-            segment_match = re.search(r'^(.+?)\s+\d+$', zone_name_raw)
+            segment_match = _SEGMENT_RE.search(zone_name_raw)
             
             if segment_match:
                 zone_name_base = segment_match.group(1)  # Zone name without segment number
@@ -268,7 +331,7 @@ class CIBD22NameResolver:
     def resolve_surface_from_opening(
         self,
         opening_name: str,
-        surfaces_by_name: Dict[str, str],
+        surfaces_by_name: Optional[Dict[str, str]] = None,
         zone_id: Optional[str] = None
     ) -> ResolutionResult:
         """
@@ -282,6 +345,7 @@ class CIBD22NameResolver:
         Args:
             opening_name: Opening object name
             surfaces_by_name: Mapping of surface names to surface IDs
+                (defaults to the lookup given to the constructor)
             zone_id: Optional zone ID to filter candidates
             
         Returns:
@@ -293,6 +357,11 @@ class CIBD22NameResolver:
             0.5 = Zone suffix match only (fallback)
             0.0 = No match found
         """
+        if surfaces_by_name is None:
+            surfaces_by_name = self.surfaces_by_name or {}
+        if surfaces_by_name is not self._surf_src:
+            self._index_surfaces(surfaces_by_name)
+        
         warnings = []
         
         # Extract zone suffix
@@ -307,10 +376,7 @@ class CIBD22NameResolver:
         orientation = self._extract_orientation(opening_name)
         
         # Filter surfaces by zone suffix
-        candidates = []
-        for surf_name, surf_id in surfaces_by_name.items():
-            if zone_suffix and surf_name.endswith(self.zone_separator + zone_suffix):
-                candidates.append((surf_name, surf_id))
+        candidates = self._surfs_by_tail.get(zone_suffix, []) if zone_suffix else []
         
         if not candidates:
             warnings.append(f"No surfaces found with zone suffix: {zone_suffix}")
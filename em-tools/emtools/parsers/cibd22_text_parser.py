@@ -17,12 +17,17 @@ Example:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 import re
 
 
 class CIBD22TextParser:
-    """Parser for CIBD22 text-based format."""
+    """
+    Parser for CIBD22 text-based format.
+    
+    Every parsed object is created with "_type", "_name", "_children" and
+    "_properties" keys, so callers may index them directly.
+    """
     
     def __init__(self):
         self.objects: List[Dict[str, Any]] = []
@@ -159,6 +164,34 @@ class CIBD22TextParser:
         
         return results
     
+    def find_objects_multi(self, types: Iterable[str],
+                           objects: Optional[List[Dict[str, Any]]] = None
+                           ) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        Find objects of several types in a single walk of the object tree.
+        
+        Args:
+            types: Object types to match (e.g., {"ResExtWall", "Roof"})
+            objects: List to search (defaults to parsed objects)
+            
+        Yields:
+            (object, object_type) tuples in document order
+        """
+        if objects is None:
+            objects = self.objects
+        if not isinstance(types, (set, frozenset)):
+            types = frozenset(types)
+        
+        for obj in objects:
+            obj_type = obj.get("_type")
+            if obj_type in types:
+                yield obj, obj_type
+            
+            # Also search children
+            children = obj.get("_children")
+            if children:
+                yield from self.find_objects_multi(types, children)
+    
     def get_property(self, obj: Dict[str, Any], key: str, default: Any = None) -> Any:
         """Get property value from object."""
         return obj.get("_properties", {}).get(key, default)
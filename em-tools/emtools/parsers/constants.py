@@ -16,4 +16,22 @@ OPENING_TYPES = {
     "windows": ["ResWin", "ComWin", "Window"],
     "doors": ["Door", "ExteriorDoor"],
     "skylights": ["Skylight", "TubularDaylightDevice"]
-}
\ No newline at end of file
+}
+
+# Zone element tags (residential and nonresidential)
+ZONE_TAGS = ("ResZn", "ComZn")
+
+# Catalog element tags, in the order each parser collects them
+PROJECT_INFO_TAGS = ("ProjectInfo", "Info", "Project")
+DU_TYPE_TAGS = ("DUType", "DwellUnitType", "DwellingUnitType")
+WINDOW_TYPE_TAGS = ("WindowType", "FenestrationConstruction")
+CONSTRUCTION_TYPE_TAGS = ("ConstructionType", "Construction", "ConstructionAssembly")
+PV_TAGS = ("PV", "Array", "PVArray", "PhotovoltaicArray")
+
+CATALOG_TAGS = PROJECT_INFO_TAGS + DU_TYPE_TAGS + WINDOW_TYPE_TAGS + CONSTRUCTION_TYPE_TAGS + PV_TAGS
+
+# System element tags (matched anywhere in the document, in document order)
+HVAC_SYSTEM_TAGS = ("ResHVACSys", "ComHVACSys", "HVACSystem", "System")
+DHW_SYSTEM_TAGS = ("ResDHWSys", "ResWtrHtr", "DHWSystem", "WaterHeater", "WtrHtr", "ResidentialDHWSystem")
+
+SYSTEM_TAGS = HVAC_SYSTEM_TAGS + DHW_SYSTEM_TAGS
@@ -1,56 +1,42 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Optional
 from xml.etree import ElementTree as ET
+from emtools.parsers._xml_helpers import local_name as _lt, child_texts as _child_texts, diag as _diag
+from emtools.parsers.constants import HVAC_SYSTEM_TAGS
+from emtools.utils.xml_backend import ElementIndex
 
+# Child tags naming a zone served by an HVAC system
+_ZONE_REF_TAGS = frozenset({"ZoneRef", "ZoneServed", "ServedZone"})
 
-def _lt(tag: str) -> str:
-    return tag.split('}', 1)[-1] if '}' in (tag or '') else (tag or '')
 
-
-def _child_text_local(node: ET.Element | None, *names: str) -> str | None:
-    if node is None:
-        return None
-    wanted = {n.lower() for n in names}
-    for ch in list(node):
-        if _lt(getattr(ch, "tag", "")).lower() in wanted:
-            txt = (ch.text or "").strip()
-            if txt:
-                return txt
-    return None
-
-
-def _diag(em: Dict[str, Any], level: str, code: str, message: str, context: Dict[str, Any] | None = None):
-    em.setdefault("diagnostics", []).append({
-        "level": level, "code": code, "message": message, "context": context or {}
-    })
-
-
-def parse_hvac(root: ET.Element, em: Dict[str, Any], id_registry: Any) -> List[Dict[str, Any]]:
+def parse_hvac(root: ET.Element, em: Dict[str, Any], id_registry: Any,
+               index: ElementIndex | None = None) -> List[Dict[str, Any]]:
     """
     Parse HVAC systems - STUB for now, will be expanded later.
     TODO: Full implementation with zone systems, air systems, equipment
     """
+    index = index or ElementIndex.from_root(root, HVAC_SYSTEM_TAGS)
     out: List[Dict[str, Any]] = []
 
     # Basic system parsing
-    for sys in root.iter():
+    gen_id = id_registry.generate_id_fast
+    for sys in index.iter_document_order(*HVAC_SYSTEM_TAGS):
         tag = _lt(sys.tag)
-        if tag not in ("ResHVACSys", "ComHVACSys", "HVACSystem", "System"):
-            continue
+        texts = _child_texts(sys)
 
         sid = sys.get("id") or None
-        name = _child_text_local(sys, "Name") or sys.get("Name") or sid or "HVAC"
+        name = texts.get("name") or sys.get("Name") or sid or "HVAC"
 
         # Generate stable ID
-        sys_id = id_registry.generate_id("SYS", name, context="", source_format="CIBD22X")
+        sys_id = gen_id("SYS", name, "", "CIBD22X")
 
-        typ = _child_text_local(sys, "Type") or sys.get("Type")
-        fuel = _child_text_local(sys, "Fuel") or sys.get("Fuel")
+        typ = texts.get("type") or sys.get("Type")
+        fuel = texts.get("fuel") or sys.get("Fuel")
 
         # Parse zone references
         zones = []
         for zr in sys.iter():
-            if _lt(zr.tag) in ("ZoneRef", "ZoneServed", "ServedZone"):
+            if _lt(zr.tag) in _ZONE_REF_TAGS:
                 zname = (zr.text or "").strip()
                 if zname:
                     zones.append(zname)
@@ -3,48 +3,30 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Optional
 from xml.etree import ElementTree as ET
+from emtools.parsers._xml_helpers import local_name as _lt, child_texts as _child_texts, diag as _diag
+from emtools.parsers.constants import DHW_SYSTEM_TAGS
+from emtools.utils.xml_backend import ElementIndex
 
 
-def _lt(tag: str) -> str:
-    return tag.split('}', 1)[-1] if '}' in (tag or '') else (tag or '')
-
-
-def _child_text_local(node: ET.Element | None, *names: str) -> str | None:
-    if node is None:
-        return None
-    wanted = {n.lower() for n in names}
-    for ch in list(node):
-        if _lt(getattr(ch, "tag", "")).lower() in wanted:
-            txt = (ch.text or "").strip()
-            if txt:
-                return txt
-    return None
-
-
-def _diag(em: Dict[str, Any], level: str, code: str, message: str, context: Dict[str, Any] | None = None):
-    em.setdefault("diagnostics", []).append({
-        "level": level, "code": code, "message": message, "context": context or {}
-    })
-
-
-def parse_dhw(root: ET.Element, em: Dict[str, Any], id_registry: Any) -> List[Dict[str, Any]]:
+def parse_dhw(root: ET.Element, em: Dict[str, Any], id_registry: Any,
+              index: ElementIndex | None = None) -> List[Dict[str, Any]]:
     """
     Parse DHW systems - STUB for now, will be expanded later.
     TODO: Full implementation with HPWH, recirculation loops, etc.
     """
+    index = index or ElementIndex.from_root(root, DHW_SYSTEM_TAGS)
     dhw_list: List[Dict[str, Any]] = []
-    for sys in root.iter():
+    gen_id = id_registry.generate_id_fast
+    for sys in index.iter_document_order(*DHW_SYSTEM_TAGS):
         tag = _lt(sys.tag)
-        if tag not in ("ResDHWSys", "ResWtrHtr", "DHWSystem", "WaterHeater", "WtrHtr", "ResidentialDHWSystem"):
-            continue
+        texts = _child_texts(sys)
 
-        name = _child_text_local(sys, "Name") or sys.get("Name") or sys.get("id") or "DHW"
+        name = texts.get("name") or sys.get("Name") or sys.get("id") or "DHW"
 
         # Generate stable ID
-        dhw_id = id_registry.generate_id("DHW", name, context="", source_format="CIBD22X")
+        dhw_id = gen_id("DHW", name, "", "CIBD22X")
 
-        system_type = _child_text_local(sys, "SystemType") or _child_text_local(sys, "Type") or sys.get(
-            "SystemType") or sys.get("Type")
+        system_type = texts.get("systemtype") or texts.get("type") or sys.get("SystemType") or sys.get("Type")
 
         rec: Dict[str, Any] = {
             "id": dhw_id,
@@ -1,36 +1,48 @@
 from __future__ import annotations
+import re
 from typing import Dict, Any, List, Optional
 from xml.etree import ElementTree as ET
-from emtools.parsers.constants import SURFACE_BUCKETS
-
-
-# -------------------- helpers (namespace-agnostic) --------------------
-def _lt(tag: str) -> str:
-    return tag.split('}', 1)[-1] if '}' in (tag or '') else (tag or '')
-
-
-def _child_text_local(node: ET.Element | None, *names: str) -> str | None:
-    if node is None:
-        return None
-    wanted = {n.lower() for n in names}
-    for ch in list(node):
-        if _lt(getattr(ch, "tag", "")).lower() in wanted:
-            txt = (ch.text or "").strip()
-            if txt:
-                return txt
-    return None
-
+from emtools.parsers._xml_helpers import (
+    local_name as _lt, child_text as _child_text_local, child_texts as _child_texts,
+    first_child as _first_child_local, to_float as _to_float, to_int as _to_int, diag as _diag,
+    diag_to as _diag_to
+)
+from emtools.parsers.constants import SURFACE_BUCKETS, ZONE_TAGS
+from emtools.utils.xml_backend import descendant_finder
+
+
+# Compiled once: a single subtree search per call for every surface tag
+_FIND_ANY_SURFACE = descendant_finder(
+    SURFACE_BUCKETS["walls"] + SURFACE_BUCKETS["roofs"] + SURFACE_BUCKETS["floors"]
+)
+# ...and for the opening tags parse_openings reads under a surface
+_FIND_OPENINGS = descendant_finder(("ResWin", "ComWin", "Window", "Door", "Skylight"))
+
+# Surface tag -> bucket, and bucket -> surface category used for defaults
+_SURFACE_TAG_TO_BUCKET = {tag: bucket for bucket, tags in SURFACE_BUCKETS.items() for tag in tags}
+_BUCKET_CATEGORY = {"walls": "wall", "roofs": "roof", "floors": "floor"}
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Orientation names -> azimuth (deg), and default tilt (deg) per surface category
+_ORIENTATION_AZIMUTH = {
+    "north": 0.0, "n": 0.0,
+    "northeast": 45.0, "ne": 45.0,
+    "east": 90.0, "e": 90.0,
+    "southeast": 135.0, "se": 135.0,
+    "south": 180.0, "s": 180.0,
+    "southwest": 225.0, "sw": 225.0,
+    "west": 270.0, "w": 270.0,
+    "northwest": 315.0, "nw": 315.0
+}
+_DEFAULT_TILT = {"wall": 90.0, "roof": 0.0, "floor": 180.0}  # roof: flat roof default
 
-def _first_child_local(node: ET.Element | None, *names: str) -> ET.Element | None:
-    if node is None:
-        return None
-    wanted = {n.lower() for n in names}
-    for ch in list(node):
-        if _lt(getattr(ch, "tag", "")).lower() in wanted:
-            return ch
-    return None
+# Constant parts of zone multiplier metadata, shared by every zone (read-only)
+_MULT_APPLIES_TO = ("counts", "areas")
+_ZONE_MULT_PATH = {tag: f"{tag}/ZnMult|Mult|Count" for tag in ZONE_TAGS}
 
 
+# -------------------- helpers (namespace-agnostic) --------------------
 def _zone_key(zn: ET.Element) -> str:
     # prefer element text children first, then attributes
     name = (_child_text_local(zn, "Name", "ZnName", "ZoneName", "ID", "Id")
@@ -38,25 +50,18 @@ def _zone_key(zn: ET.Element) -> str:
     return name.strip()
 
 
-def _slug(s: str) -> str:
-    import re
-    s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
-    return s or "zone"
-
+def find_zone_nodes(root: ET.Element) -> List[ET.Element]:
+    """
+    All ResZn/ComZn elements in document order.
 
-def _diag(em: Dict[str, Any], level: str, code: str, message: str, context: Dict[str, Any] | None = None):
-    em.setdefault("diagnostics", []).append({
-        "level": level, "code": code, "message": message, "context": context or {}
-    })
+    Compute once and pass as zone_nodes to parse_zones, parse_surfaces and
+    parse_openings so the document is not rescanned by each parser.
+    """
+    return [el for el in root.iter() if _lt(el.tag) in ZONE_TAGS]
 
 
-def _to_float(s: str | None) -> float | None:
-    if not s: return None
-    try:
-        return float(str(s).replace(",", "").strip())
-    except Exception:
-        return None
+def _slug(s: str) -> str:
+    return _SLUG_RE.sub("-", (s or "").strip().lower()).strip("-") or "zone"
 
 
 # -------------------- zones (ResZn + ComZn) --------------------
@@ -65,7 +70,8 @@ def parse_zones(
         em: Dict[str, Any],
         id_registry: Any,  # IDRegistry instance
         du_index: Dict[str, Dict[str, Any]] | None = None,
-        zone_to_group: Dict[str, str] | None = None
+        zone_to_group: Dict[str, str] | None = None,
+        zone_nodes: List[ET.Element] | None = None
 ) -> List[Dict[str, Any]]:
     """
     Build em['geometry']['zones'] from both ResZn and ComZn.
@@ -74,90 +80,95 @@ def parse_zones(
     - Records zone_multiplier, du_count_in_zone, and effective_multiplier
     - Multiplier metadata includes flat_path for round-tripping
     - Converts units: ft² -> m², ft³ -> m³
+    - zone_nodes: precomputed find_zone_nodes(root); scanned if omitted
     """
+    if zone_nodes is None:
+        zone_nodes = find_zone_nodes(root)
     du_index = du_index or {}
     zone_to_group = zone_to_group or {}
     zones: List[Dict[str, Any]] = []
     geom = em.setdefault("geometry", {})
     geom["zones"] = zones
 
-    def _read_zone_multiplier(zn: ET.Element) -> int:
-        raw = (_child_text_local(zn, "ZnMult") or _child_text_local(zn, "Mult") or _child_text_local(zn, "Count")
+    def _read_zone_multiplier(zn: ET.Element, texts: Dict[str, str]) -> int:
+        raw = (texts.get("znmult") or texts.get("mult") or texts.get("count")
                or zn.get("ZnMult") or zn.get("Mult") or zn.get("Count"))
-        try:
-            return int(float(raw)) if raw not in (None, "") else 1
-        except Exception:
-            return 1
+        z_mult = _to_int(raw)
+        return z_mult if z_mult is not None else 1
 
     def _read_du_count(zn: ET.Element) -> int:
         du = _first_child_local(zn, "DwellUnit", "DU", "Unit")
         raw = (_child_text_local(du, "Count") or (du.get("Count") if du is not None else None) or "1")
-        try:
-            return int(float(raw))
-        except Exception:
-            return 1
+        du_cnt = _to_int(raw)
+        return du_cnt if du_cnt is not None else 1
 
-    def _du_ref_from_zone(zn: ET.Element) -> str | None:
-        ref = (_child_text_local(zn, "DUTypeRef")
+    # DU type id by lowercase name, and by the token after "unit " for the
+    # zone-name heuristic ("A1_Living" -> DU type "Unit A1")
+    du_ids = {key: dt["id"] for key, dt in du_index.items()}
+    du_ids_by_unit_token = {key[5:]: dt["id"] for key, dt in du_index.items() if key.startswith("unit ")}
+
+    def _du_ref_from_zone(zn: ET.Element, texts: Dict[str, str], zname: str) -> str | None:
+        ref = (texts.get("dutyperef")
                or _child_text_local(_first_child_local(zn, "DwellUnit"), "DwellUnitTypeRef")
                or zn.get("DUTypeRef"))
         if ref:
-            key = ref.strip().lower()
-            if key in du_index: return du_index[key]["id"]
+            du_id = du_ids.get(ref.strip().lower())
+            if du_id is not None: return du_id
         # heuristic fallback by zone name
-        zname = _zone_key(zn)
-        if zname:
-            token = zname.split("_", 1)[0].strip()
-            guess = f"unit {token}".lower()
-            if guess in du_index: return du_index[guess]["id"]
-        return None
+        return du_ids_by_unit_token.get(zname.split("_", 1)[0].strip().lower())
 
+    gen_id = id_registry.generate_id_fast
     have_area = 0
-    for zn in (el for el in root.iter() if _lt(el.tag) in ("ResZn", "ComZn")):
+    for zn in zone_nodes:
         zname = _zone_key(zn)
         if not zname:
             continue
 
+        texts = _child_texts(zn)
+        get = zn.get
+
         # Generate stable zone ID using registry
-        zone_id = id_registry.generate_id("Z", zname, context="", source_format="CIBD22X")
+        zone_id = gen_id("Z", zname, "", "CIBD22X")
 
         # Parse area (convert ft² to m²)
-        zfa_ft2 = _to_float(_child_text_local(zn, "FloorArea") or _child_text_local(zn, "ZnFlrArea")
-                            or _child_text_local(zn, "Area") or _child_text_local(zn, "GrossArea")
-                            or zn.get("FloorArea") or zn.get("ZnFlrArea") or zn.get("Area") or zn.get("GrossArea"))
+        zfa_ft2 = _to_float(texts.get("floorarea") or texts.get("znflrarea")
+                            or texts.get("area") or texts.get("grossarea")
+                            or get("FloorArea") or get("ZnFlrArea") or get("Area") or get("GrossArea"))
         zfa_m2 = (zfa_ft2 * 0.092903) if zfa_ft2 is not None else None
         if zfa_m2 is not None:
             have_area += 1
 
         # Parse volume (convert ft³ to m³)
-        vol_ft3 = _to_float(_child_text_local(zn, "Volume") or zn.get("Volume"))
+        vol_ft3 = _to_float(texts.get("volume") or get("Volume"))
         vol_m3 = (vol_ft3 * 0.0283168) if vol_ft3 is not None else None
 
         # Multipliers
-        z_mult = _read_zone_multiplier(zn)
-        du_cnt = _read_du_count(zn) if _lt(zn.tag) == "ResZn" else 1
+        tag_prefix = _lt(zn.tag)
+        is_res = tag_prefix == "ResZn"
+        z_mult = _read_zone_multiplier(zn, texts)
+        du_cnt = _read_du_count(zn) if is_res else 1
         eff_mult = int(z_mult) * int(du_cnt)
-        du_ref = _du_ref_from_zone(zn) if _lt(zn.tag) == "ResZn" else None
-        level_ref = (zone_to_group or {}).get(zname) or None
-
-        tag_prefix = "ResZn" if _lt(zn.tag) == "ResZn" else "ComZn"
+        du_ref = _du_ref_from_zone(zn, texts, zname) if is_res else None
+
+        # Factor list built directly (the du_count factor only exists for ResZn)
+        zone_factor = {"name": "zone_multiplier", "value": z_mult, "flat_path": _ZONE_MULT_PATH[tag_prefix]}
+        if is_res:
+            factors = [{"name": "du_count_in_zone", "value": du_cnt, "flat_path": "ResZn/DwellUnit/Count"},
+                       zone_factor]
+        else:
+            factors = [zone_factor]
         mult_meta = {
             "effective": eff_mult,
-            "factors": [
-                {"name": "du_count_in_zone", "value": du_cnt,
-                 "flat_path": f"{tag_prefix}/DwellUnit/Count"} if tag_prefix == "ResZn" else None,
-                {"name": "zone_multiplier", "value": z_mult, "flat_path": f"{tag_prefix}/ZnMult|Mult|Count"},
-            ],
+            "factors": factors,
             "base_quantity": 1,
-            "applies_to": ["counts", "areas"],
+            "applies_to": _MULT_APPLIES_TO,
         }
-        mult_meta["factors"] = [f for f in mult_meta["factors"] if f is not None]
 
         # EMJSON v6 compliant zone structure
         zones.append({
             "id": zone_id,
             "name": zname,
-            "building_type": "MF" if _lt(zn.tag) == "ResZn" else "NR",
+            "building_type": "MF" if is_res else "NR",
             "multiplier": int(z_mult),
             "floor_area_m2": zfa_m2,
             "volume_m3": vol_m3,
@@ -166,8 +177,8 @@ def parse_zones(
             "served_by": [],  # Populated by HVAC/DHW parsers
             "surfaces": [],  # Populated by parse_surfaces
             "annotation": {
-                "xml_tag": _lt(zn.tag),
-                "source_id": zn.get("id"),
+                "xml_tag": tag_prefix,
+                "source_id": get("id"),
                 "source_area_units": "ft2" if zfa_ft2 is not None else None,
                 "source_volume_units": "ft3" if vol_ft3 is not None else None,
                 "multiplier_metadata": mult_meta
@@ -183,24 +194,31 @@ def parse_zones(
 def parse_surfaces(
         root: ET.Element,
         em: Dict[str, Any],
-        id_registry: Any  # IDRegistry instance
+        id_registry: Any,  # IDRegistry instance
+        zone_nodes: List[ET.Element] | None = None
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Parse surfaces with proper zone references and stable IDs.
     - Converts areas ft² -> m²
     - Determines adjacency/boundary conditions
     - Links surfaces to parent zones
+    - zone_nodes: precomputed find_zone_nodes(root); scanned if omitted
     """
+    if zone_nodes is None:
+        zone_nodes = find_zone_nodes(root)
     zones = em.get("geometry", {}).get("zones", [])
-    zone_name_to_id = {z["name"]: z["id"] for z in zones}
+    # First zone per name wins, as the linear lookups this replaces did
+    zone_by_name: Dict[str, Dict[str, Any]] = {}
+    for z in zones:
+        zone_by_name.setdefault(z["name"], z)
 
     walls: List[Dict[str, Any]] = []
     roofs: List[Dict[str, Any]] = []
     floors: List[Dict[str, Any]] = []
 
-    def _determine_adjacency(surf_elem: ET.Element) -> str:
+    def _determine_adjacency(surf_elem: ET.Element, texts: Dict[str, str]) -> str:
         """Determine surface adjacency from BoundaryCondition or tag."""
-        bc = _child_text_local(surf_elem, "BoundaryCondition") or surf_elem.get("BoundaryCondition")
+        bc = texts.get("boundarycondition") or surf_elem.get("BoundaryCondition")
 
         if bc:
             bc_lower = bc.lower()
@@ -212,11 +230,11 @@ def parse_surfaces(
                 return "adiabatic"
             elif "adjacent" in bc_lower:
                 # Parse adjacent zone reference
-                adj_zone_ref = _child_text_local(surf_elem, "AdjacentZoneRef") or surf_elem.get("AdjacentZoneRef")
+                adj_zone_ref = texts.get("adjacentzoneref") or surf_elem.get("AdjacentZoneRef")
                 if adj_zone_ref:
-                    adj_zone_id = zone_name_to_id.get(adj_zone_ref)
-                    if adj_zone_id:
-                        return f"zone:{adj_zone_id}"
+                    adj_zone = zone_by_name.get(adj_zone_ref)
+                    if adj_zone is not None and adj_zone["id"]:
+                        return f"zone:{adj_zone['id']}"
                 return "adiabatic"
 
         # Fallback based on surface tag
@@ -230,178 +248,89 @@ def parse_surfaces(
 
         return "exterior"
 
-    def _parse_orientation(surf_elem: ET.Element) -> tuple[float | None, float | None]:
+    def _parse_orientation(surf_elem: ET.Element, texts: Dict[str, str]) -> tuple[float | None, float | None]:
         """Parse tilt and azimuth from orientation or explicit fields."""
         # Try explicit tilt/azimuth first
-        tilt = _to_float(_child_text_local(surf_elem, "Tilt") or surf_elem.get("Tilt"))
-        azimuth = _to_float(_child_text_local(surf_elem, "Azimuth") or _child_text_local(surf_elem, "Az")
+        tilt = _to_float(texts.get("tilt") or surf_elem.get("Tilt"))
+        azimuth = _to_float(texts.get("azimuth") or texts.get("az")
                             or surf_elem.get("Azimuth") or surf_elem.get("Az"))
 
         # Parse orientation string (e.g., "North", "South", etc.)
         if azimuth is None:
-            orientation = (_child_text_local(surf_elem, "Orientation") or surf_elem.get("Orientation") or "").lower()
-            orientation_map = {
-                "north": 0.0, "n": 0.0,
-                "northeast": 45.0, "ne": 45.0,
-                "east": 90.0, "e": 90.0,
-                "southeast": 135.0, "se": 135.0,
-                "south": 180.0, "s": 180.0,
-                "southwest": 225.0, "sw": 225.0,
-                "west": 270.0, "w": 270.0,
-                "northwest": 315.0, "nw": 315.0
-            }
-            azimuth = orientation_map.get(orientation)
+            orientation = (texts.get("orientation") or surf_elem.get("Orientation") or "").lower()
+            azimuth = _ORIENTATION_AZIMUTH.get(orientation)
 
         return tilt, azimuth
 
-    def _default_tilt(category: str) -> float:
-        """Get default tilt for surface category."""
-        if category == "wall":
-            return 90.0
-        elif category == "roof":
-            return 0.0  # Flat roof default
-        elif category == "floor":
-            return 180.0
-        return 90.0
-
-    # Iterate through zones and their surfaces
-    for zn in (el for el in root.iter() if _lt(el.tag) in ("ResZn", "ComZn")):
+    # Iterate through zones; one walk per zone finds surfaces of every bucket
+    bucket_lists = {"walls": walls, "roofs": roofs, "floors": floors}
+    gen_id = id_registry.generate_id_fast
+    for zn in zone_nodes:
         zname = _zone_key(zn)
-        zone_id = zone_name_to_id.get(zname)
+        zone = zone_by_name.get(zname)
 
-        if not zone_id:
+        if zone is None or not zone["id"]:
             continue
-
-        # Parse walls
-        for tag in SURFACE_BUCKETS["walls"]:
-            for surf_elem in zn.iterfind(f".//{tag}"):
-                surf_name = _child_text_local(surf_elem, "Name") or surf_elem.get("Name") or tag
-
-                # Generate stable surface ID
-                surf_id = id_registry.generate_id("S", surf_name, context=zname, source_format="CIBD22X")
-
-                # Parse area (convert ft² to m²)
-                area_ft2 = _to_float(_child_text_local(surf_elem, "Area") or surf_elem.get("Area"))
-                area_m2 = (area_ft2 * 0.092903) if area_ft2 is not None else None
-
-                # Parse orientation
-                tilt, azimuth = _parse_orientation(surf_elem)
-                if tilt is None:
-                    tilt = _default_tilt("wall")
-
-                # Parse construction reference
-                const_ref = (_child_text_local(surf_elem, "ConstructionRef") or _child_text_local(surf_elem, "ConsRef")
-                             or surf_elem.get("ConstructionRef") or surf_elem.get("ConsRef"))
-
-                surface = {
-                    "id": surf_id,
-                    "zone_id": zone_id,
-                    "type": "wall",
-                    "geometry_mode": "simplified",  # CIBD22X uses simplified geometry
-                    "tilt_deg": tilt,
-                    "azimuth_deg": azimuth,
-                    "area_m2": area_m2,
-                    "construction_ref": const_ref,
-                    "adjacency": _determine_adjacency(surf_elem),
-                    "openings": [],  # Populated by parse_openings
-                    "annotation": {
-                        "xml_tag": tag,
-                        "source_id": surf_elem.get("id"),
-                        "source_area_units": "ft2" if area_ft2 is not None else None
-                    }
-                }
-
-                walls.append(surface)
-
-                # Add surface ID to zone's surface list
-                zone = next((z for z in zones if z["id"] == zone_id), None)
-                if zone:
-                    zone["surfaces"].append(surf_id)
-
-        # Parse roofs
-        for tag in SURFACE_BUCKETS["roofs"]:
-            for surf_elem in zn.iterfind(f".//{tag}"):
-                surf_name = _child_text_local(surf_elem, "Name") or surf_elem.get("Name") or tag
-                surf_id = id_registry.generate_id("S", surf_name, context=zname, source_format="CIBD22X")
-
-                area_ft2 = _to_float(_child_text_local(surf_elem, "Area") or surf_elem.get("Area"))
-                area_m2 = (area_ft2 * 0.092903) if area_ft2 is not None else None
-
-                tilt, azimuth = _parse_orientation(surf_elem)
-                if tilt is None:
-                    tilt = _default_tilt("roof")
-
-                const_ref = (_child_text_local(surf_elem, "ConstructionRef") or _child_text_local(surf_elem, "ConsRef")
-                             or surf_elem.get("ConstructionRef") or surf_elem.get("ConsRef"))
-
-                surface = {
-                    "id": surf_id,
-                    "zone_id": zone_id,
-                    "type": "roof",
-                    "geometry_mode": "simplified",
-                    "tilt_deg": tilt,
-                    "azimuth_deg": azimuth,
-                    "area_m2": area_m2,
-                    "construction_ref": const_ref,
-                    "adjacency": _determine_adjacency(surf_elem),
-                    "openings": [],
-                    "annotation": {
-                        "xml_tag": tag,
-                        "source_id": surf_elem.get("id"),
-                        "source_area_units": "ft2" if area_ft2 is not None else None
-                    }
-                }
-
-                roofs.append(surface)
-
-                zone = next((z for z in zones if z["id"] == zone_id), None)
-                if zone:
-                    zone["surfaces"].append(surf_id)
-
-        # Parse floors
-        for tag in SURFACE_BUCKETS["floors"]:
-            for surf_elem in zn.iterfind(f".//{tag}"):
-                surf_name = _child_text_local(surf_elem, "Name") or surf_elem.get("Name") or tag
-                surf_id = id_registry.generate_id("S", surf_name, context=zname, source_format="CIBD22X")
-
-                area_ft2 = _to_float(_child_text_local(surf_elem, "Area") or surf_elem.get("Area"))
-                area_m2 = (area_ft2 * 0.092903) if area_ft2 is not None else None
-
-                tilt, azimuth = _parse_orientation(surf_elem)
-                if tilt is None:
-                    tilt = _default_tilt("floor")
-
-                const_ref = (_child_text_local(surf_elem, "ConstructionRef") or _child_text_local(surf_elem, "ConsRef")
-                             or surf_elem.get("ConstructionRef") or surf_elem.get("ConsRef"))
-
-                surface = {
-                    "id": surf_id,
-                    "zone_id": zone_id,
-                    "type": "floor" if "raised" in tag.lower() else "slab",
-                    "geometry_mode": "simplified",
-                    "tilt_deg": tilt,
-                    "azimuth_deg": azimuth,
-                    "area_m2": area_m2,
-                    "construction_ref": const_ref,
-                    "adjacency": _determine_adjacency(surf_elem),
-                    "openings": [],
-                    "annotation": {
-                        "xml_tag": tag,
-                        "source_id": surf_elem.get("id"),
-                        "source_area_units": "ft2" if area_ft2 is not None else None
-                    }
+        zone_id = zone["id"]
+        zone_surfaces = zone["surfaces"]
+
+        for surf_elem in _FIND_ANY_SURFACE(zn):
+            tag = _lt(surf_elem.tag)
+            get = surf_elem.get
+            texts = _child_texts(surf_elem)
+            bucket = _SURFACE_TAG_TO_BUCKET[tag]
+            category = _BUCKET_CATEGORY[bucket]
+            surf_name = texts.get("name") or get("Name") or tag
+
+            # Generate stable surface ID
+            surf_id = gen_id("S", surf_name, zname, "CIBD22X")
+
+            # Parse area (convert ft² to m²)
+            area_ft2 = _to_float(texts.get("area") or get("Area"))
+            area_m2 = (area_ft2 * 0.092903) if area_ft2 is not None else None
+
+            # Parse orientation
+            tilt, azimuth = _parse_orientation(surf_elem, texts)
+            if tilt is None:
+                tilt = _DEFAULT_TILT[category]
+
+            # Parse construction reference
+            const_ref = (texts.get("constructionref") or texts.get("consref")
+                         or get("ConstructionRef") or get("ConsRef"))
+
+            if category == "floor":
+                surf_type = "floor" if "raised" in tag.lower() else "slab"
+            else:
+                surf_type = category
+
+            surface = {
+                "id": surf_id,
+                "zone_id": zone_id,
+                "type": surf_type,
+                "geometry_mode": "simplified",  # CIBD22X uses simplified geometry
+                "tilt_deg": tilt,
+                "azimuth_deg": azimuth,
+                "area_m2": area_m2,
+                "construction_ref": const_ref,
+                "adjacency": _determine_adjacency(surf_elem, texts),
+                "openings": [],  # Populated by parse_openings
+                "annotation": {
+                    "xml_tag": tag,
+                    "source_id": get("id"),
+                    "source_area_units": "ft2" if area_ft2 is not None else None
                 }
+            }
 
-                floors.append(surface)
+            bucket_lists[bucket].append(surface)
 
-                zone = next((z for z in zones if z["id"] == zone_id), None)
-                if zone:
-                    zone["surfaces"].append(surf_id)
+            # Add surface ID to zone's surface list
+            zone_surfaces.append(surf_id)
 
     # Store in EMJSON structure
-    em.setdefault("geometry", {}).setdefault("surfaces", {})["walls"] = walls
-    em["geometry"]["surfaces"]["roofs"] = roofs
-    em["geometry"]["surfaces"]["floors"] = floors
+    surfaces = em.setdefault("geometry", {}).setdefault("surfaces", {})
+    surfaces["walls"] = walls
+    surfaces["roofs"] = roofs
+    surfaces["floors"] = floors
 
     _diag(em, "info", "I-SURF-COUNTS",
           f"walls={len(walls)}, roofs={len(roofs)}, floors={len(floors)}",
@@ -414,20 +343,26 @@ def parse_surfaces(
 def parse_openings(
         root: ET.Element,
         em: Dict[str, Any],
-        id_registry: Any  # IDRegistry instance
+        id_registry: Any,  # IDRegistry instance
+        zone_nodes: List[ET.Element] | None = None
 ) -> None:
     """
     Parse openings (windows, doors, skylights) with proper surface references.
     - Converts areas ft² -> m² and dimensions ft -> m
     - Links openings to parent surfaces
     - Extracts window type references
+    - zone_nodes: precomputed find_zone_nodes(root); scanned if omitted
     """
+    if zone_nodes is None:
+        zone_nodes = find_zone_nodes(root)
     surfaces_dict = em.get("geometry", {}).get("surfaces", {})
     all_surfaces = (
             surfaces_dict.get("walls", []) +
             surfaces_dict.get("roofs", []) +
             surfaces_dict.get("floors", [])
     )
+    # First surface per ID (reversed so earlier entries win)
+    surface_by_id = {s["id"]: s for s in reversed(all_surfaces)}
 
     # Build lookup: zone_id + surface element -> surface_id
     # We'll need to match surfaces by zone and name during iteration
@@ -440,128 +375,123 @@ def parse_openings(
 
     orphaned_openings = 0
 
-    _SURF_TAGS = SURFACE_BUCKETS["walls"] + SURFACE_BUCKETS["roofs"] + SURFACE_BUCKETS["floors"]
-
-    for zn in (el for el in root.iter() if _lt(el.tag) in ("ResZn", "ComZn")):
+    gen_id = id_registry.generate_id_fast
+    diagnostics = em.setdefault("diagnostics", [])
+    for zn in zone_nodes:
         zone_name = _zone_key(zn)
         zone_id = zone_name_to_id.get(zone_name)
         if not zone_id:
             continue
 
         # Find all surfaces in this zone
-        for surf_tag in _SURF_TAGS:
-            for surf_elem in zn.iterfind(f".//{surf_tag}"):
-                surf_name = _child_text_local(surf_elem, "Name") or surf_elem.get("Name") or surf_tag
-
-                # Find matching EMJSON surface by regenerating its ID
-                surf_id = id_registry.generate_id("S", surf_name, context=zone_name, source_format="CIBD22X")
-
-                # Verify this surface exists
-                surf_obj = next((s for s in all_surfaces if s["id"] == surf_id), None)
-                if not surf_obj:
-                    _diag(em, "warn", "W-SURFACE-NOT-FOUND",
-                          f"Could not find surface {surf_name} in zone {zone_name} for openings")
-                    continue
-
-                # Find openings under this surface
-                for opening_elem in surf_elem.iterfind(".//*"):
-                    otag = _lt(opening_elem.tag).lower()
-
-                    if otag not in ("reswin", "comwin", "window", "door", "skylight"):
-                        continue
-
-                    oname = _child_text_local(opening_elem, "Name") or opening_elem.get("Name") or "opening"
-
-                    # Generate stable opening ID
-                    opening_id = id_registry.generate_id(
-                        "O",
-                        oname,
-                        context=f"{zone_name}:{surf_name}",
-                        source_format="CIBD22X"
-                    )
-
-                    # Parse dimensions and area
-                    area_ft2 = _to_float(_child_text_local(opening_elem, "Area") or opening_elem.get("Area"))
-                    height_ft = _to_float(
-                        _child_text_local(opening_elem, "Height") or _child_text_local(opening_elem, "Hgt")
-                        or opening_elem.get("Height") or opening_elem.get("Hgt"))
-                    width_ft = _to_float(
-                        _child_text_local(opening_elem, "Width") or _child_text_local(opening_elem, "Wdth")
-                        or opening_elem.get("Width") or opening_elem.get("Wdth"))
-
-                    # Convert to metric
-                    area_m2 = (area_ft2 * 0.092903) if area_ft2 is not None else None
-                    height_m = (height_ft * 0.3048) if height_ft is not None else None
-                    width_m = (width_ft * 0.3048) if width_ft is not None else None
-
-                    # Parse window type reference
-                    win_type_ref = (_child_text_local(opening_elem, "WindowTypeRef") or _child_text_local(opening_elem,
-                                                                                                          "TypeRef")
-                                    or opening_elem.get("WindowTypeRef") or opening_elem.get("TypeRef"))
-
-                    # Parse fenestration properties if directly specified
-                    u_factor = _to_float(_child_text_local(opening_elem, "UFactor") or opening_elem.get("UFactor"))
-                    shgc = _to_float(_child_text_local(opening_elem, "SHGC") or opening_elem.get("SHGC"))
-                    vt = _to_float(
-                        _child_text_local(opening_elem, "VT") or _child_text_local(opening_elem, "VisibleTransmittance")
-                        or opening_elem.get("VT") or opening_elem.get("VisibleTransmittance"))
-
-                    # Convert U-factor from IP to SI if present (Btu/h·ft²·°F to W/m²·K)
-                    u_factor_si = (u_factor * 5.678263) if u_factor is not None else None
-
-                    # Parse frame type
-                    frame_type = (
-                                _child_text_local(opening_elem, "FrameType") or _child_text_local(opening_elem, "Frame")
-                                or opening_elem.get("FrameType") or opening_elem.get("Frame"))
-
-                    # Determine opening type
-                    opening_type = "window"
-                    if "door" in otag:
-                        opening_type = "door"
-                    elif "skylight" in otag or "sky" in otag:
-                        opening_type = "skylight"
-
-                    opening = {
-                        "id": opening_id,
-                        "parent_surface_id": surf_id,
-                        "type": opening_type,
-                        "area_m2": area_m2,
-                        "height_m": height_m,
-                        "width_m": width_m,
-                        "tilt_deg": None,  # Could be derived from parent surface
-                        "azimuth_deg": None,  # Could be derived from parent surface
-                        "window_type_ref": win_type_ref,
-                        "frame_type": frame_type,
-                        "u_factor_SI": u_factor_si,
-                        "shgc": shgc,
-                        "vt": vt,
-                        "annotation": {
-                            "xml_tag": _lt(opening_elem.tag),
-"source_id": opening_elem.get("id"),
-"source_area_units": "ft2" if area_ft2 is not None else None,
-"source_dimension_units": "ft" if (height_ft is not None or width_ft is not None) else None
-}
-}
-                    # Add to appropriate list
-                    if opening_type == "window":
-                        windows.append(opening)
-                    elif opening_type == "door":
-                        doors.append(opening)
-                    elif opening_type == "skylight":
-                        skylights.append(opening)
-
-                    # Add opening ID to surface's openings list
-                    surf_obj["openings"].append(opening_id)
-
-                # Store in EMJSON structure
-                em.setdefault("geometry", {}).setdefault("openings", {})["windows"] = windows
-                em["geometry"]["openings"]["doors"] = doors
-                em["geometry"]["openings"]["skylights"] = skylights
-
-                _diag(em, "info", "I-OPENINGS-PARSED",
-                      f"windows={len(windows)}, doors={len(doors)}, skylights={len(skylights)}",
-                      {"windows": len(windows), "doors": len(doors), "skylights": len(skylights)})
-
-                if orphaned_openings > 0:
-                    _diag(em, "warn", "W-OPENINGS-ORPHANED",
-                          f"{orphaned_openings} openings could not be linked to surfaces")
\ No newline at end of file
+        for surf_elem in _FIND_ANY_SURFACE(zn):
+            surf_tag = _lt(surf_elem.tag)
+            surf_name = _child_text_local(surf_elem, "Name") or surf_elem.get("Name") or surf_tag
+
+            # Find matching EMJSON surface by regenerating its ID
+            surf_id = gen_id("S", surf_name, zone_name, "CIBD22X")
+
+            # Verify this surface exists
+            surf_obj = surface_by_id.get(surf_id)
+            if not surf_obj:
+                _diag_to(diagnostics, "warn", "W-SURFACE-NOT-FOUND",
+                         f"Could not find surface {surf_name} in zone {zone_name} for openings")
+                orphaned_openings += len(_FIND_OPENINGS(surf_elem))
+                continue
+
+            # Find openings under this surface
+            for opening_elem in _FIND_OPENINGS(surf_elem):
+                otag = _lt(opening_elem.tag).lower()
+                texts = _child_texts(opening_elem)
+                get = opening_elem.get
+                oname = texts.get("name") or get("Name") or "opening"
+
+                # Generate stable opening ID
+                opening_id = gen_id("O", oname, f"{zone_name}:{surf_name}", "CIBD22X")
+
+                # Parse dimensions and area
+                area_ft2 = _to_float(texts.get("area") or get("Area"))
+                height_ft = _to_float(
+                    texts.get("height") or texts.get("hgt")
+                    or get("Height") or get("Hgt"))
+                width_ft = _to_float(
+                    texts.get("width") or texts.get("wdth")
+                    or get("Width") or get("Wdth"))
+
+                # Convert to metric
+                area_m2 = (area_ft2 * 0.092903) if area_ft2 is not None else None
+                height_m = (height_ft * 0.3048) if height_ft is not None else None
+                width_m = (width_ft * 0.3048) if width_ft is not None else None
+
+                # Parse window type reference
+                win_type_ref = (texts.get("windowtyperef") or texts.get("typeref")
+                                or get("WindowTypeRef") or get("TypeRef"))
+
+                # Parse fenestration properties if directly specified
+                u_factor = _to_float(texts.get("ufactor") or get("UFactor"))
+                shgc = _to_float(texts.get("shgc") or get("SHGC"))
+                vt = _to_float(
+                    texts.get("vt") or texts.get("visibletransmittance")
+                    or get("VT") or get("VisibleTransmittance"))
+
+                # Convert U-factor from IP to SI if present (Btu/h·ft²·°F to W/m²·K)
+                u_factor_si = (u_factor * 5.678263) if u_factor is not None else None
+
+                # Parse frame type
+                frame_type = (
+                            texts.get("frametype") or texts.get("frame")
+                            or get("FrameType") or get("Frame"))
+
+                # Determine opening type
+                opening_type = "window"
+                if "door" in otag:
+                    opening_type = "door"
+                elif "skylight" in otag or "sky" in otag:
+                    opening_type = "skylight"
+
+                opening = {
+                    "id": opening_id,
+                    "parent_surface_id": surf_id,
+                    "type": opening_type,
+                    "area_m2": area_m2,
+                    "height_m": height_m,
+                    "width_m": width_m,
+                    "tilt_deg": None,  # Could be derived from parent surface
+                    "azimuth_deg": None,  # Could be derived from parent surface
+                    "window_type_ref": win_type_ref,
+                    "frame_type": frame_type,
+                    "u_factor_SI": u_factor_si,
+                    "shgc": shgc,
+                    "vt": vt,
+                    "annotation": {
+                        "xml_tag": _lt(opening_elem.tag),
+                        "source_id": get("id"),
+                        "source_area_units": "ft2" if area_ft2 is not None else None,
+                        "source_dimension_units": "ft" if (height_ft is not None or width_ft is not None) else None
+                    }
+                }
+
+                # Add to appropriate list
+                if opening_type == "window":
+                    windows.append(opening)
+                elif opening_type == "door":
+                    doors.append(opening)
+                elif opening_type == "skylight":
+                    skylights.append(opening)
+
+                # Add opening ID to surface's openings list
+                surf_obj["openings"].append(opening_id)
+
+    # Store in EMJSON structure
+    openings = em.setdefault("geometry", {}).setdefault("openings", {})
+    openings["windows"] = windows
+    openings["doors"] = doors
+    openings["skylights"] = skylights
+
+    _diag(em, "info", "I-OPENINGS-PARSED",
+          f"windows={len(windows)}, doors={len(doors)}, skylights={len(skylights)}",
+          {"windows": len(windows), "doors": len(doors), "skylights": len(skylights)})
+
+    if orphaned_openings > 0:
+        _diag(em, "warn", "W-OPENINGS-ORPHANED",
+              f"{orphaned_openings} openings could not be linked to surfaces")
\ No newline at end of file
@@ -15,14 +15,68 @@ Key differences from CIBD22X:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Optional
+from types import MappingProxyType
+from collections import defaultdict
 import sys
 
-from emtools.parsers.cibd22_text_parser import parse_cibd22_file
+from emtools.parsers.cibd22_text_parser import CIBD22TextParser, parse_cibd22_file
 from emtools.utils.id_registry import IDRegistry
 
 VERSION = "6.0"
 
+# IP → SI conversion factors for material properties
+BTUIN_HR_FT2_F_TO_W_MK = 0.14413   # Conductivity: Btu-in/hr-ft²-F → W/m-K
+LB_FT3_TO_KG_M3 = 16.0185          # Density: lb/ft³ → kg/m³
+BTU_LB_F_TO_J_KGK = 4186.8         # Specific heat: Btu/lb-F → J/kg-K
+IN_TO_M = 0.0254                   # Thickness: inches → meters
+
+# IP → SI conversion factors for geometry
+FT_TO_M = 0.3048
+FT2_TO_M2 = 0.092903
+FT3_TO_M3 = 0.0283168
+
+# Shared annotation templates; per-item dicts are built as {**BASE, ...deltas}
+_ANNOT_BASE = {"source_format": "CIBD22"}
+_ZONE_ANNOT_BASE = {
+    "source_format": "CIBD22",
+    "source_area_units": "ft2",
+    "source_height_units": "ft",
+}
+
+# Map object types to surface buckets
+_SURFACE_TYPE_TO_BUCKET: Mapping[str, str] = MappingProxyType({
+    "ResExtWall": "walls",
+    "ResIntWall": "walls",  # Interior walls
+    "ComIntWall": "walls",  # Commercial interior walls
+    "Roof": "roofs",
+    "ResSlabFlr": "floors",
+    "ResExtFlr": "floors",
+    "ResFlrSeg": "floors",  # Floor segments
+    "ComFlrSeg": "floors",  # Commercial floor segments
+    "ResCeilg": "roofs",    # Interior ceilings (treated as roofs)
+    "ComCeilg": "roofs"     # Commercial ceilings
+})
+
+# Map object types to opening buckets
+_OPENING_TYPE_TO_BUCKET: Mapping[str, str] = MappingProxyType({
+    "ResWin": "windows",
+    "Door": "doors",
+    "ResDoor": "doors",  # Residential doors
+    "Skylight": "skylights"
+})
+
+# Interior surface types (have adjacency)
+_INTERIOR_SURFACE_TYPES = frozenset({
+    "ResIntWall", "ComIntWall", "ResIntFlr", "ResFlrSeg", "ComFlrSeg", "ResCeilg", "ComCeilg"
+})
+
+# "Outside" values on interior surfaces that are not zone references
+_SPECIAL_ADJACENCIES = frozenset({"Ambient", "Ground", "Adiabatic"})
+
+# Per-object warnings beyond this count are collapsed into one diagnostic
+_DIAG_BATCH_LIMIT = 100
+
 
 def _to_float(val: Any, default: float = 0.0) -> float:
     """Safe float conversion."""
@@ -34,14 +88,68 @@ def _to_float(val: Any, default: float = 0.0) -> float:
         return default
 
 
-def _parse_project_and_location(parser, em: Dict[str, Any], id_registry: IDRegistry) -> None:
+def _compact(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop None-valued top-level keys so missing fields are not serialized."""
+    return {k: v for k, v in item.items() if v is not None}
+
+
+def _flush_diag_batch(diagnostics: List[Dict[str, Any]], level: str, code: str,
+                      contexts: List[Dict[str, Any]], message_fmt: str, summary: str) -> None:
+    """
+    Append per-object diagnostics collected during a parse loop.
+    
+    Batches up to _DIAG_BATCH_LIMIT entries are emitted as individual
+    diagnostics; larger batches collapse into one diagnostic whose context
+    holds the count and every per-object context.
+    
+    Args:
+        diagnostics: Target diagnostics list
+        level: Diagnostic level ("warning", "info", ...)
+        code: Diagnostic code shared by the batch
+        contexts: Per-object context dicts, in emission order
+        message_fmt: Per-object message, formatted with the context's keys
+        summary: Message prefix for the collapsed diagnostic
+    """
+    if not contexts:
+        return
+    if len(contexts) <= _DIAG_BATCH_LIMIT:
+        diagnostics.extend(
+            {"level": level, "code": code, "message": message_fmt.format(**ctx), "context": ctx}
+            for ctx in contexts
+        )
+    else:
+        diagnostics.append({
+            "level": level,
+            "code": code,
+            "message": f"{summary}: {len(contexts)} occurrences",
+            "context": {"count": len(contexts), "contexts": contexts}
+        })
+
+
+def _convert_column(props_list: List[Dict[str, Any]], key: str, factor: float) -> List[Any]:
+    """
+    Convert one numeric property across a list of objects from IP to SI.
+    
+    Args:
+        props_list: Object property dicts, in output order
+        key: Property name to read (e.g., "Conductivity")
+        factor: IP → SI multiplier
+        
+    Returns:
+        Converted values in the same order; None where missing or ≤ 0
+    """
+    values = [_to_float(p.get(key)) for p in props_list]
+    return [v * factor if v > 0 else None for v in values]
+
+
+def _parse_project_and_location(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry) -> None:
     """Parse project info and location from Proj and Bldg objects."""
     proj_objs = parser.find_objects(obj_type="Proj")
     bldg_objs = parser.find_objects(obj_type="Bldg")
     
     if proj_objs:
         proj = proj_objs[0]
-        props = proj.get("_properties", {})
+        props = proj["_properties"]
         
         em["project"]["model_info"].update({
             "project_name": proj.get("_name"),
@@ -57,13 +165,13 @@ def _parse_project_and_location(parser, em: Dict[str, Any], id_registry: IDRegis
     
     if bldg_objs:
         bldg = bldg_objs[0]
-        props = bldg.get("_properties", {})
+        props = bldg["_properties"]
         
         if props.get("BldgAz"):
             em["project"]["location"]["building_azimuth_deg"] = _to_float(props["BldgAz"])
 
 
-def _parse_du_types(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
+def _parse_du_types(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
     """Parse DwellUnitType catalog objects."""
     du_types = parser.find_objects(obj_type="DwellUnitType")
     du_list = []
@@ -71,7 +179,7 @@ def _parse_du_types(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict
     
     for du in du_types:
         name = du.get("_name", "DU")
-        props = du.get("_properties", {})
+        props = du["_properties"]
         
         # Generate stable ID
         du_id = id_registry.generate_id("DU", name, context="", source_format="CIBD22")
@@ -79,7 +187,7 @@ def _parse_du_types(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict
         
         # Convert CondFlrArea from ft² to m²
         floor_area_ft2 = _to_float(props.get("CondFlrArea"))
-        floor_area_m2 = floor_area_ft2 * 0.092903 if floor_area_ft2 > 0 else None
+        floor_area_m2 = floor_area_ft2 * FT2_TO_M2 if floor_area_ft2 > 0 else None
         
         item = {
             "id": du_id,
@@ -87,13 +195,13 @@ def _parse_du_types(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict
             "floor_area_m2": floor_area_m2,
             "bedrooms": int(props.get("NumBedrooms", 0)) if props.get("NumBedrooms") else None,
             "annotation": {
-                "source_format": "CIBD22",
-                "source_name": name,
+                **_ANNOT_BASE,
+                "source_name": sys.intern(name),
                 "source_area_units": "ft2" if floor_area_ft2 else None,
             }
         }
         
-        du_list.append(item)
+        du_list.append(_compact(item))
     
     em["catalogs"]["du_types"] = du_list
     
@@ -107,7 +215,7 @@ def _parse_du_types(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict
     return du_name_to_id
 
 
-def _parse_window_types(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
+def _parse_window_types(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
     """Parse ResWinType catalog objects."""
     win_types = parser.find_objects(obj_type="ResWinType")
     wt_list = []
@@ -115,7 +223,7 @@ def _parse_window_types(parser, em: Dict[str, Any], id_registry: IDRegistry) ->
     
     for wt in win_types:
         name = wt.get("_name", "WindowType")
-        props = wt.get("_properties", {})
+        props = wt["_properties"]
         
         # Generate stable ID
         wt_id = id_registry.generate_id("WIN", name, context="", source_format="CIBD22")
@@ -133,7 +241,7 @@ def _parse_window_types(parser, em: Dict[str, Any], id_registry: IDRegistry) ->
             }
         }
         
-        wt_list.append(item)
+        wt_list.append(_compact(item))
     
     em["catalogs"]["window_types"] = wt_list
     
@@ -147,7 +255,7 @@ def _parse_window_types(parser, em: Dict[str, Any], id_registry: IDRegistry) ->
     return wt_name_to_id
 
 
-def _parse_construction_types(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
+def _parse_construction_types(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
     """Parse ResConsAssm catalog objects."""
     cons_types = parser.find_objects(obj_type="ResConsAssm")
     ct_list = []
@@ -155,7 +263,7 @@ def _parse_construction_types(parser, em: Dict[str, Any], id_registry: IDRegistr
     
     for ct in cons_types:
         name = ct.get("_name", "Construction")
-        props = ct.get("_properties", {})
+        props = ct["_properties"]
         
         # Generate stable ID
         ct_id = id_registry.generate_id("CONS", name, context="", source_format="CIBD22")
@@ -171,7 +279,7 @@ def _parse_construction_types(parser, em: Dict[str, Any], id_registry: IDRegistr
             }
         }
         
-        ct_list.append(item)
+        ct_list.append(_compact(item))
     
     em["catalogs"]["construction_types"] = ct_list
     
@@ -185,7 +293,7 @@ def _parse_construction_types(parser, em: Dict[str, Any], id_registry: IDRegistr
     return ct_name_to_id
 
 
-def _parse_materials(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
+def _parse_materials(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
     """Parse ResMat and Mat catalog objects (materials library)."""
     res_mats = parser.find_objects(obj_type="ResMat")
     gen_mats = parser.find_objects(obj_type="Mat")
@@ -193,47 +301,36 @@ def _parse_materials(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dic
     mat_list = []
     mat_name_to_id = {}
     
-    for mat in all_mats:
+    # Gather the numeric property columns in one pass, then convert each column
+    # with a single multiply per value (≤0 / missing stays None)
+    props_list = [mat["_properties"] for mat in all_mats]
+    conductivity_col = _convert_column(props_list, "Conductivity", BTUIN_HR_FT2_F_TO_W_MK)
+    density_col = _convert_column(props_list, "Density", LB_FT3_TO_KG_M3)
+    specheat_col = _convert_column(props_list, "SpecHeat", BTU_LB_F_TO_J_KGK)
+    thickness_col = [
+        _to_float(p.get("Thickness")) * IN_TO_M if p.get("Thickness") else None
+        for p in props_list
+    ]
+    
+    for mat, conductivity_w_mk, density_kg_m3, specheat_j_kgk, thickness_m in zip(
+            all_mats, conductivity_col, density_col, specheat_col, thickness_col):
         name = mat.get("_name", "Material")
-        props = mat.get("_properties", {})
         mat_type = mat.get("_type", "Mat")
         
         # Generate stable ID
         mat_id = id_registry.generate_id("MAT", name, context="", source_format="CIBD22")
         mat_name_to_id[name] = mat_id
         
-        # Parse thermal properties
-        # Conductivity: Btu-in/hr-ft²-F → W/m-K conversion
-        conductivity_btuin = _to_float(props.get("Conductivity"))
-        conductivity_w_mk = None
-        if conductivity_btuin and conductivity_btuin > 0:
-            # Btu-in/hr-ft²-F × 0.14413 = W/m-K
-            conductivity_w_mk = conductivity_btuin * 0.14413
-        
-        # Density: lb/ft³ → kg/m³ conversion
-        density_lbft3 = _to_float(props.get("Density"))
-        density_kg_m3 = None
-        if density_lbft3 and density_lbft3 > 0:
-            # lb/ft³ × 16.0185 = kg/m³
-            density_kg_m3 = density_lbft3 * 16.0185
-        
-        # Specific heat: Btu/lb-F → J/kg-K conversion
-        specheat_btu = _to_float(props.get("SpecHeat"))
-        specheat_j_kgk = None
-        if specheat_btu and specheat_btu > 0:
-            # Btu/lb-F × 4186.8 = J/kg-K
-            specheat_j_kgk = specheat_btu * 4186.8
-        
         item = {
             "id": mat_id,
             "name": name,
             "conductivity_w_mk": conductivity_w_mk,
             "density_kg_m3": density_kg_m3,
             "specific_heat_j_kgk": specheat_j_kgk,
-            "thickness_m": _to_float(props.get("Thickness")) * 0.0254 if props.get("Thickness") else None,  # inches to meters
+            "thickness_m": thickness_m,  # inches to meters
             "annotation": {
-                "source_format": "CIBD22",
-                "source_name": name,
+                **_ANNOT_BASE,
+                "source_name": sys.intern(name),
                 "source_type": mat_type,
                 "source_units": {
                     "conductivity": "Btu-in/hr-ft2-F",
@@ -244,7 +341,7 @@ def _parse_materials(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dic
             }
         }
         
-        mat_list.append(item)
+        mat_list.append(_compact(item))
     
     # Add to catalogs under materials key
     if "materials" not in em["catalogs"]:
@@ -261,7 +358,7 @@ def _parse_materials(parser, em: Dict[str, Any], id_registry: IDRegistry) -> Dic
     return mat_name_to_id
 
 
-def _parse_zones(parser, em: Dict[str, Any], id_registry: IDRegistry, 
+def _parse_zones(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry, 
                  du_name_to_id: Dict[str, str]) -> Dict[str, str]:
     """Parse Spc (Space), ResZn, ResOtherZn, and ThrmlZn (Thermal Zone) objects with enhanced field coverage."""
     # CIBD22 uses multiple zone object types:
@@ -285,16 +382,17 @@ def _parse_zones(parser, em: Dict[str, Any], id_registry: IDRegistry,
     zone_list = []
     zone_name_to_id = {}
     
-    # Build DU type lookup for floor area fallback
-    du_id_to_data = {}
-    for du_type in em.get("catalogs", {}).get("du_types", []):
-        du_id_to_data[du_type["id"]] = du_type
+    # Build DU type floor area lookup for fallback
+    du_floor_area_by_id = {
+        d["id"]: d.get("floor_area_m2")
+        for d in em.get("catalogs", {}).get("du_types", [])
+    }
     
     zones_with_du_fallback = 0
     
     for zn in zones:
         name = zn.get("_name", "Zone")
-        props = zn.get("_properties", {})
+        props = zn["_properties"]
         
         # Generate stable ID
         zone_id = id_registry.generate_id("Z", name, context="", source_format="CIBD22")
@@ -307,7 +405,7 @@ def _parse_zones(parser, em: Dict[str, Any], id_registry: IDRegistry,
         
         if thrml_zn_ref and thrml_zn_ref in thrml_zn_by_name:
             tz = thrml_zn_by_name[thrml_zn_ref]
-            tz_props = tz.get("_properties", {})
+            tz_props = tz["_properties"]
             zone_type = tz_props.get("Type", "Conditioned")
             
             # Extract HVAC system references
@@ -320,15 +418,15 @@ def _parse_zones(parser, em: Dict[str, Any], id_registry: IDRegistry,
         
         # Parse volume (ft³ to m³)
         volume_ft3 = _to_float(props.get("Vol")) if props.get("Vol") else None
-        volume_m3 = volume_ft3 * 0.0283168 if volume_ft3 and volume_ft3 > 0 else None
+        volume_m3 = volume_ft3 * FT3_TO_M3 if volume_ft3 and volume_ft3 > 0 else None
         
         # Parse DwellUnit reference (for multifamily projects)
         du_ref = None
         du_count = 1
-        children = zn.get("_children", [])
+        children = zn["_children"]
         for child in children:
             if child.get("_type") == "DwellUnit":
-                child_props = child.get("_properties", {})
+                child_props = child["_properties"]
                 du_type_ref = child_props.get("DwellUnitTypeRef")
                 if du_type_ref and du_type_ref in du_name_to_id:
                     du_ref = du_name_to_id[du_type_ref]
@@ -345,12 +443,11 @@ def _parse_zones(parser, em: Dict[str, Any], id_registry: IDRegistry,
         area_source = "geometry_derived"
         
         # Fallback to DU type floor area if available
-        if du_ref and du_ref in du_id_to_data:
-            du_data = du_id_to_data[du_ref]
-            if du_data.get("floor_area_m2"):
-                floor_area_m2 = du_data["floor_area_m2"]
-                area_source = "du_type_reference"
-                zones_with_du_fallback += 1
+        du_floor_area = du_floor_area_by_id.get(du_ref) if du_ref else None
+        if du_floor_area:
+            floor_area_m2 = du_floor_area
+            area_source = "du_type_reference"
+            zones_with_du_fallback += 1
         
         # Parse number of stories if present
         num_stories = int(_to_float(props.get("NumStories"))) if props.get("NumStories") else None
@@ -371,15 +468,13 @@ def _parse_zones(parser, em: Dict[str, Any], id_registry: IDRegistry,
             "served_by": [],
             "surfaces": [],
             "annotation": {
-                "source_format": "CIBD22",
-                "source_name": name,
-                "source_area_units": "ft2",
-                "source_height_units": "ft",
+                **_ZONE_ANNOT_BASE,
+                "source_name": sys.intern(name),
                 "floor_area_source": area_source,
             }
         }
         
-        zone_list.append(item)
+        zone_list.append(_compact(item))
     
     em["geometry"]["zones"] = zone_list
     
@@ -397,95 +492,91 @@ def _parse_zones(parser, em: Dict[str, Any], id_registry: IDRegistry,
     return zone_name_to_id
 
 
-def _parse_surfaces(parser, em: Dict[str, Any], id_registry: IDRegistry,
-                   zone_name_to_id: Dict[str, str], cons_name_to_id: Dict[str, str]) -> None:
-    """Parse ResExtWall, Roof, ResSlabFlr objects with robust heuristic resolution."""
+def _parse_surfaces(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry,
+                   zone_name_to_id: Dict[str, str], cons_name_to_id: Dict[str, str]) -> Dict[str, str]:
+    """
+    Parse ResExtWall, Roof, ResSlabFlr objects with robust heuristic resolution.
+    
+    Returns:
+        Mapping of surface source names to surface IDs, in bucket order
+    """
     from emtools.parsers.cibd22_name_resolver import CIBD22NameResolver
     
-    resolver = CIBD22NameResolver(em["diagnostics"])
+    resolver = CIBD22NameResolver(em["diagnostics"], zone_name_to_id=zone_name_to_id)
     surfaces = {
         "walls": [],
         "roofs": [],
         "floors": []
     }
-    
-    # Map object types to surface buckets
-    type_to_bucket = {
-        "ResExtWall": "walls",
-        "ResIntWall": "walls",  # Interior walls
-        "ComIntWall": "walls",  # Commercial interior walls
-        "Roof": "roofs",
-        "ResSlabFlr": "floors",
-        "ResExtFlr": "floors",
-        "ResFlrSeg": "floors",  # Floor segments
-        "ComFlrSeg": "floors",  # Commercial floor segments
-        "ResCeilg": "roofs",    # Interior ceilings (treated as roofs)
-        "ComCeilg": "roofs"     # Commercial ceilings
-    }
-    
-    # Identify interior surface types (have adjacency)
-    interior_types = {"ResIntWall", "ComIntWall", "ResIntFlr", "ResFlrSeg", "ComFlrSeg", "ResCeilg", "ComCeilg"}
+    names_by_bucket = {bucket: {} for bucket in surfaces}
     
     low_confidence_count = 0
     adjacency_resolved_count = 0
     
-    for obj_type, bucket in type_to_bucket.items():
-        surf_objs = parser.find_objects(obj_type=obj_type)
+    # Single walk of the object tree, grouped by type to keep per-type ordering
+    surf_objs_by_type = {obj_type: [] for obj_type in _SURFACE_TYPE_TO_BUCKET}
+    for obj, obj_type in parser.find_objects_multi(_SURFACE_TYPE_TO_BUCKET.keys()):
+        surf_objs_by_type[obj_type].append(obj)
+    
+    # Bind hot-loop globals to locals
+    to_f = _to_float
+    ft2_to_m2 = FT2_TO_M2
+    low_confidence_diags = []
+    unknown_adjacency_diags = []
+    resolve_zone = resolver.resolve_zone_from_name
+    generate_id = id_registry.generate_id_fast
+    
+    for obj_type, bucket in _SURFACE_TYPE_TO_BUCKET.items():
+        surf_objs = surf_objs_by_type[obj_type]
+        bucket_list = surfaces[bucket]
+        bucket_names = names_by_bucket[bucket]
+        is_interior = obj_type in _INTERIOR_SURFACE_TYPES
         
         for surf in surf_objs:
             name = surf.get("_name", "Surface")
-            props = surf.get("_properties", {})
+            props = surf["_properties"]
+            props_get = props.get
             
             # Use explicit resolver with confidence tracking
-            result = resolver.resolve_zone_from_name(name, zone_name_to_id)
+            result = resolve_zone(name)
             zone_id = result.resolved_id
             
             # Track low confidence resolutions
             if result.confidence < 0.8:
                 low_confidence_count += 1
                 if result.confidence < 0.5:
-                    em["diagnostics"].append({
-                        "level": "warning",
-                        "code": "W-SURF-RESOLUTION-LOW-CONFIDENCE",
-                        "message": f"Low confidence zone resolution for surface: {name}",
-                        "context": {
-                            "surface_name": name,
-                            "confidence": result.confidence,
-                            "strategy": result.strategy_used,
-                            "warnings": result.warnings
-                        }
+                    low_confidence_diags.append({
+                        "surface_name": name,
+                        "confidence": result.confidence,
+                        "strategy": result.strategy_used,
+                        "warnings": result.warnings
                     })
             
             # Generate stable ID
-            surf_id = id_registry.generate_id("S", name, context=zone_id or "", source_format="CIBD22")
+            surf_id = generate_id("S", name, zone_id or "", "CIBD22")
             
             # Convert area from ft² to m²
-            area_ft2 = _to_float(props.get("Area"))
-            area_m2 = area_ft2 * 0.092903 if area_ft2 > 0 else None
+            area_ft2 = to_f(props_get("Area"))
+            area_m2 = area_ft2 * ft2_to_m2 if area_ft2 > 0 else None
             
             # Resolve construction reference
-            cons_ref = props.get("Construction")
+            cons_ref = props_get("Construction")
             cons_id = cons_name_to_id.get(cons_ref) if cons_ref else None
             
             # Parse adjacent zone for interior surfaces
             adjacent_zone_id = None
-            if obj_type in interior_types:
-                outside_ref = props.get("Outside")
+            outside_ref = props_get("Outside") if is_interior else None
+            if is_interior:
                 if outside_ref:
                     # Outside can be zone name or special values like "Ambient", "Ground"
                     if outside_ref in zone_name_to_id:
                         adjacent_zone_id = zone_name_to_id[outside_ref]
                         adjacency_resolved_count += 1
-                    elif outside_ref not in ["Ambient", "Ground", "Adiabatic"]:
+                    elif outside_ref not in _SPECIAL_ADJACENCIES:
                         # Unknown zone reference
-                        em["diagnostics"].append({
-                            "level": "warning",
-                            "code": "W-SURF-ADJACENCY-UNKNOWN",
-                            "message": f"Interior surface references unknown adjacent zone: {outside_ref}",
-                            "context": {
-                                "surface_name": name,
-                                "outside_ref": outside_ref
-                            }
+                        unknown_adjacency_diags.append({
+                            "surface_name": name,
+                            "outside_ref": outside_ref
                         })
             
             item = {
@@ -494,14 +585,14 @@ def _parse_surfaces(parser, em: Dict[str, Any], id_registry: IDRegistry,
                 "area_m2": area_m2,
                 "construction_ref": cons_id,
                 "adjacent_zone_id": adjacent_zone_id,
-                "surface_type": "interior" if obj_type in interior_types else "exterior",
+                "surface_type": "interior" if is_interior else "exterior",
                 "openings": [],  # Populated by _parse_openings
                 "annotation": {
-                    "source_format": "CIBD22",
-                    "source_name": name,
+                    **_ANNOT_BASE,
+                    "source_name": sys.intern(name),
                     "source_area_units": "ft2" if area_ft2 else None,
-                    "orientation": props.get("Orientation"),
-                    "outside_ref": props.get("Outside") if obj_type in interior_types else None,
+                    "orientation": props_get("Orientation"),
+                    "outside_ref": outside_ref,
                     "zone_resolution": {
                         "confidence": result.confidence,
                         "strategy": result.strategy_used
@@ -509,10 +600,25 @@ def _parse_surfaces(parser, em: Dict[str, Any], id_registry: IDRegistry,
                 }
             }
             
-            surfaces[bucket].append(item)
+            bucket_list.append(_compact(item))
+            bucket_names[name] = surf_id
     
     em["geometry"]["surfaces"] = surfaces
     
+    _flush_diag_batch(em["diagnostics"], "warning", "W-SURF-RESOLUTION-LOW-CONFIDENCE",
+                      low_confidence_diags,
+                      "Low confidence zone resolution for surface: {surface_name}",
+                      "Low confidence zone resolution for surfaces")
+    _flush_diag_batch(em["diagnostics"], "warning", "W-SURF-ADJACENCY-UNKNOWN",
+                      unknown_adjacency_diags,
+                      "Interior surface references unknown adjacent zone: {outside_ref}",
+                      "Interior surfaces reference unknown adjacent zones")
+    
+    # Flatten per-bucket name maps in bucket order for opening resolution
+    surf_name_to_id = {}
+    for bucket_names in names_by_bucket.values():
+        surf_name_to_id.update(bucket_names)
+    
     total_surfs = sum(len(v) for v in surfaces.values())
     if total_surfs > 0:
         em["diagnostics"].append({
@@ -524,47 +630,52 @@ def _parse_surfaces(parser, em: Dict[str, Any], id_registry: IDRegistry,
                 "adjacency_resolved_count": adjacency_resolved_count
             }
         })
+    
+    return surf_name_to_id
 
 
-def _parse_openings(parser, em: Dict[str, Any], id_registry: IDRegistry,
-                   wt_name_to_id: Dict[str, str]) -> None:
+def _parse_openings(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry,
+                   wt_name_to_id: Dict[str, str], surf_name_to_id: Dict[str, str]) -> None:
     """Parse ResWin, Door, Skylight objects with robust heuristic resolution."""
     from emtools.parsers.cibd22_name_resolver import CIBD22NameResolver
     
-    resolver = CIBD22NameResolver(em["diagnostics"])
     openings = {
         "windows": [],
         "doors": [],
         "skylights": []
     }
     
-    type_to_bucket = {
-        "ResWin": "windows",
-        "Door": "doors",
-        "ResDoor": "doors",  # Residential doors
-        "Skylight": "skylights"
-    }
-    
-    # Build surface lookup by name for parent resolution
-    surf_name_to_id = {}
-    for bucket, surfs in em["geometry"]["surfaces"].items():
-        for surf in surfs:
-            src_name = surf.get("annotation", {}).get("source_name")
-            if src_name:
-                surf_name_to_id[src_name] = surf["id"]
+    resolver = CIBD22NameResolver(em["diagnostics"], surfaces_by_name=surf_name_to_id)
     
     low_confidence_count = 0
     orphan_count = 0
-    
-    for obj_type, bucket in type_to_bucket.items():
-        opening_objs = parser.find_objects(obj_type=obj_type)
+    opening_ids_by_parent = defaultdict(list)
+    
+    # Single walk of the object tree, grouped by type to keep per-type ordering
+    opening_objs_by_type = {obj_type: [] for obj_type in _OPENING_TYPE_TO_BUCKET}
+    for obj, obj_type in parser.find_objects_multi(_OPENING_TYPE_TO_BUCKET.keys()):
+        opening_objs_by_type[obj_type].append(obj)
+    
+    # Bind hot-loop globals to locals
+    to_f = _to_float
+    ft_to_m = FT_TO_M
+    ft2_to_m2 = FT2_TO_M2
+    no_parent_diags = []
+    resolve_surface = resolver.resolve_surface_from_opening
+    generate_id = id_registry.generate_id_fast
+    
+    for obj_type, bucket in _OPENING_TYPE_TO_BUCKET.items():
+        opening_objs = opening_objs_by_type[obj_type]
+        bucket_list = openings[bucket]
+        is_window = bucket == "windows"
         
         for opening in opening_objs:
             name = opening.get("_name", "Opening")
-            props = opening.get("_properties", {})
+            props = opening["_properties"]
+            props_get = props.get
             
             # Use explicit resolver with confidence tracking
-            result = resolver.resolve_surface_from_opening(name, surf_name_to_id)
+            result = resolve_surface(name)
             parent_surf_id = result.resolved_id
             
             # Track resolution quality
@@ -572,32 +683,26 @@ def _parse_openings(parser, em: Dict[str, Any], id_registry: IDRegistry,
                 low_confidence_count += 1
             if parent_surf_id is None:
                 orphan_count += 1
-                em["diagnostics"].append({
-                    "level": "warning",
-                    "code": "W-OPENING-NO-PARENT",
-                    "message": f"Opening has no parent surface: {name}",
-                    "context": {
-                        "opening_name": name,
-                        "warnings": result.warnings
-                    }
+                no_parent_diags.append({
+                    "opening_name": name,
+                    "warnings": result.warnings
                 })
             
             # Generate stable ID
-            opening_id = id_registry.generate_id("O", name, context=parent_surf_id or "", 
-                                                 source_format="CIBD22")
+            opening_id = generate_id("O", name, parent_surf_id or "", "CIBD22")
             
             # Convert dimensions from ft to m, area from ft² to m²
-            area_ft2 = _to_float(props.get("Area"))
-            area_m2 = area_ft2 * 0.092903 if area_ft2 > 0 else None
+            area_ft2 = to_f(props_get("Area"))
+            area_m2 = area_ft2 * ft2_to_m2 if area_ft2 > 0 else None
             
-            height_ft = _to_float(props.get("Height"))
-            height_m = height_ft * 0.3048 if height_ft > 0 else None
+            height_ft = to_f(props_get("Height"))
+            height_m = height_ft * ft_to_m if height_ft > 0 else None
             
-            width_ft = _to_float(props.get("Width"))
-            width_m = width_ft * 0.3048 if width_ft > 0 else None
+            width_ft = to_f(props_get("Width"))
+            width_m = width_ft * ft_to_m if width_ft > 0 else None
             
             # Resolve window type reference
-            wt_ref = props.get("WinType")
+            wt_ref = props_get("WinType")
             wt_id = wt_name_to_id.get(wt_ref) if wt_ref else None
             
             item = {
@@ -606,10 +711,10 @@ def _parse_openings(parser, em: Dict[str, Any], id_registry: IDRegistry,
                 "area_m2": area_m2,
                 "height_m": height_m,
                 "width_m": width_m,
-                "window_type_ref": wt_id if bucket == "windows" else None,
+                "window_type_ref": wt_id if is_window else None,
                 "annotation": {
-                    "source_format": "CIBD22",
-                    "source_name": name,
+                    **_ANNOT_BASE,
+                    "source_name": sys.intern(name),
                     "source_area_units": "ft2" if area_ft2 else None,
                     "surface_resolution": {
                         "confidence": result.confidence,
@@ -618,17 +723,30 @@ def _parse_openings(parser, em: Dict[str, Any], id_registry: IDRegistry,
                 }
             }
             
-            openings[bucket].append(item)
+            bucket_list.append(_compact(item))
             
-            # Add to parent surface's openings list
+            # Defer linking to the parent surface so each surface is extended once
             if parent_surf_id:
-                for surfs in em["geometry"]["surfaces"].values():
-                    for surf in surfs:
-                        if surf["id"] == parent_surf_id:
-                            surf["openings"].append(opening_id)
+                opening_ids_by_parent[parent_surf_id].append(opening_id)
+    
+    # Attach openings to parent surfaces in one batch per surface
+    surf_by_id = {
+        surf["id"]: surf
+        for surfs in em["geometry"]["surfaces"].values()
+        for surf in surfs
+    }
+    for parent_surf_id, opening_ids in opening_ids_by_parent.items():
+        surf = surf_by_id.get(parent_surf_id)
+        if surf is not None:
+            surf["openings"].extend(opening_ids)
     
     em["geometry"]["openings"] = openings
     
+    _flush_diag_batch(em["diagnostics"], "warning", "W-OPENING-NO-PARENT",
+                      no_parent_diags,
+                      "Opening has no parent surface: {opening_name}",
+                      "Openings have no parent surface")
+    
     total_openings = sum(len(v) for v in openings.values())
     if total_openings > 0:
         em["diagnostics"].append({
@@ -642,89 +760,103 @@ def _parse_openings(parser, em: Dict[str, Any], id_registry: IDRegistry,
         })
 
 
-def _parse_hvac_systems(parser, em: Dict[str, Any], id_registry: IDRegistry) -> None:
-    """Parse ResHVACSys objects (basic implementation)."""
-    hvac_objs = parser.find_objects(obj_type="ResHVACSys")
-    hvac_list = []
-    
-    for hvac in hvac_objs:
-        name = hvac.get("_name", "HVAC")
-        props = hvac.get("_properties", {})
-        
-        # Generate stable ID
-        hvac_id = id_registry.generate_id("HVAC", name, context="", source_format="CIBD22")
-        
-        item = {
-            "id": hvac_id,
-            "name": name,
-            "type": props.get("Type", "unknown"),
-            "fuel": props.get("FuelType"),
-            "efficiency": _to_float(props.get("HSPF")) if props.get("HSPF") else None,
-            "capacity_btu_h": _to_float(props.get("CapRtd")),
-            "zone_refs": [],  # Would need zone linking logic
-            "annotation": {
-                "source_format": "CIBD22",
-                "source_name": name,
-            }
-        }
-        
-        hvac_list.append(item)
-    
-    em["systems"]["hvac"] = hvac_list
+def _float_or_none(val: Any) -> Any:
+    """Float conversion that keeps missing/empty values as None."""
+    return _to_float(val) if val else None
+
+
+def _or_unknown(val: Any) -> Any:
+    """Default a missing system type to "unknown"."""
+    return "unknown" if val is None else val
+
+
+# Simple (one object → one item) system parsers. Each field is
+# (output key, CIBD22 property, converter or None for the raw value).
+_SYSTEM_SPECS = (
+    {
+        "obj_type": "ResHVACSys",
+        "prefix": "HVAC",
+        "target_key": "hvac",
+        "label": "HVAC",
+        "fields": (
+            ("type", "Type", _or_unknown),
+            ("fuel", "FuelType", None),
+            ("efficiency", "HSPF", _float_or_none),
+            ("capacity_btu_h", "CapRtd", _to_float),
+        ),
+        "list_fields": ("zone_refs",),  # Would need zone linking logic
+    },
+    {
+        "obj_type": "ResWtrHtr",
+        "prefix": "DHW",
+        "target_key": "dhw",
+        "label": "DHW",
+        "fields": (
+            ("type", "Type", _or_unknown),
+            ("fuel", "FuelType", None),
+            ("energy_factor", "EnergyFactor", _to_float),
+            ("capacity_gal", "TankVol", _to_float),
+        ),
+        "list_fields": (),
+    },
+)
+
+
+def _parse_simple_system(parser: CIBD22TextParser, em: Dict[str, Any], id_registry: IDRegistry,
+                         spec: Dict[str, Any]) -> None:
+    """
+    Parse one system object type into em["systems"] (basic implementation).
     
-    if hvac_list:
-        em["diagnostics"].append({
-            "level": "info",
-            "code": "I-HVAC-PARSED",
-            "message": f"Parsed {len(hvac_list)} HVAC systems (basic)",
-            "context": {"hvac_count": len(hvac_list)}
-        })
-
-
-def _parse_dhw_systems(parser, em: Dict[str, Any], id_registry: IDRegistry) -> None:
-    """Parse ResWtrHtr objects (basic implementation)."""
-    dhw_objs = parser.find_objects(obj_type="ResWtrHtr")
-    dhw_list = []
+    Args:
+        parser: Loaded CIBD22TextParser
+        em: EMJSON v6 document being built
+        id_registry: Registry for stable IDs
+        spec: Entry from _SYSTEM_SPECS describing the object type and fields
+    """
+    prefix = spec["prefix"]
+    fields = spec["fields"]
+    list_fields = spec["list_fields"]
+    sys_list = []
     
-    for dhw in dhw_objs:
-        name = dhw.get("_name", "DHW")
-        props = dhw.get("_properties", {})
+    for obj in parser.find_objects(obj_type=spec["obj_type"]):
+        name = obj.get("_name", prefix)
+        props = obj["_properties"]
         
         # Generate stable ID
-        dhw_id = id_registry.generate_id("DHW", name, context="", source_format="CIBD22")
-        
-        item = {
-            "id": dhw_id,
-            "name": name,
-            "type": props.get("Type", "unknown"),
-            "fuel": props.get("FuelType"),
-            "energy_factor": _to_float(props.get("EnergyFactor")),
-            "capacity_gal": _to_float(props.get("TankVol")),
-            "annotation": {
-                "source_format": "CIBD22",
-                "source_name": name,
-            }
+        sys_id = id_registry.generate_id(prefix, name, context="", source_format="CIBD22")
+        
+        item = {"id": sys_id, "name": name}
+        for out_key, prop_key, convert in fields:
+            val = props.get(prop_key)
+            item[out_key] = convert(val) if convert else val
+        for out_key in list_fields:
+            item[out_key] = []
+        item["annotation"] = {
+            "source_format": "CIBD22",
+            "source_name": name,
         }
         
-        dhw_list.append(item)
+        sys_list.append(_compact(item))
     
-    em["systems"]["dhw"] = dhw_list
+    target_key = spec["target_key"]
+    em["systems"][target_key] = sys_list
     
-    if dhw_list:
+    if sys_list:
         em["diagnostics"].append({
             "level": "info",
-            "code": "I-DHW-PARSED",
-            "message": f"Parsed {len(dhw_list)} DHW systems (basic)",
-            "context": {"dhw_count": len(dhw_list)}
+            "code": f"I-{prefix}-PARSED",
+            "message": f"Parsed {len(sys_list)} {spec['label']} systems (basic)",
+            "context": {f"{target_key}_count": len(sys_list)}
         })
 
 
-def translate_cibd22_to_v6(file_path: str) -> Dict[str, Any]:
+def translate_cibd22_to_v6(file_path: str, include_id_registry: bool = False) -> Dict[str, Any]:
     """
     Translate CIBD22 text format to EMJSON v6.
     
     Args:
         file_path: Path to CIBD22 file
+        include_id_registry: Export the ID registry into _metadata["id_registry"]
         
     Returns:
         EMJSON v6 dictionary with full schema compliance
@@ -789,34 +921,39 @@ def translate_cibd22_to_v6(file_path: str) -> Dict[str, Any]:
     mat_name_to_id = _parse_materials(parser, em, id_registry)
     
     zone_name_to_id = _parse_zones(parser, em, id_registry, du_name_to_id)
-    _parse_surfaces(parser, em, id_registry, zone_name_to_id, cons_name_to_id)
-    _parse_openings(parser, em, id_registry, wt_name_to_id)
+    surf_name_to_id = _parse_surfaces(parser, em, id_registry, zone_name_to_id, cons_name_to_id)
+    _parse_openings(parser, em, id_registry, wt_name_to_id, surf_name_to_id)
     
     # Parse systems
-    _parse_hvac_systems(parser, em, id_registry)
-    _parse_dhw_systems(parser, em, id_registry)
+    for spec in _SYSTEM_SPECS:
+        _parse_simple_system(parser, em, id_registry, spec)
     
-    # Store ID registry in metadata
+    # Store translation metadata; the ID registry only when requested
     em["_metadata"] = {
-        "id_registry": id_registry.export_registry(),
         "translator_version": VERSION,
         "source_format": "CIBD22",
         "source_file": file_path
     }
+    if include_id_registry:
+        em["_metadata"]["id_registry"] = id_registry.export_registry()
     
     # Summary diagnostic
+    geometry = em['geometry']
+    n_zones = len(geometry['zones'])
+    n_surfaces = sum(map(len, geometry['surfaces'].values()))
+    n_openings = sum(map(len, geometry['openings'].values()))
     materials_count = len(em['catalogs'].get('materials', []))
     em["diagnostics"].append({
         "level": "info",
         "code": "I-TRANSLATION-COMPLETE",
-        "message": f"Translation complete: {len(em['geometry']['zones'])} zones, "
-                   f"{sum(len(v) for v in em['geometry']['surfaces'].values())} surfaces, "
-                   f"{sum(len(v) for v in em['geometry']['openings'].values())} openings, "
+        "message": f"Translation complete: {n_zones} zones, "
+                   f"{n_surfaces} surfaces, "
+                   f"{n_openings} openings, "
                    f"{materials_count} materials",
         "context": {
-            "zones": len(em['geometry']['zones']),
-            "surfaces": sum(len(v) for v in em['geometry']['surfaces'].values()),
-            "openings": sum(len(v) for v in em['geometry']['openings'].values()),
+            "zones": n_zones,
+            "surfaces": n_surfaces,
+            "openings": n_openings,
             "materials": materials_count
         }
     })
@@ -824,9 +961,9 @@ def translate_cibd22_to_v6(file_path: str) -> Dict[str, Any]:
     return em
 
 
-def main(argv=None):
+def main(argv: Optional[List[str]] = None) -> int:
     """Command-line interface for translator."""
-    import json
+    from emtools.utils.json_io import write_json
     
     argv = argv or sys.argv[1:]
     if not argv:
@@ -836,13 +973,13 @@ def main(argv=None):
     out = argv[1] if len(argv) > 1 else argv[0].rsplit('.', 1)[0] + ".emjson"
     em = translate_cibd22_to_v6(argv[0])
     
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump(em, f, indent=2)
+    write_json(em, out)
     
+    geometry = em['geometry']
     print(f"✓ Wrote {out}")
-    print(f"  - {len(em['geometry']['zones'])} zones")
-    print(f"  - {sum(len(v) for v in em['geometry']['surfaces'].values())} surfaces")
-    print(f"  - {sum(len(v) for v in em['geometry']['openings'].values())} openings")
+    print(f"  - {len(geometry['zones'])} zones")
+    print(f"  - {sum(map(len, geometry['surfaces'].values()))} surfaces")
+    print(f"  - {sum(map(len, geometry['openings'].values()))} openings")
     print(f"  - {len(em['diagnostics'])} diagnostics")
     return 0
 
@@ -12,12 +12,13 @@ Main orchestrator that coordinates modular parsers for:
 
 from __future__ import annotations
 from typing import Dict, Any
-from xml.etree import ElementTree as ET
-import json
 import sys
 
 # Fixed imports - use emtools package
 from emtools.utils.id_registry import IDRegistry
+from emtools.utils.json_io import write_json
+from emtools.utils.xml_backend import iterparse_indexed
+from emtools.parsers.constants import CATALOG_TAGS, SYSTEM_TAGS, ZONE_TAGS
 from emtools.parsers.zones import parse_zones, parse_surfaces, parse_openings
 from emtools.parsers.systems import parse_dhw
 from emtools.parsers.catalogs import (
@@ -28,13 +29,17 @@ from emtools.parsers.hvac import parse_hvac
 
 VERSION = "6.0"
 
+# Result/report sections that no parser reads; dropped while the tree is built
+_UNPARSED_SECTIONS = frozenset({"EUseSummary"})
+
 
 def translate_cibd22x_to_v6(xml_path: str) -> Dict[str, Any]:
     """
     Translate CIBD22X XML to EMJSON v6.
 
     Args:
-        xml_path: Path to CIBD22X XML file
+        xml_path: Path to CIBD22X XML file, or a binary file object such as
+            io.BytesIO(write_xml_bytes(em)) for in-memory round trips
 
     Returns:
         EMJSON v6 dictionary with full schema compliance
@@ -43,7 +48,13 @@ def translate_cibd22x_to_v6(xml_path: str) -> Dict[str, Any]:
         >>> emjson = translate_cibd22x_to_v6("project.xml")
         >>> print(f"Zones: {len(emjson['geometry']['zones'])}")
     """
-    root = ET.parse(xml_path).getroot()
+    # One parsing pass builds the tree and indexes the catalog/zone/system elements.
+    # Every parser below reads through the index, so elements outside the indexed
+    # subtrees are discarded as they are parsed.
+    root, index = iterparse_indexed(
+        xml_path, CATALOG_TAGS + ZONE_TAGS + SYSTEM_TAGS,
+        skip_tags=_UNPARSED_SECTIONS, prune_unindexed=True
+    )
 
     # Initialize EMJSON v6 structure
     em: Dict[str, Any] = {
@@ -91,43 +102,49 @@ def translate_cibd22x_to_v6(xml_path: str) -> Dict[str, Any]:
     id_registry = IDRegistry()
 
     # Parse catalogs first (they may be referenced by geometry/systems)
-    parse_location(root, em)
-    parse_du_types(root, em, id_registry)
-    parse_window_types(root, em, id_registry)
-    parse_construction_types(root, em, id_registry)
-    parse_pv(root, em, id_registry)
+    parse_location(root, em, index=index)
+    parse_du_types(root, em, id_registry, index=index)
+    parse_window_types(root, em, id_registry, index=index)
+    parse_construction_types(root, em, id_registry, index=index)
+    parse_pv(root, em, id_registry, index=index)
 
     # Build DU index for zone parsing
     du_index = {dt["name"].lower(): dt for dt in em["catalogs"]["du_types"]}
 
     # Parse geometry with ID registry
-    parse_zones(root, em, id_registry, du_index=du_index)
-    parse_surfaces(root, em, id_registry)
-    parse_openings(root, em, id_registry)
+    zone_nodes = index.iter_document_order(*ZONE_TAGS)
+    parse_zones(root, em, id_registry, du_index=du_index, zone_nodes=zone_nodes)
+    parse_surfaces(root, em, id_registry, zone_nodes=zone_nodes)
+    parse_openings(root, em, id_registry, zone_nodes=zone_nodes)
 
     # Parse systems
-    parse_hvac(root, em, id_registry)
-    parse_dhw(root, em, id_registry)
+    parse_hvac(root, em, id_registry, index=index)
+    parse_dhw(root, em, id_registry, index=index)
 
     # Store ID registry in metadata
     em["_metadata"] = {
         "id_registry": id_registry.export_registry(),
         "translator_version": VERSION,
         "source_format": "CIBD22X",
-        "source_file": xml_path
+        # File objects (e.g. in-memory round trips) are recorded by name, if any
+        "source_file": getattr(xml_path, "name", None) if hasattr(xml_path, "read") else xml_path
     }
 
     # Summary diagnostic
+    geometry = em['geometry']
+    n_zones = len(geometry['zones'])
+    n_surfaces = sum(map(len, geometry['surfaces'].values()))
+    n_openings = sum(map(len, geometry['openings'].values()))
     em["diagnostics"].append({
         "level": "info",
         "code": "I-TRANSLATION-COMPLETE",
-        "message": f"Translation complete: {len(em['geometry']['zones'])} zones, "
-                   f"{len(em['geometry']['surfaces']['walls'])} walls, "
-                   f"{len(em['geometry']['openings']['windows'])} windows",
+        "message": f"Translation complete: {n_zones} zones, "
+                   f"{len(geometry['surfaces']['walls'])} walls, "
+                   f"{len(geometry['openings']['windows'])} windows",
         "context": {
-            "zones": len(em['geometry']['zones']),
-            "surfaces": sum(len(v) for v in em['geometry']['surfaces'].values()),
-            "openings": sum(len(v) for v in em['geometry']['openings'].values()),
+            "zones": n_zones,
+            "surfaces": n_surfaces,
+            "openings": n_openings,
             "hvac_systems": len(em['systems']['hvac']),
             "dhw_systems": len(em['systems']['dhw'])
         }
@@ -146,13 +163,13 @@ def main(argv=None):
     out = argv[1] if len(argv) > 1 else argv[0].rsplit('.', 1)[0] + ".emjson"
     em = translate_cibd22x_to_v6(argv[0])
 
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump(em, f, indent=2)
+    write_json(em, out)
 
+    geometry = em['geometry']
     print(f"✓ Wrote {out}")
-    print(f"  - {len(em['geometry']['zones'])} zones")
-    print(f"  - {sum(len(v) for v in em['geometry']['surfaces'].values())} surfaces")
-    print(f"  - {sum(len(v) for v in em['geometry']['openings'].values())} openings")
+    print(f"  - {len(geometry['zones'])} zones")
+    print(f"  - {sum(map(len, geometry['surfaces'].values()))} surfaces")
+    print(f"  - {sum(map(len, geometry['openings'].values()))} openings")
     print(f"  - {len(em['diagnostics'])} diagnostics")
     return 0
 
@@ -785,18 +785,22 @@ def translate_cibd25_to_v6(file_path: str) -> Dict[str, Any]:
     }
     
     # Summary diagnostic
+    geometry = em['geometry']
+    n_zones = len(geometry['zones'])
+    n_surfaces = sum(map(len, geometry['surfaces'].values()))
+    n_openings = sum(map(len, geometry['openings'].values()))
     materials_count = len(em['catalogs'].get('materials', []))
     em["diagnostics"].append({
         "level": "info",
         "code": "I-TRANSLATION-COMPLETE",
-        "message": f"Translation complete: {len(em['geometry']['zones'])} zones, "
-                   f"{sum(len(v) for v in em['geometry']['surfaces'].values())} surfaces, "
-                   f"{sum(len(v) for v in em['geometry']['openings'].values())} openings, "
+        "message": f"Translation complete: {n_zones} zones, "
+                   f"{n_surfaces} surfaces, "
+                   f"{n_openings} openings, "
                    f"{materials_count} materials",
         "context": {
-            "zones": len(em['geometry']['zones']),
-            "surfaces": sum(len(v) for v in em['geometry']['surfaces'].values()),
-            "openings": sum(len(v) for v in em['geometry']['openings'].values()),
+            "zones": n_zones,
+            "surfaces": n_surfaces,
+            "openings": n_openings,
             "materials": materials_count
         }
     })
@@ -806,7 +810,7 @@ def translate_cibd25_to_v6(file_path: str) -> Dict[str, Any]:
 
 def main(argv=None):
     """Command-line interface for translator."""
-    import json
+    from emtools.utils.json_io import write_json
     
     argv = argv or sys.argv[1:]
     if not argv:
@@ -816,8 +820,7 @@ def main(argv=None):
     out = argv[1] if len(argv) > 1 else argv[0].rsplit('.', 1)[0] + ".emjson"
     em = translate_cibd25_to_v6(argv[0])
     
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump(em, f, indent=2)
+    write_json(em, out)
     
     print(f"✓ Wrote {out}")
     print(f"  - {len(em['geometry']['zones'])} zones")
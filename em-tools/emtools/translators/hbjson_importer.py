@@ -17,20 +17,47 @@ Key conversions:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple, Optional
-import json
+from typing import Dict, Any, List, NamedTuple, Tuple, Optional
+from types import MappingProxyType
 import sys
 import math
 
 from emtools.utils.id_registry import IDRegistry
+from emtools.utils.json_io import load_json, write_json
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 VERSION = "6.0"
 
+# Below this vertex count the pure-Python Newell sum is faster than NumPy
+_NUMPY_MIN_VERTICES = 32
+# Below this polygon count a batched NumPy area pass is not worth the padding
+_NUMPY_MIN_BATCH = 64
+# Honeybee face_type -> EMJSON surface bucket
+_FACE_TYPE_TO_BUCKET = MappingProxyType({
+    "Wall": "walls",
+    "RoofCeiling": "roofs",
+    "Roof": "roofs",
+    "Floor": "floors",
+})
+
+
+class FaceData(NamedTuple):
+    """Per-face data for aperture processing, as parallel lists in face order."""
+    surface_ids: List[str]
+    apertures: List[List[Dict[str, Any]]]
+
 
 def calculate_polygon_area_3d(vertices: List[List[float]]) -> float:
     """
     Calculate area of 3D polygon from vertices using Newell's method.
     
+    Polygons with many vertices are summed with NumPy when it is installed;
+    smaller ones stay in pure Python, where NumPy's per-call overhead dominates.
+    
     Args:
         vertices: List of [x, y, z] coordinates
         
@@ -40,169 +67,252 @@ def calculate_polygon_area_3d(vertices: List[List[float]]) -> float:
     Reference:
         Newell's method for non-planar polygons
     """
-    if len(vertices) < 3:
+    n = len(vertices)
+    if n < 3:
         return 0.0
     
-    # Calculate normal vector using Newell's method
-    normal = [0.0, 0.0, 0.0]
-    n = len(vertices)
+    # Triangles and quads (most Honeybee apertures): the Newell normal is
+    # the cross product of the diagonals, so skip the loop
+    if n == 4:
+        (x0, y0, z0), (x1, y1, z1), (x2, y2, z2), (x3, y3, z3) = vertices
+        ax, ay, az = x2 - x0, y2 - y0, z2 - z0
+        bx, by, bz = x3 - x1, y3 - y1, z3 - z1
+        cx, cy, cz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+        return math.sqrt(cx * cx + cy * cy + cz * cz) / 2.0
+    if n == 3:
+        (x0, y0, z0), (x1, y1, z1), (x2, y2, z2) = vertices
+        ax, ay, az = x1 - x0, y1 - y0, z1 - z0
+        bx, by, bz = x2 - x0, y2 - y0, z2 - z0
+        cx, cy, cz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+        return math.sqrt(cx * cx + cy * cy + cz * cz) / 2.0
+    
+    if np is not None and n >= _NUMPY_MIN_VERTICES:
+        v = np.asarray(vertices, dtype=np.float64)
+        v2 = np.roll(v, -1, axis=0)
+        nx = float(((v[:, 1] - v2[:, 1]) * (v[:, 2] + v2[:, 2])).sum())
+        ny = float(((v[:, 2] - v2[:, 2]) * (v[:, 0] + v2[:, 0])).sum())
+        nz = float(((v[:, 0] - v2[:, 0]) * (v[:, 1] + v2[:, 1])).sum())
+        return math.sqrt(nx * nx + ny * ny + nz * nz) / 2.0
     
-    for i in range(n):
-        v1 = vertices[i]
-        v2 = vertices[(i + 1) % n]
-        
-        normal[0] += (v1[1] - v2[1]) * (v1[2] + v2[2])
-        normal[1] += (v1[2] - v2[2]) * (v1[0] + v2[0])
-        normal[2] += (v1[0] - v2[0]) * (v1[1] + v2[1])
+    # Calculate normal vector using Newell's method
+    nx = ny = nz = 0.0
+    for v1, v2 in zip(vertices, vertices[1:] + vertices[:1]):
+        nx += (v1[1] - v2[1]) * (v1[2] + v2[2])
+        ny += (v1[2] - v2[2]) * (v1[0] + v2[0])
+        nz += (v1[0] - v2[0]) * (v1[1] + v2[1])
     
     # Calculate magnitude of normal (which is 2 * area)
-    magnitude = math.sqrt(normal[0]**2 + normal[1]**2 + normal[2]**2)
+    magnitude = math.sqrt(nx**2 + ny**2 + nz**2)
     
     return magnitude / 2.0
 
 
-def _parse_materials(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry) -> Dict[str, str]:
+def calculate_polygon_areas_3d(boundaries: List[List[List[float]]]) -> List[float]:
+    """
+    Calculate areas for many 3D polygons at once using Newell's method.
+    
+    With NumPy installed, polygons are padded to a common vertex count by
+    repeating their first vertex (repeated points add nothing to the Newell
+    sum) and summed as one (N, V, 3) array. Otherwise each polygon goes
+    through calculate_polygon_area_3d.
+    
+    Args:
+        boundaries: List of vertex lists, one per polygon
+        
+    Returns:
+        Areas in square meters, in input order
+    """
+    if np is None or len(boundaries) < _NUMPY_MIN_BATCH:
+        return [calculate_polygon_area_3d(b) for b in boundaries]
+    
+    areas = [0.0] * len(boundaries)
+    valid = [i for i, b in enumerate(boundaries) if len(b) >= 3]
+    if not valid:
+        return areas
+    
+    vmax = max(len(boundaries[i]) for i in valid)
+    padded = []
+    for i in valid:
+        b = boundaries[i]
+        padded.append(list(b) + [b[0]] * (vmax - len(b)))
+    
+    v = np.asarray(padded, dtype=np.float64)
+    v2 = np.roll(v, -1, axis=1)
+    normals = np.stack([
+        ((v[..., 1] - v2[..., 1]) * (v[..., 2] + v2[..., 2])).sum(axis=1),
+        ((v[..., 2] - v2[..., 2]) * (v[..., 0] + v2[..., 0])).sum(axis=1),
+        ((v[..., 0] - v2[..., 0]) * (v[..., 1] + v2[..., 1])).sum(axis=1),
+    ], axis=1)
+    
+    for i, area in zip(valid, (np.linalg.norm(normals, axis=1) / 2.0).tolist()):
+        areas[i] = area
+    return areas
+
+
+def _add_count(diagnostics: List[Dict[str, Any]], code: str, count: int, message_fmt: str) -> None:
+    """
+    Record an info diagnostic counting parsed items.
+    
+    Zero counts are not recorded.
+    
+    Args:
+        diagnostics: em["diagnostics"] list
+        code: Diagnostic code (e.g., "I-ZONES-PARSED")
+        count: Number of items parsed
+        message_fmt: Message template; {n} is replaced with count
+    """
+    if not count:
+        return
+    
+    diagnostics.append({
+        "level": "info",
+        "code": code,
+        "message": message_fmt.format(n=count),
+        "context": {"total": count}
+    })
+
+
+def _material_item(mat: Dict[str, Any], mat_id: str, keep_source: bool) -> Optional[Dict[str, Any]]:
+    """Build the EMJSON catalog entry for one HBJSON material (None if unsupported)."""
+    get = mat.get
+    mat_type = get("type", "")
+    
+    if mat_type == "EnergyMaterial":
+        # Opaque material
+        return {
+            "id": mat_id,
+            "name": get("identifier", "Material"),
+            "thickness_m": get("thickness", 0.0),
+            "conductivity_w_mk": get("conductivity", 0.0),
+            "density_kg_m3": get("density", 0.0),
+            "specific_heat_j_kgk": get("specific_heat", 0.0),
+            "thermal_absorptance": get("thermal_absorptance", 0.9),
+            "solar_absorptance": get("solar_absorptance", 0.7),
+            "visible_absorptance": get("visible_absorptance", 0.7),
+            "annotation": {
+                "source_format": "HBJSON",
+                "hbjson_type": mat_type,
+                "roughness": get("roughness", "")
+            }
+        }
+    
+    if mat_type in ("EnergyWindowMaterialGlazing", "EnergyWindowMaterialGas"):
+        # Window material - store for window type calculation
+        item = {
+            "id": mat_id,
+            "name": get("identifier", "Material"),
+            "annotation": {
+                "source_format": "HBJSON",
+                "hbjson_type": mat_type
+            }
+        }
+        if keep_source:
+            item["annotation"]["hbjson_properties"] = mat
+        return item
+    
+    return None
+
+
+def _parse_materials(energy: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry,
+                     keep_source: bool = False) -> Dict[str, str]:
     """
     Parse HBJSON materials to EMJSON catalog.
     
     Args:
-        hb: HBJSON dictionary
+        energy: Model-level HBJSON energy properties (hb["properties"]["energy"])
         em: EMJSON dictionary to populate
         id_registry: ID registry for stable IDs
+        keep_source: Copy the source material dict into the annotation
         
     Returns:
         Dictionary mapping material identifiers to EMJSON IDs
     """
-    materials = hb.get("properties", {}).get("energy", {}).get("materials", [])
-    mat_list = []
+    materials = energy.get("materials", [])
     mat_id_map = {}
+    mat_list = []
     
     for mat in materials:
-        mat_type = mat.get("type", "")
         identifier = mat.get("identifier", "Material")
         
         # Generate stable ID
         mat_id = id_registry.generate_id("MAT", identifier, context="", source_format="HBJSON")
         mat_id_map[identifier] = mat_id
-        
-        if mat_type == "EnergyMaterial":
-            # Opaque material
-            item = {
-                "id": mat_id,
-                "name": identifier,
-                "thickness_m": mat.get("thickness", 0.0),
-                "conductivity_w_mk": mat.get("conductivity", 0.0),
-                "density_kg_m3": mat.get("density", 0.0),
-                "specific_heat_j_kgk": mat.get("specific_heat", 0.0),
-                "thermal_absorptance": mat.get("thermal_absorptance", 0.9),
-                "solar_absorptance": mat.get("solar_absorptance", 0.7),
-                "visible_absorptance": mat.get("visible_absorptance", 0.7),
-                "annotation": {
-                    "source_format": "HBJSON",
-                    "hbjson_type": mat_type,
-                    "roughness": mat.get("roughness", "")
-                }
-            }
-            mat_list.append(item)
-            
-        elif mat_type in ("EnergyWindowMaterialGlazing", "EnergyWindowMaterialGas"):
-            # Window material - store for window type calculation
-            item = {
-                "id": mat_id,
-                "name": identifier,
-                "annotation": {
-                    "source_format": "HBJSON",
-                    "hbjson_type": mat_type,
-                    "hbjson_properties": mat
-                }
-            }
+        item = _material_item(mat, mat_id, keep_source)
+        if item is not None:
             mat_list.append(item)
     
     em["catalogs"]["materials"] = mat_list
     
-    if mat_list:
-        em["diagnostics"].append({
-            "level": "info",
-            "code": "I-MATERIALS-PARSED",
-            "message": f"Parsed {len(mat_list)} materials from HBJSON"
-        })
+    _add_count(em["diagnostics"], "I-MATERIALS-PARSED", len(mat_list),
+               "Parsed {n} materials from HBJSON")
     
     return mat_id_map
 
 
-def _parse_constructions(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry,
-                        mat_id_map: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+def _construction_item(cons: Dict[str, Any], item_id: str, layer_ids: List[str],
+                       keep_source: bool) -> Dict[str, Any]:
+    """Build the EMJSON construction or window type entry for one HBJSON construction."""
+    cons_type = cons.get("type", "")
+    annotation = {
+        "source_format": "HBJSON",
+        "hbjson_type": cons_type
+    }
+    if cons_type == "WindowConstructionAbridged":
+        # Simplified window properties (would need detailed calculation for accuracy)
+        annotation["note"] = "U-factor, SHGC, VT calculated from window layers"
+    if keep_source:
+        annotation["hbjson_materials"] = cons.get("materials", [])
+    
+    return {
+        "id": item_id,
+        "name": cons.get("identifier", "Construction"),
+        "layers": layer_ids,
+        "annotation": annotation
+    }
+
+
+def _parse_constructions(energy: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry,
+                        mat_id_map: Dict[str, str],
+                        keep_source: bool = False) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
     Parse HBJSON constructions to EMJSON catalogs.
     
+    Layers are stored as material IDs; the source identifier lists are only
+    copied into the annotation when keep_source is set.
+    
     Returns:
         Tuple of (construction_id_map, window_type_id_map)
     """
-    constructions = hb.get("properties", {}).get("energy", {}).get("constructions", [])
-    cons_list = []
-    window_list = []
+    constructions = energy.get("constructions", [])
     cons_id_map = {}
     window_id_map = {}
+    cons_list = []
+    window_list = []
     
     for cons in constructions:
         cons_type = cons.get("type", "")
         identifier = cons.get("identifier", "Construction")
-        materials = cons.get("materials", [])
+        # Map material identifiers to IDs
+        layer_ids = [mat_id_map.get(m, m) for m in cons.get("materials", [])]
         
         if cons_type == "OpaqueConstructionAbridged":
             # Opaque construction
-            cons_id = id_registry.generate_id("CONS", identifier, context="", source_format="HBJSON")
-            cons_id_map[identifier] = cons_id
-            
-            # Map material identifiers to IDs
-            layer_ids = [mat_id_map.get(m, m) for m in materials]
-            
-            item = {
-                "id": cons_id,
-                "name": identifier,
-                "layers": layer_ids,
-                "annotation": {
-                    "source_format": "HBJSON",
-                    "hbjson_type": cons_type,
-                    "hbjson_materials": materials
-                }
-            }
-            cons_list.append(item)
-            
+            item_id = id_registry.generate_id("CONS", identifier, context="", source_format="HBJSON")
+            cons_id_map[identifier] = item_id
+            cons_list.append(_construction_item(cons, item_id, layer_ids, keep_source))
         elif cons_type == "WindowConstructionAbridged":
             # Window construction → window type
-            win_id = id_registry.generate_id("WIN", identifier, context="", source_format="HBJSON")
-            window_id_map[identifier] = win_id
-            
-            # Simplified window properties (would need detailed calculation for accuracy)
-            item = {
-                "id": win_id,
-                "name": identifier,
-                "annotation": {
-                    "source_format": "HBJSON",
-                    "hbjson_type": cons_type,
-                    "hbjson_materials": materials,
-                    "note": "U-factor, SHGC, VT calculated from window layers"
-                }
-            }
-            window_list.append(item)
+            item_id = id_registry.generate_id("WIN", identifier, context="", source_format="HBJSON")
+            window_id_map[identifier] = item_id
+            window_list.append(_construction_item(cons, item_id, layer_ids, keep_source))
     
     em["catalogs"]["construction_types"] = cons_list
     em["catalogs"]["window_types"] = window_list
     
-    if cons_list:
-        em["diagnostics"].append({
-            "level": "info",
-            "code": "I-CONSTRUCTIONS-PARSED",
-            "message": f"Parsed {len(cons_list)} constructions from HBJSON"
-        })
-    
-    if window_list:
-        em["diagnostics"].append({
-            "level": "info",
-            "code": "I-WINDOW-TYPES-PARSED",
-            "message": f"Parsed {len(window_list)} window types from HBJSON"
-        })
+    _add_count(em["diagnostics"], "I-CONSTRUCTIONS-PARSED", len(cons_list),
+               "Parsed {n} constructions from HBJSON")
+    _add_count(em["diagnostics"], "I-WINDOW-TYPES-PARSED", len(window_list),
+               "Parsed {n} window types from HBJSON")
     
     return cons_id_map, window_id_map
 
@@ -218,30 +328,35 @@ def _parse_rooms(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry
     zone_list = []
     room_data = {}
     
-    for room in rooms:
+    # Compute every face area in one batch; reused by _parse_faces
+    room_faces = [room.get("faces", []) for room in rooms]
+    all_areas = calculate_polygon_areas_3d([
+        face.get("geometry", {}).get("boundary", [])
+        for faces in room_faces for face in faces
+    ])
+    area_pos = 0
+    generate_id = id_registry.generate_id_fast
+    
+    for room, faces in zip(rooms, room_faces):
         identifier = room.get("identifier", "Room")
         display_name = room.get("display_name", identifier)
         
         # Generate stable zone ID
-        zone_id = id_registry.generate_id("Z", identifier, context="", source_format="HBJSON")
+        zone_id = generate_id("Z", identifier, "", "HBJSON")
         
         # Calculate floor area and volume from faces
-        faces = room.get("faces", [])
+        face_areas = all_areas[area_pos:area_pos + len(faces)]
+        area_pos += len(faces)
         floor_area_m2 = 0.0
         volume_m3 = 0.0
         
-        for face in faces:
-            face_type = face.get("face_type", "")
-            geometry = face.get("geometry", {})
-            boundary = geometry.get("boundary", [])
-            
-            area = calculate_polygon_area_3d(boundary)
-            
-            if face_type == "Floor":
+        for face, area in zip(faces, face_areas):
+            if face.get("face_type", "") == "Floor":
                 floor_area_m2 += area
         
         # Get energy properties
         energy_props = room.get("properties", {}).get("energy", {})
+        construction_set = energy_props.get("construction_set")
         
         item = {
             "id": zone_id,
@@ -255,7 +370,7 @@ def _parse_rooms(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry
             "annotation": {
                 "source_format": "HBJSON",
                 "hbjson_identifier": identifier,
-                "construction_set": energy_props.get("construction_set"),
+                "construction_set": construction_set,
                 "program_type": energy_props.get("program_type"),
                 "hvac": energy_props.get("hvac")
             }
@@ -267,28 +382,25 @@ def _parse_rooms(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry
         room_data[identifier] = {
             "zone_id": zone_id,
             "faces": faces,
-            "construction_set": energy_props.get("construction_set")
+            "face_areas": face_areas,
+            "construction_set": construction_set
         }
     
     em["geometry"]["zones"] = zone_list
     
-    if zone_list:
-        em["diagnostics"].append({
-            "level": "info",
-            "code": "I-ZONES-PARSED",
-            "message": f"Parsed {len(zone_list)} zones from HBJSON rooms"
-        })
+    _add_count(em["diagnostics"], "I-ZONES-PARSED", len(zone_list),
+               "Parsed {n} zones from HBJSON rooms")
     
     return room_data
 
 
 def _parse_faces(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry,
-                room_data: Dict[str, Dict[str, Any]], cons_id_map: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+                room_data: Dict[str, Dict[str, Any]], cons_id_map: Dict[str, str]) -> FaceData:
     """
     Parse HBJSON faces to EMJSON surfaces.
     
     Returns:
-        Dictionary mapping face identifiers to face data for aperture processing
+        FaceData with surface IDs and apertures for aperture processing
     """
     surfaces = {
         "walls": [],
@@ -296,45 +408,41 @@ def _parse_faces(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry
         "floors": []
     }
     
-    face_data = {}
+    face_surface_ids = []
+    face_apertures = []
+    cons_id_get = cons_id_map.get
+    bucket_for = _FACE_TYPE_TO_BUCKET.get
+    generate_id = id_registry.generate_id_fast
     
     for room_id, room_info in room_data.items():
         zone_id = room_info["zone_id"]
         faces = room_info["faces"]
         
-        for face in faces:
-            identifier = face.get("identifier", "Face")
-            display_name = face.get("display_name", identifier)
-            face_type = face.get("face_type", "Wall")
+        for face, area_m2 in zip(faces, room_info["face_areas"]):
+            # Read each face key exactly once through a bound get
+            get = face.get
+            identifier = get("identifier", "Face")
+            display_name = get("display_name", identifier)
+            face_type = get("face_type", "Wall")
+            geometry = get("geometry", {})
+            bc = get("boundary_condition", {})
+            face_props = get("properties")
+            apertures = get("apertures", [])
             
-            # Determine surface bucket
-            if face_type == "Wall":
-                bucket = "walls"
-            elif face_type in ("RoofCeiling", "Roof"):
-                bucket = "roofs"
-            elif face_type == "Floor":
-                bucket = "floors"
-            else:
-                bucket = "walls"  # Default
+            # Determine surface bucket (unknown face types default to walls)
+            bucket = bucket_for(face_type, "walls")
             
             # Generate stable surface ID
-            surf_id = id_registry.generate_id("S", identifier, context=zone_id, source_format="HBJSON")
-            
-            # Calculate area from geometry
-            geometry = face.get("geometry", {})
-            boundary = geometry.get("boundary", [])
-            area_m2 = calculate_polygon_area_3d(boundary)
+            surf_id = generate_id("S", identifier, zone_id, "HBJSON")
             
-            # Get boundary condition
-            bc = face.get("boundary_condition", {})
-            bc_type = bc.get("type", "Outdoors")
-            
-            surface_type = "exterior" if bc_type == "Outdoors" else "interior"
+            # Area was computed in the _parse_rooms batch
+            surface_type = "exterior" if bc.get("type", "Outdoors") == "Outdoors" else "interior"
             
             # Get construction reference
-            energy_props = face.get("properties", {}).get("energy", {})
-            construction_ref = energy_props.get("construction")
-            cons_id = cons_id_map.get(construction_ref) if construction_ref else None
+            construction_ref = (
+                face_props.get("energy", {}).get("construction") if face_props else None
+            )
+            cons_id = cons_id_get(construction_ref) if construction_ref else None
             
             item = {
                 "id": surf_id,
@@ -356,27 +464,19 @@ def _parse_faces(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry
             surfaces[bucket].append(item)
             
             # Store face data for aperture processing
-            face_data[identifier] = {
-                "surface_id": surf_id,
-                "bucket": bucket,
-                "apertures": face.get("apertures", [])
-            }
+            face_surface_ids.append(surf_id)
+            face_apertures.append(apertures)
     
     em["geometry"]["surfaces"] = surfaces
     
-    total_surfaces = sum(len(v) for v in surfaces.values())
-    if total_surfaces > 0:
-        em["diagnostics"].append({
-            "level": "info",
-            "code": "I-SURFACES-PARSED",
-            "message": f"Parsed {total_surfaces} surfaces from HBJSON faces"
-        })
+    _add_count(em["diagnostics"], "I-SURFACES-PARSED", sum(map(len, surfaces.values())),
+               "Parsed {n} surfaces from HBJSON faces")
     
-    return face_data
+    return FaceData(face_surface_ids, face_apertures)
 
 
 def _parse_apertures(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegistry,
-                    face_data: Dict[str, Dict[str, Any]], window_id_map: Dict[str, str]) -> None:
+                    face_data: FaceData, window_id_map: Dict[str, str]) -> None:
     """Parse HBJSON apertures to EMJSON openings (windows)."""
     openings = {
         "windows": [],
@@ -384,26 +484,40 @@ def _parse_apertures(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegi
         "skylights": []
     }
     
-    for face_id, face_info in face_data.items():
-        parent_surf_id = face_info["surface_id"]
-        apertures = face_info["apertures"]
-        
+    # Index surfaces by ID for parent linking
+    surf_by_id = {
+        surf["id"]: surf
+        for bucket_surfs in em["geometry"]["surfaces"].values()
+        for surf in bucket_surfs
+    }
+    
+    # Compute every aperture area in one batch
+    aperture_areas = iter(calculate_polygon_areas_3d([
+        aperture.get("geometry", {}).get("boundary", [])
+        for apertures in face_data.apertures for aperture in apertures
+    ]))
+    window_id_get = window_id_map.get
+    generate_id = id_registry.generate_id_fast
+    
+    for parent_surf_id, apertures in zip(face_data.surface_ids, face_data.apertures):
         for aperture in apertures:
-            identifier = aperture.get("identifier", "Aperture")
-            display_name = aperture.get("display_name", identifier)
+            get = aperture.get
+            identifier = get("identifier", "Aperture")
+            display_name = get("display_name", identifier)
+            aperture_props = get("properties")
             
             # Generate stable opening ID
-            opening_id = id_registry.generate_id("O", identifier, context=parent_surf_id, source_format="HBJSON")
+            opening_id = generate_id("O", identifier, parent_surf_id, "HBJSON")
             
-            # Calculate area from geometry
-            geometry = aperture.get("geometry", {})
-            boundary = geometry.get("boundary", [])
-            area_m2 = calculate_polygon_area_3d(boundary)
+            # Area from the batch above (same order as this loop)
+            geometry = get("geometry", {})
+            area_m2 = next(aperture_areas)
             
             # Get window type reference
-            energy_props = aperture.get("properties", {}).get("energy", {})
-            construction_ref = energy_props.get("construction")
-            window_type_id = window_id_map.get(construction_ref) if construction_ref else None
+            construction_ref = (
+                aperture_props.get("energy", {}).get("construction") if aperture_props else None
+            )
+            window_type_id = window_id_get(construction_ref) if construction_ref else None
             
             item = {
                 "id": opening_id,
@@ -415,37 +529,34 @@ def _parse_apertures(hb: Dict[str, Any], em: Dict[str, Any], id_registry: IDRegi
                     "source_format": "HBJSON",
                     "hbjson_identifier": identifier,
                     "hbjson_geometry": geometry,
-                    "is_operable": aperture.get("is_operable", False)
+                    "is_operable": get("is_operable", False)
                 }
             }
             
             openings["windows"].append(item)
             
             # Add opening reference to parent surface
-            surfaces = em["geometry"]["surfaces"]
-            bucket = face_info["bucket"]
-            for surf in surfaces[bucket]:
-                if surf["id"] == parent_surf_id:
-                    surf["openings"].append(opening_id)
-                    break
+            parent_surf = surf_by_id.get(parent_surf_id)
+            if parent_surf is not None:
+                parent_surf["openings"].append(opening_id)
     
     em["geometry"]["openings"] = openings
     
-    total_openings = sum(len(v) for v in openings.values())
-    if total_openings > 0:
-        em["diagnostics"].append({
-            "level": "info",
-            "code": "I-OPENINGS-PARSED",
-            "message": f"Parsed {total_openings} openings from HBJSON apertures"
-        })
+    _add_count(em["diagnostics"], "I-OPENINGS-PARSED", sum(map(len, openings.values())),
+               "Parsed {n} openings from HBJSON apertures")
 
 
-def translate_hbjson_to_v6(file_path: str) -> Dict[str, Any]:
+def translate_hbjson_to_v6(file_path: str, keep_source: bool = False) -> Dict[str, Any]:
     """
     Translate HBJSON to EMJSON v6.
     
+    Face and aperture geometry is always kept (it is the only record of the
+    vertices); verbatim source material/construction data is opt-in.
+    
     Args:
         file_path: Path to HBJSON file
+        keep_source: Copy source HBJSON material properties and construction
+            layer identifiers into annotations (debugging aid; larger output)
         
     Returns:
         EMJSON v6 dictionary with full schema compliance
@@ -455,8 +566,7 @@ def translate_hbjson_to_v6(file_path: str) -> Dict[str, Any]:
         >>> print(f"Zones: {len(emjson['geometry']['zones'])}")
     """
     # Load HBJSON
-    with open(file_path, 'r', encoding='utf-8') as f:
-        hb = json.load(f)
+    hb = load_json(file_path)
     
     # Initialize EMJSON v6 structure
     em: Dict[str, Any] = {
@@ -504,9 +614,12 @@ def translate_hbjson_to_v6(file_path: str) -> Dict[str, Any]:
     # Create ID registry for stable IDs
     id_registry = IDRegistry()
     
+    # Model-level energy properties, shared by the catalog parsers
+    energy = hb.get("properties", {}).get("energy", {})
+    
     # Parse in order: catalogs → geometry → systems
-    mat_id_map = _parse_materials(hb, em, id_registry)
-    cons_id_map, window_id_map = _parse_constructions(hb, em, id_registry, mat_id_map)
+    mat_id_map = _parse_materials(energy, em, id_registry, keep_source)
+    cons_id_map, window_id_map = _parse_constructions(energy, em, id_registry, mat_id_map, keep_source)
     room_data = _parse_rooms(hb, em, id_registry)
     face_data = _parse_faces(hb, em, id_registry, room_data, cons_id_map)
     _parse_apertures(hb, em, id_registry, face_data, window_id_map)
@@ -522,17 +635,21 @@ def translate_hbjson_to_v6(file_path: str) -> Dict[str, Any]:
     }
     
     # Summary diagnostic
+    geometry = em['geometry']
+    n_zones = len(geometry['zones'])
+    n_surfaces = sum(map(len, geometry['surfaces'].values()))
+    n_openings = sum(map(len, geometry['openings'].values()))
     em["diagnostics"].append({
         "level": "info",
         "code": "I-TRANSLATION-COMPLETE",
         "message": f"HBJSON → EMJSON v6 translation complete: "
-                   f"{len(em['geometry']['zones'])} zones, "
-                   f"{sum(len(v) for v in em['geometry']['surfaces'].values())} surfaces, "
-                   f"{sum(len(v) for v in em['geometry']['openings'].values())} openings",
+                   f"{n_zones} zones, "
+                   f"{n_surfaces} surfaces, "
+                   f"{n_openings} openings",
         "context": {
-            "zones": len(em['geometry']['zones']),
-            "surfaces": sum(len(v) for v in em['geometry']['surfaces'].values()),
-            "openings": sum(len(v) for v in em['geometry']['openings'].values()),
+            "zones": n_zones,
+            "surfaces": n_surfaces,
+            "openings": n_openings,
             "materials": len(em['catalogs']['materials'])
         }
     })
@@ -550,13 +667,13 @@ def main(argv=None):
     out = argv[1] if len(argv) > 1 else argv[0].rsplit('.', 1)[0] + ".emjson"
     em = translate_hbjson_to_v6(argv[0])
     
-    with open(out, "w", encoding="utf-8") as f:
-        json.dump(em, f, indent=2)
+    write_json(em, out)
     
+    geometry = em['geometry']
     print(f"✓ Wrote {out}")
-    print(f"  - {len(em['geometry']['zones'])} zones")
-    print(f"  - {sum(len(v) for v in em['geometry']['surfaces'].values())} surfaces")
-    print(f"  - {sum(len(v) for v in em['geometry']['openings'].values())} openings")
+    print(f"  - {len(geometry['zones'])} zones")
+    print(f"  - {sum(map(len, geometry['surfaces'].values()))} surfaces")
+    print(f"  - {sum(map(len, geometry['openings'].values()))} openings")
     print(f"  - {len(em['diagnostics'])} diagnostics")
     return 0
 
@@ -3,8 +3,11 @@ Utility modules for EMJSON translators.
 
 This package provides common utilities used across translators:
 - IDRegistry: Stable ID generation for EMJSON entities
+- load_registry: Rebuild an IDRegistry from an exported registry
+- parse_xml_root: XML parsing via lxml, falling back to ElementTree
 """
 
-from emtools.utils.id_registry import IDRegistry
+from emtools.utils.id_registry import IDRegistry, load_registry
+from emtools.utils.xml_backend import parse_xml_root
 
-__all__ = ["IDRegistry"]
+__all__ = ["IDRegistry", "load_registry", "parse_xml_root"]
@@ -1,15 +1,90 @@
 from __future__ import annotations
+from functools import lru_cache
 import hashlib
 import re
 from typing import Dict, Any, Optional
 
 
+_NON_ID_CHARS = re.compile(r'[^a-z0-9_-]')
+_UNDERSCORE_RUNS = re.compile(r'_+')
+# ASCII equivalent of _NON_ID_CHARS for str.translate
+_ID_CHAR_TABLE = str.maketrans({
+    c: '_' for c in map(chr, range(128))
+    if not (c in '_-' or '0' <= c <= '9' or 'a' <= c <= 'z')
+})
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str, max_length: int) -> str:
+    """Clean name for ID suffix (cached; names repeat across prefixes/contexts)."""
+    # Convert to lowercase
+    clean = name.lower().strip()
+
+    # Replace non-alphanumeric with underscore (table lookup for ASCII names)
+    if clean.isascii():
+        clean = clean.translate(_ID_CHAR_TABLE)
+    else:
+        clean = _NON_ID_CHARS.sub('_', clean)
+
+    # Collapse multiple underscores
+    clean = _UNDERSCORE_RUNS.sub('_', clean)
+
+    # Remove leading/trailing underscores
+    clean = clean.strip('_')
+
+    # Limit length
+    if len(clean) > max_length:
+        clean = clean[:max_length].rstrip('_')
+
+    # Fallback if empty
+    return clean or "item"
+
+
+def _hash8_blake2b(hash_input: str) -> str:
+    return hashlib.blake2b(hash_input.encode("utf-8"), digest_size=4).hexdigest()
+
+
+def _hash8_md5(hash_input: str) -> str:
+    return hashlib.md5(hash_input.encode()).hexdigest()[:8]
+
+
+# 8-hex-char ID hash functions by name; "md5" is the pre-blake2b scheme
+_HASHERS = {
+    "blake2b": _hash8_blake2b,
+    "md5": _hash8_md5,
+}
+
+DEFAULT_HASH_ALGORITHM = "blake2b"
+# Registries exported before the algorithm was recorded used md5
+LEGACY_HASH_ALGORITHM = "md5"
+
+
+def _expand_reverse_entry(meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a compact exported reverse_map entry back to full metadata."""
+    if "sf" not in meta:
+        return meta
+    source_format, source_id, context = meta["sf"], meta["si"], meta["ctx"]
+    return {
+        "source_format": source_format,
+        "source_id": source_id,
+        "context": context,
+        "lookup_key": f"{source_format}:{source_id}:{context}"
+    }
+
+
 class IDRegistry:
     """Generate stable, deterministic IDs for EMJSON v6."""
 
-    def __init__(self):
+    def __init__(self, hash_algorithm: str = DEFAULT_HASH_ALGORITHM):
         self.forward_map: Dict[str, str] = {}  # source_key -> emjson_id
         self.reverse_map: Dict[str, Dict] = {}  # emjson_id -> metadata
+        self._set_hash_algorithm(hash_algorithm)
+
+    def _set_hash_algorithm(self, hash_algorithm: str) -> None:
+        if hash_algorithm not in _HASHERS:
+            raise ValueError(f"Unsupported ID hash algorithm: {hash_algorithm}")
+        self.hash_algorithm = hash_algorithm
+        self._hash8 = _HASHERS[hash_algorithm]
 
     def generate_id(
             self,
@@ -34,12 +109,13 @@ class IDRegistry:
         lookup_key = f"{source_format}:{source_id}:{context}"
 
         # Return existing if already generated
-        if lookup_key in self.forward_map:
-            return self.forward_map[lookup_key]
+        existing = self.forward_map.get(lookup_key)
+        if existing is not None:
+            return existing
 
         # Generate hash from prefix + source_id + context
         hash_input = f"{prefix}:{source_id}:{context}"
-        stable_hash = hashlib.md5(hash_input.encode()).hexdigest()[:8]
+        stable_hash = self._hash8(hash_input)
 
         # Sanitize name for readability
         clean_name = self._sanitize(source_id)
@@ -58,39 +134,79 @@ class IDRegistry:
 
         return emjson_id
 
-    def _sanitize(self, name: str, max_length: int = 20) -> str:
-        """Clean name for ID suffix."""
-        # Convert to lowercase
-        clean = name.lower().strip()
-
-        # Replace non-alphanumeric with underscore
-        clean = re.sub(r'[^a-z0-9_-]', '_', clean)
-
-        # Collapse multiple underscores
-        clean = re.sub(r'_+', '_', clean)
-
-        # Remove leading/trailing underscores
-        clean = clean.strip('_')
+    def generate_id_fast(self, prefix: str, source_id: str, context: str, source_format: str) -> str:
+        """
+        Variant of generate_id for per-entity loops (all arguments positional).
 
-        # Limit length
-        if len(clean) > max_length:
-            clean = clean[:max_length].rstrip('_')
+        Returns the same IDs as generate_id; the already-registered case is
+        answered without keyword argument handling.
+        """
+        existing = self.forward_map.get(f"{source_format}:{source_id}:{context}")
+        if existing is not None:
+            return existing
+        return self.generate_id(prefix, source_id, context, source_format)
 
-        # Fallback if empty
-        return clean or "item"
+    def _sanitize(self, name: str, max_length: int = 20) -> str:
+        """Clean name for ID suffix."""
+        return _sanitize_name(name, max_length)
 
     def resolve(self, emjson_id: str) -> Optional[Dict[str, Any]]:
         """Get source metadata for an EMJSON ID."""
         return self.reverse_map.get(emjson_id)
 
     def export_registry(self) -> Dict[str, Any]:
-        """Export registry for storage in EMJSON."""
+        """
+        Export registry for storage in EMJSON.
+
+        reverse_map entries are written in compact form
+        ({"sf": source_format, "si": source_id, "ctx": context}); lookup_key
+        is omitted since import_registry rebuilds it from those parts.
+        """
         return {
+            "hash_algorithm": self.hash_algorithm,
             "forward_map": self.forward_map,
-            "reverse_map": self.reverse_map
+            "reverse_map": {
+                emjson_id: {
+                    "sf": meta["source_format"],
+                    "si": meta["source_id"],
+                    "ctx": meta["context"]
+                }
+                for emjson_id, meta in self.reverse_map.items()
+            }
         }
 
     def import_registry(self, registry_data: Dict[str, Any]) -> None:
-        """Import registry from stored EMJSON."""
+        """
+        Import registry from stored EMJSON.
+
+        The stored hash algorithm is adopted so IDs minted for new objects
+        match the scheme of the imported ones; registries without one are
+        treated as legacy md5 registries. Both the compact reverse_map form
+        written by export_registry and the older full form are accepted.
+        """
         self.forward_map = registry_data.get("forward_map", {})
-        self.reverse_map = registry_data.get("reverse_map", {})
\ No newline at end of file
+        self.reverse_map = {
+            emjson_id: _expand_reverse_entry(meta)
+            for emjson_id, meta in registry_data.get("reverse_map", {}).items()
+        }
+        self._set_hash_algorithm(registry_data.get("hash_algorithm", LEGACY_HASH_ALGORITHM))
+
+
+def load_registry(registry_data: Dict[str, Any]) -> IDRegistry:
+    """
+    Rebuild an IDRegistry from an exported registry (e.g., _metadata["id_registry"]).
+
+    Use this when re-translating an existing project: IDs already in the
+    registry are returned unchanged by generate_id, and new IDs follow the
+    registry's original hash algorithm (md5 for registries exported before
+    blake2b became the default).
+
+    Args:
+        registry_data: Output of IDRegistry.export_registry()
+
+    Returns:
+        IDRegistry populated from registry_data
+    """
+    registry = IDRegistry()
+    registry.import_registry(registry_data)
+    return registry
\ No newline at end of file
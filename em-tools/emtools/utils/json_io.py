@@ -0,0 +1,59 @@
+"""
+JSON file input/output for EMJSON and HBJSON documents.
+
+Uses orjson (declared in install_requires; much faster encoding and
+decoding) when it is importable and falls back to the standard library json
+module otherwise.
+"""
+
+from __future__ import annotations
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson missing from the environment
+    orjson = None
+
+
+def load_json(path: str) -> Any:
+    """
+    Read a UTF-8 JSON document from path.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(obj: Any, path: str, indent: int = 2) -> None:
+    """
+    Write obj as indented JSON to path.
+
+    orjson only supports 2-space indentation; other indents use stdlib json.
+    Both backends write UTF-8; orjson leaves non-ASCII characters unescaped.
+
+    Args:
+        obj: JSON-serializable document (e.g., an EMJSON dict)
+        path: Output file path
+        indent: Indentation width
+    """
+    if orjson is not None and indent == 2:
+        data = orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+        with open(path, "wb") as f:
+            f.write(data)
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(obj, indent=indent))
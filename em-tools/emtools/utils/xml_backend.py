@@ -0,0 +1,265 @@
+"""
+XML parsing backend for CIBD22X readers.
+
+Uses lxml (declared in install_requires) when it is importable and falls back
+to the standard library ElementTree otherwise. Both expose the same
+find/findall/iter/get API used by the parsers package.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import heapq
+
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:  # pragma: no cover - lxml missing from the environment
+    from xml.etree import ElementTree as ET
+    HAVE_LXML = False
+
+
+# lxml parser settings shared by parse_xml_root and iterparse_indexed
+_LXML_PARSER_OPTIONS = dict(
+    huge_tree=True,
+    remove_blank_text=True,
+    remove_comments=True,
+    remove_pis=True,
+    collect_ids=False,
+)
+
+
+def make_xml_parser() -> Any:
+    """
+    Create an XML parser configured for large building models.
+
+    With lxml, comments and processing instructions are dropped so that
+    iterating a tree only yields elements, matching ElementTree behavior.
+    The xml:id hash table is not built; no reader looks elements up by ID.
+
+    Returns:
+        Parser instance for ET.parse / ET.iterparse
+    """
+    if HAVE_LXML:
+        return ET.XMLParser(**_LXML_PARSER_OPTIONS)
+    return ET.XMLParser()
+
+
+def parse_xml_root(xml_path: Any) -> Any:
+    """
+    Parse an XML file and return its root element.
+
+    Args:
+        xml_path: Path or file object of the XML document
+
+    Returns:
+        Root element (lxml or ElementTree, depending on the backend)
+    """
+    return ET.parse(xml_path, make_xml_parser()).getroot()
+
+
+def _local_tag(tag: Any) -> str:
+    return tag.rpartition("}")[2] if isinstance(tag, str) else ""
+
+
+def descendant_finder(tags: Iterable[str]) -> Callable[[Any], List[Any]]:
+    """
+    Build a reusable function returning a node's descendants with given tags.
+
+    With lxml the walk is node.iter() with "{*}Tag" wildcards, matched in C;
+    with ElementTree it is a single iter() walk filtered by local tag.
+    Either way one call does one walk of the subtree, and results come back
+    in document order.
+
+    Args:
+        tags: Local tag names to match
+
+    Returns:
+        Function mapping an element to its matching descendants
+    """
+    tags = tuple(tags)
+    if HAVE_LXML:
+        patterns = tuple("{*}" + t for t in tags)
+
+        def find_lxml(node: Any) -> List[Any]:
+            return [el for el in node.iter(*patterns) if el is not node]
+
+        return find_lxml
+
+    wanted = frozenset(tags)
+
+    def find(node: Any) -> List[Any]:
+        return [el for el in node.iter() if el is not node and _local_tag(el.tag) in wanted]
+
+    return find
+
+
+class ElementIndex:
+    """
+    Descendant elements of a document grouped by local tag name.
+
+    Lets several parsers share one walk of the tree instead of each running
+    its own findall/iter scans. Elements are kept in document order; the
+    root element itself is not indexed (parsers search descendants).
+    """
+
+    def __init__(self, tags: Iterable[str]):
+        self.tags = frozenset(tags)
+        self._by_tag: Dict[str, List[Tuple[int, Any]]] = {t: [] for t in self.tags}
+
+    @classmethod
+    def from_root(cls, root: Any, tags: Iterable[str]) -> "ElementIndex":
+        """
+        Index an already-built tree in a single walk.
+
+        Args:
+            root: Root element
+            tags: Local tag names to index
+
+        Returns:
+            ElementIndex over root's descendants
+        """
+        index = cls(tags)
+        by_tag = index._by_tag
+        elements = root.iter()
+        next(elements, None)  # skip the root itself
+        for pos, elem in enumerate(elements):
+            entries = by_tag.get(_local_tag(elem.tag))
+            if entries is not None:
+                entries.append((pos, elem))
+        return index
+
+    def _entries(self, tag: str) -> List[Tuple[int, Any]]:
+        try:
+            return self._by_tag[tag]
+        except KeyError:
+            raise ValueError(f"Tag not indexed: {tag}") from None
+
+    def find_all(self, *tags: str) -> List[Any]:
+        """
+        Elements with the given tags, grouped by tag in argument order.
+
+        Matches concatenating root.findall(".//Tag") for each tag.
+        """
+        return [elem for tag in tags for _, elem in self._entries(tag)]
+
+    def find_first(self, tag: str) -> Optional[Any]:
+        """First element with the given tag, like root.find(".//Tag")."""
+        entries = self._entries(tag)
+        return entries[0][1] if entries else None
+
+    def iter_document_order(self, *tags: str) -> List[Any]:
+        """Elements with any of the given tags, in document order."""
+        return [elem for _, elem in heapq.merge(*(self._entries(tag) for tag in tags))]
+
+
+def iterparse_root(xml_path: Any, skip_tags: Iterable[str] = ()) -> Any:
+    """
+    Build the element tree incrementally, discarding unneeded sections.
+
+    Elements whose local tag is in skip_tags are cleared and detached from
+    their parent as soon as they finish parsing, so their subtrees are never
+    held alongside the rest of the document.
+
+    Args:
+        xml_path: Path or file object of the XML document
+        skip_tags: Local tag names of sections no reader consumes
+
+    Returns:
+        Root element (lxml or ElementTree, depending on the backend)
+    """
+    root, _ = iterparse_indexed(xml_path, (), skip_tags=skip_tags)
+    return root
+
+
+# Element marks used by iterparse_indexed when pruning
+_INDEXED = 2
+_HAS_INDEXED = 1
+
+
+def iterparse_indexed(
+        xml_path: Any,
+        index_tags: Iterable[str],
+        skip_tags: Iterable[str] = (),
+        prune_unindexed: bool = False
+) -> Tuple[Any, ElementIndex]:
+    """
+    Build the element tree incrementally and index elements in the same pass.
+
+    Behaves like iterparse_root; additionally every descendant whose local tag
+    is in index_tags is recorded in an ElementIndex, so parsers need not walk
+    the finished tree again. Elements inside skipped sections are not indexed.
+
+    With prune_unindexed, an element is dropped as soon as it finishes parsing
+    unless it is indexed, lies inside an indexed element, or has an indexed
+    descendant. Only use it when every reader goes through the index (plus
+    the root's own attributes); the rest of the document is never retained.
+
+    Args:
+        xml_path: Path or file object of the XML document
+        index_tags: Local tag names to index
+        skip_tags: Local tag names of sections no reader consumes
+        prune_unindexed: Discard elements outside indexed subtrees
+
+    Returns:
+        Tuple of (root element, ElementIndex)
+    """
+    index = ElementIndex(index_tags)
+    by_tag = index._by_tag
+    skip = frozenset(skip_tags)
+    if HAVE_LXML:
+        events = ET.iterparse(xml_path, events=("start", "end"), **_LXML_PARSER_OPTIONS)
+    else:
+        events = ET.iterparse(xml_path, events=("start", "end"))
+
+    root = None
+    stack = []
+    # Per open element: _INDEXED, _HAS_INDEXED (an indexed descendant) or 0
+    marks: List[int] = []
+    pos = 0
+    skip_depth = 0
+    indexed_depth = 0
+    for event, elem in events:
+        if event == "start":
+            mark = 0
+            if root is None:
+                root = elem
+            else:
+                tag = _local_tag(elem.tag)
+                if tag in skip:
+                    skip_depth += 1
+                elif not skip_depth:
+                    entries = by_tag.get(tag)
+                    if entries is not None:
+                        entries.append((pos, elem))
+                        mark = _INDEXED
+                        indexed_depth += 1
+                pos += 1
+            stack.append(elem)
+            marks.append(mark)
+            continue
+
+        stack.pop()
+        mark = marks.pop()
+        if _local_tag(elem.tag) in skip and stack:
+            skip_depth -= 1
+            elem.clear()
+            stack[-1].remove(elem)
+            continue
+
+        if not prune_unindexed or not stack:
+            continue
+        if mark:
+            marks[-1] = marks[-1] or _HAS_INDEXED
+            if mark == _INDEXED:
+                indexed_depth -= 1
+        elif not indexed_depth:
+            # Finished subtree no reader needs; events arrive in batches, so
+            # later siblings may already be attached to the parent
+            elem.clear()
+            parent = stack[-1]
+            if parent[-1] is elem:
+                del parent[-1]
+            else:
+                parent.remove(elem)
+
+    return root, index
@@ -6,7 +6,7 @@ from setuptools import setup, find_packages
 from pathlib import Path
 
 readme = Path(__file__).parent / "README.md"
-long_description = readme.read_text() if readme.exists() else ""
+long_description = readme.read_text(encoding="utf-8") if readme.exists() else ""
 
 setup(
     name="emtools",
@@ -18,6 +18,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "lxml>=4.9.0",
+        "orjson>=3.9",
     ],
     extras_require={
         'gui': [
@@ -1,28 +1,69 @@
 
 from __future__ import annotations
+from html import escape
+from itertools import islice
 from typing import Any, Mapping, Sequence
 import streamlit as st
 
+
 def _is_scalar(x: Any) -> bool:
     return isinstance(x, (str, int, float, bool)) or x is None
 
+
+def _text(x: Any) -> str:
+    # Escaped, and without raw newlines: a blank line would end the HTML block in markdown
+    return escape(str(x)).replace("\n", "&#10;")
+
+
 def render_collapsible_tree(data: Any, *, label: str = "root", level: int = 0, max_items: int = 500) -> None:
-    if level == 0:
-        st.caption("Collapsible view · click to expand sections")
-    if max_items <= 0:
-        st.warning("Tree truncated for display performance.")
-        return
-    if _is_scalar(data):
-        st.write(f"**{label}:**", data)
-        return
-    if isinstance(data, Mapping):
-        with st.expander(f"{label}  (dict · {len(data)})", expanded=(level == 0)):
-            for k, v in data.items():
-                render_collapsible_tree(v, label=str(k), level=level+1, max_items=max_items-1)
-        return
-    if isinstance(data, Sequence) and not isinstance(data, (str, bytes, bytearray)):
-        with st.expander(f"{label}  (list · {len(data)})", expanded=False):
-            for idx, item in enumerate(data):
-                render_collapsible_tree(item, label=f"[{idx}]", level=level+1, max_items=max_items-1)
-        return
-    st.write(f"**{label}:**", repr(data))
+    """
+    Render nested dicts/lists as one block of nested HTML <details> elements.
+
+    Expanding and collapsing is handled by the browser, so the whole tree is
+    a single Streamlit element (no per-node widgets) and reruns do not
+    depend on how much of it is open. The top two levels start open.
+
+    Args:
+        data: Value to display (typically an EMJSON dict)
+        label: Name shown for the top node
+        level: Unused; kept for existing callers
+        max_items: Children shown per dict/list; the rest are summarized
+    """
+    st.caption("Collapsible view · click to expand sections")
+    st.markdown(_build_html(data, label, max_items), unsafe_allow_html=True)
+
+
+def _build_html(data: Any, label: str, max_items: int) -> str:
+    """HTML for the tree in one pass, walked with an explicit stack."""
+    parts = []
+    # Entries are closing markup (str) or (value, label, depth) nodes
+    stack: list = [(data, label, 0)]
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            parts.append(entry)
+            continue
+        node, name, depth = entry
+        if _is_scalar(node) or not isinstance(node, (Mapping, Sequence)) or isinstance(node, (bytes, bytearray)):
+            value = node if _is_scalar(node) else repr(node)
+            parts.append(f"<div><b>{_text(name)}:</b> {_text(value)}</div>")
+            continue
+
+        if isinstance(node, Mapping):
+            kind, children = "dict", ((str(k), v) for k, v in node.items())
+        else:
+            kind, children = "list", ((f"[{i}]", v) for i, v in enumerate(node))
+        parts.append(
+            f"<details{' open' if depth < 2 else ''}><summary>{_text(name)}  ({kind} · {len(node)})</summary>"
+            "<div style='margin-left:1.2em'>"
+        )
+
+        # Pushed in reverse so children render in order, then the note, then the close
+        stack.append("</div></details>")
+        if len(node) > max_items:
+            stack.append(f"<div><i>… {len(node) - max_items} more (truncated for display performance)</i></div>")
+        stack.extend(
+            (child, child_name, depth + 1)
+            for child_name, child in reversed(list(islice(children, max_items)))
+        )
+    return "".join(parts)
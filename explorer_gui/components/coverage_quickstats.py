@@ -1,7 +1,9 @@
 
 """Quick coverage/metric widgets reused across Import/Active Model panels."""
 from __future__ import annotations
-from typing import Any, Dict
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Tuple
 import streamlit as st
 
 def _safe_sum(vals):
@@ -11,25 +13,25 @@ def _safe_sum(vals):
         return 0.0
 
 def _iter_surfaces(em: Dict[str, Any]):
-    # Try typical EM schema locations
-    # Expected: em['geometry']['surfaces'] or em['surfaces'] (v4 carryover)
-    paths = [
-        ("geometry", "surfaces"),
-        ("surfaces",),
-    ]
-    for p in paths:
-        node = em
-        ok = True
-        for k in p:
-            if isinstance(node, dict) and k in node:
-                node = node[k]
-            else:
-                ok = False
-                break
-        if ok and isinstance(node, list):
-            for s in node:
-                if isinstance(s, dict):
-                    yield s
+    # Yields (bucket, surface). EMJSON v6: em['geometry']['surfaces'] is a dict of
+    # walls/roofs/floors lists, and bucket is that key; flat lists
+    # (em['geometry']['surfaces'] or em['surfaces'], v4 carryover) yield bucket None
+    geometry = em.get("geometry")
+    surfaces = geometry.get("surfaces") if isinstance(geometry, dict) else None
+    if isinstance(surfaces, dict):
+        candidates = chain.from_iterable(
+            ((k, s) for s in surfaces.get(k) or ()) for k in ("walls", "roofs", "floors")
+        )
+    else:
+        if not isinstance(surfaces, list):
+            surfaces = em.get("surfaces")
+        candidates = ((None, s) for s in (surfaces if isinstance(surfaces, list) else ()))
+    for bucket, s in candidates:
+        if isinstance(s, dict):
+            yield bucket, s
+
+# EMJSON v6 stores surface areas in m²; the metrics are shown in sf
+_SF_PER_M2 = 10.7639
 
 def _surface_area(s: Dict[str, Any]) -> float:
     # prefer explicit area, fallback to meta; keep robust
@@ -37,38 +39,50 @@ def _surface_area(s: Dict[str, Any]) -> float:
         v = s.get(key)
         if isinstance(v, (int, float)):
             return float(v)
+    v = s.get("area_m2")
+    if isinstance(v, (int, float)):
+        return float(v) * _SF_PER_M2
     return 0.0
 
-def _is_exterior(s: Dict[str, Any]) -> bool:
-    b = s.get("boundary", s.get("boundary_condition", "")) or ""
-    return str(b).lower() in {"exterior", "outdoors", "ground"}
+# Boundary values counted as exterior (v6 "adjacency": exterior/ground/adiabatic/zone:<id>;
+# CIBD22/HBJSON v6 "surface_type": exterior/interior), and surface type substrings -> quickstats bucket
+_EXTERIOR_BOUNDARIES = frozenset({"exterior", "outdoors", "ground"})
+_TYPE_BUCKETS = (("wall", "wall"), ("roof", "roof"), ("ceiling", "roof"), ("floor", "floor"), ("slab", "floor"))
 
-def _surf_type(s: Dict[str, Any]) -> str:
-    t = s.get("type", s.get("surface_type", "")) or ""
-    return str(t).lower()
+@lru_cache(maxsize=256)
+def _is_exterior_boundary(boundary: str) -> bool:
+    return boundary.lower() in _EXTERIOR_BOUNDARIES
 
-def render_quickstats(em: Dict[str, Any]) -> None:
-    if not isinstance(em, dict):
-        st.info("No active model.")
-        return
+@lru_cache(maxsize=256)
+def _type_bucket(surface_type: str) -> str | None:
+    # Few distinct type strings per model, so each is lowercased/matched once
+    t = surface_type.lower()
+    return next((bucket for needle, bucket in _TYPE_BUCKETS if needle in t), None)
 
-    ext_wall_area = 0.0
-    roof_area = 0.0
-    floor_area = 0.0
+def _exterior_areas(em: Dict[str, Any]) -> Tuple[int, Dict[str, float]]:
+    # Surface count, and exterior wall/roof/floor areas in sf
+    areas = {"wall": 0.0, "roof": 0.0, "floor": 0.0}
     total_surfaces = 0
 
-    for s in _iter_surfaces(em):
+    for v6_bucket, s in _iter_surfaces(em):
         total_surfaces += 1
-        if not _is_exterior(s):
+        get = s.get
+        boundary = get("boundary", get("boundary_condition", get("adjacency", get("surface_type", ""))))
+        if not _is_exterior_boundary(str(boundary or "")):
             continue
-        a = _surface_area(s)
-        t = _surf_type(s)
-        if "wall" in t:
-            ext_wall_area += a
-        elif "roof" in t or "ceiling" in t:
-            roof_area += a
-        elif "floor" in t or "slab" in t:
-            floor_area += a
+        # CIBD22/HBJSON v6 surfaces have no "type"; their bucket key names it
+        bucket = _type_bucket(str(get("type") or v6_bucket or get("surface_type") or ""))
+        if bucket is not None:
+            areas[bucket] += _surface_area(s)
+    return total_surfaces, areas
+
+def render_quickstats(em: Dict[str, Any]) -> None:
+    if not isinstance(em, dict):
+        st.info("No active model.")
+        return
+
+    total_surfaces, areas = _exterior_areas(em)
+    ext_wall_area, roof_area, floor_area = areas["wall"], areas["roof"], areas["floor"]
 
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("Surfaces", f"{total_surfaces:,}")
@@ -28,6 +28,11 @@ from typing import Any, Dict, List, Mapping, Optional, Union
 import pandas as pd
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -66,7 +71,7 @@ def render_diagnostics_panel_v6(
         stage_opts = sorted([s for s in df["stage"].unique() if s])
         stage_filter = st.multiselect("Stage", options=stage_opts, default=stage_opts)
 
-    filtered = df.copy()
+    filtered = df  # each filter step below returns a new frame
     if level_filter:
         filtered = filtered[filtered["level"].isin(level_filter)]
     if code_filter:
@@ -74,13 +79,9 @@ def render_diagnostics_panel_v6(
     if stage_filter:
         filtered = filtered[filtered["stage"].isin(stage_filter)]
     if search_text:
-        s = search_text.lower()
-        mask = (
-            filtered["message"].str.lower().str.contains(s, na=False)
-            | filtered["path"].str.lower().str.contains(s, na=False)
-            | filtered["context"].str.lower().str.contains(s, na=False)
-        )
-        filtered = filtered[mask]
+        # Plain substring match (no regex) over the pre-lowered search column
+        filtered = filtered[filtered[SEARCH_COL].str.contains(search_text.lower(), regex=False, na=False)]
+    filtered = filtered.drop(columns=[SEARCH_COL])
 
     st.caption(f"{len(filtered)} of {len(df)} messages shown")
     st.dataframe(
@@ -98,7 +99,13 @@ def render_diagnostics_panel_v6(
 # ---------------------------------------------------------------------------
 
 REQUIRED_COLS = ["level", "code", "message", "path", "context", "stage", "ts", "source"]
+# Lowercased message/path/context, joined with a unit separator, built once per payload
+SEARCH_COL = "_search"
 
+# Cached per diagnostics payload: filter/search widget changes rerun the page,
+# but only the boolean-mask filtering below needs to run again. Bounded, since
+# each import brings a new payload and only the current model's is reused.
+@st.cache_data(show_spinner=False, max_entries=4)
 def _normalize_for_table_view(
     diagnostics: Union[List[Mapping[str, Any]], List[str], None]
 ) -> pd.DataFrame:
@@ -137,6 +144,7 @@ def _normalize_for_table_view(
                 "source": "",
             })
     df = pd.DataFrame(rows, columns=REQUIRED_COLS)
+    df[SEARCH_COL] = (df["message"] + "\x1f" + df["path"] + "\x1f" + df["context"]).str.lower()
     try:
         df["_ts"] = pd.to_datetime(df["ts"], errors="coerce")
         df = df.sort_values(by="_ts", ascending=True).drop(columns=["_ts"])
@@ -246,6 +254,17 @@ def _render_save_controls(
     )
 
 
+def _json_bytes(obj: Any, indent: bool = True) -> bytes:
+    """UTF-8 JSON for downloads: one orjson call when available, else stdlib json."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            return orjson.dumps(obj, option=option | orjson.OPT_INDENT_2 if indent else option)
+        except TypeError:
+            pass  # types orjson rejects; stdlib json may still handle them
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
 def _to_csv_bytes(df: pd.DataFrame) -> bytes:
     buf = io.StringIO()
     df.to_csv(buf, index=False)
@@ -254,14 +273,11 @@ def _to_csv_bytes(df: pd.DataFrame) -> bytes:
 
 def _to_json_bytes(df: pd.DataFrame) -> bytes:
     records = df.to_dict(orient="records")
-    return json.dumps(records, ensure_ascii=False, indent=2).encode("utf-8")
+    return _json_bytes(records)
 
 
 def _to_ndjson_bytes(df: pd.DataFrame) -> bytes:
-    out = io.StringIO()
-    for rec in df.to_dict(orient="records"):
-        out.write(json.dumps(rec, ensure_ascii=False) + "\n")
-    return out.getvalue().encode("utf-8")
+    return b"".join(_json_bytes(rec, indent=False) + b"\n" for rec in df.to_dict(orient="records"))
 
 
 def _to_zip_bytes(
@@ -277,15 +293,20 @@ def _to_zip_bytes(
     mem = io.BytesIO()
     with zipfile.ZipFile(mem, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
         # Raw diagnostics
-        zf.writestr(f"{base}/diagnostics_raw.json", json.dumps(raw_payload, ensure_ascii=False, indent=2))
+        zf.writestr(f"{base}/diagnostics_raw.json", _json_bytes(raw_payload))
         if include_csv:
-            zf.writestr(f"{base}/{base}.csv", _to_csv_bytes(filtered_df))
+            # Stream rows straight into the archive member (no intermediate str/bytes copy)
+            with io.TextIOWrapper(zf.open(f"{base}/{base}.csv", "w"), encoding="utf-8", newline="") as fh:
+                filtered_df.to_csv(fh, index=False)
         if include_json:
             zf.writestr(f"{base}/{base}.json", _to_json_bytes(filtered_df))
         if include_ndjson:
-            zf.writestr(f"{base}/{base}.ndjson", _to_ndjson_bytes(filtered_df))
+            with zf.open(f"{base}/{base}.ndjson", "w") as fh:
+                for rec in filtered_df.to_dict(orient="records"):
+                    fh.write(_json_bytes(rec, indent=False))
+                    fh.write(b"\n")
         if em_v6 is not None:
-            zf.writestr(f"{base}/model_em_v6.json", json.dumps(em_v6, ensure_ascii=False, indent=2))
+            zf.writestr(f"{base}/model_em_v6.json", _json_bytes(em_v6))
         zf.writestr(
             f"{base}/README.txt",
             (
@@ -4,7 +4,19 @@ import json
 import difflib
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
 def _to_pretty_json(obj) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # types orjson rejects; stdlib json may still handle them
     try:
         return json.dumps(obj, indent=2, sort_keys=True)
     except Exception:
@@ -14,5 +26,8 @@ def render_diff_viewer(left_obj, right_obj, left_label="Left", right_label="Righ
     left = _to_pretty_json(left_obj)
     right = _to_pretty_json(right_obj)
     st.caption(f"Comparing **{left_label}** ↔ **{right_label}**")
+    if left == right:
+        st.code("# No differences found", language="diff")
+        return
     diff = difflib.unified_diff(left.splitlines(), right.splitlines(), fromfile=left_label, tofile=right_label, lineterm="")
     st.code("\n".join(diff) or "# No differences found", language="diff")
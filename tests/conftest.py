@@ -4,3 +4,8 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+
+# emtools is not installed as a package; import it from em-tools/
+EM_TOOLS = os.path.join(ROOT, "em-tools")
+if EM_TOOLS not in sys.path:
+    sys.path.insert(0, EM_TOOLS)
@@ -0,0 +1,43 @@
+# tests/test_cibd22x_bytes_roundtrip.py
+import io
+from pathlib import Path
+
+import pytest
+
+from emtools.exporters.cibd22x_exporter import write_xml_bytes
+from emtools.translators.cibd22x_importer import translate_cibd22x_to_v6
+
+SAMPLE = (Path(__file__).resolve().parents[1] / "Reference_Datasets" / "cbecc_samples"
+          / "cibd22x file" / "Euclid_Building C_2025-01-06.cibd22x")
+
+
+def _geometry(em):
+    g = em["geometry"]
+    surfaces = [s for bucket in g["surfaces"].values() for s in bucket]
+    openings = [o for bucket in g["openings"].values() for o in bucket]
+    return g["zones"], surfaces, openings
+
+
+def test_roundtrip_through_bytesio_preserves_geometry():
+    if not SAMPLE.exists():
+        pytest.skip(f"sample model not found: {SAMPLE}")
+    em = translate_cibd22x_to_v6(str(SAMPLE))
+    em2 = translate_cibd22x_to_v6(io.BytesIO(write_xml_bytes(em)))
+
+    assert em2["_metadata"]["source_file"] is None
+
+    zones, surfaces, openings = _geometry(em)
+    zones2, surfaces2, openings2 = _geometry(em2)
+    assert len(zones2) == len(zones)
+    assert len(surfaces2) == len(surfaces)
+    assert len(openings2) == len(openings)
+
+    assert [z["id"] for z in zones2] == [z["id"] for z in zones]
+    # Surfaces/openings have no name in v6, so the exporter writes their ID as
+    # the name and re-import mints new IDs from it; compare through the links
+    assert [s["zone_id"] for s in surfaces2] == [s["zone_id"] for s in surfaces]
+    surface_ids = dict(zip((s["id"] for s in surfaces), (s["id"] for s in surfaces2)))
+    assert len(set(surface_ids.values())) == len(surfaces)
+    assert [o["parent_surface_id"] for o in openings2] == [
+        surface_ids[o["parent_surface_id"]] for o in openings
+    ]
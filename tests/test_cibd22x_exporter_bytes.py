@@ -0,0 +1,40 @@
+# tests/test_cibd22x_exporter_bytes.py
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from emtools.exporters.cibd22x_exporter import emjson6_to_cibd22x, write_xml, write_xml_bytes
+from emtools.translators.cibd22x_importer import translate_cibd22x_to_v6
+
+SAMPLE = (Path(__file__).resolve().parents[1] / "Reference_Datasets" / "cbecc_samples"
+          / "cibd22x file" / "Euclid_Building C_2025-01-06.cibd22x")
+
+
+@pytest.fixture(scope="module")
+def em():
+    if not SAMPLE.exists():
+        pytest.skip(f"sample model not found: {SAMPLE}")
+    model = translate_cibd22x_to_v6(str(SAMPLE))
+    # Non-ASCII text must come out as plain UTF-8
+    model["geometry"]["zones"][0]["name"] = "Zone é – ☃"
+    return model
+
+
+def _whole_tree_bytes(em):
+    root = emjson6_to_cibd22x(em)
+    ET.indent(root, space="  ")
+    text = "<?xml version='1.0' encoding='utf-8'?>\n" + ET.tostring(root, encoding="unicode")
+    return text.encode("utf-8")
+
+
+def test_write_xml_bytes_matches_whole_tree_indent(em):
+    assert write_xml_bytes(em) == _whole_tree_bytes(em)
+
+
+def test_write_xml_file_matches_write_xml_bytes(em, tmp_path):
+    out = tmp_path / "model.cibd22x"
+    write_xml(em, str(out))
+    data = out.read_bytes()
+    assert data == write_xml_bytes(em)
+    assert "Zone é – ☃".encode("utf-8") in data
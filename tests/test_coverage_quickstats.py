@@ -0,0 +1,43 @@
+# tests/test_coverage_quickstats.py
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+from explorer_gui.components.coverage_quickstats import _exterior_areas, _SF_PER_M2
+from emtools.translators.cibd22_importer import translate_cibd22_to_v6
+
+SAMPLE = (Path(__file__).resolve().parents[1] / "Reference_Datasets" / "CUACSamples2022"
+          / "CUAC-MF8Unit_2Story_ELEC-CZ12.cibd22")
+
+
+def test_quickstats_areas_for_cibd22_v6_model():
+    if not SAMPLE.exists():
+        pytest.skip(f"sample model not found: {SAMPLE}")
+    em = translate_cibd22_to_v6(str(SAMPLE))
+    surfaces = em["geometry"]["surfaces"]
+
+    total, areas = _exterior_areas(em)
+
+    # CIBD22 v6 surfaces carry only surface_type ("exterior"/"interior") and
+    # area_m2; the wall/roof/floor split comes from the bucket they are in
+    assert total == sum(len(v) for v in surfaces.values())
+    for bucket, key in (("walls", "wall"), ("roofs", "roof"), ("floors", "floor")):
+        expected = sum(s["area_m2"] for s in surfaces[bucket]
+                       if s.get("surface_type") == "exterior") * _SF_PER_M2
+        assert areas[key] == pytest.approx(expected)
+    assert areas["wall"] > 0
+    assert areas["floor"] > 0
+
+
+def test_quickstats_skips_interior_v6_surfaces():
+    em = {"geometry": {"surfaces": {
+        "walls": [{"surface_type": "exterior", "area_m2": 10.0},
+                  {"surface_type": "interior", "area_m2": 5.0}],
+        "roofs": [{"type": "roof", "adjacency": "exterior", "area_m2": 2.0}],
+        "floors": [{"type": "slab", "adjacency": "adiabatic", "area_m2": 3.0}],
+    }}}
+    total, areas = _exterior_areas(em)
+    assert total == 4
+    assert areas == pytest.approx({"wall": 10.0 * _SF_PER_M2, "roof": 2.0 * _SF_PER_M2, "floor": 0.0})
@@ -0,0 +1,81 @@
+# tests/test_id_registry.py
+import hashlib
+import json
+
+from emtools.utils.id_registry import IDRegistry, load_registry
+
+
+def _md5_8(text):
+    return hashlib.md5(text.encode()).hexdigest()[:8]
+
+
+def _blake2b_8(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=4).hexdigest()
+
+
+def test_new_registry_uses_blake2b():
+    reg = IDRegistry()
+    assert reg.hash_algorithm == "blake2b"
+    zid = reg.generate_id("Z", "Living Room", context="", source_format="CIBD22X")
+    assert zid == f"Z-{_blake2b_8('Z:Living Room:')}-living_room"
+
+
+def test_legacy_registry_loads_and_keeps_minting_md5_ids():
+    old_id = f"Z-{_md5_8('Z:Kitchen:')}-kitchen"
+    legacy = {
+        # No hash_algorithm key; reverse_map in the full pre-compact form
+        "forward_map": {"CIBD22X:Kitchen:": old_id},
+        "reverse_map": {
+            old_id: {
+                "source_format": "CIBD22X",
+                "source_id": "Kitchen",
+                "context": "",
+                "lookup_key": "CIBD22X:Kitchen:",
+            }
+        },
+    }
+    reg = load_registry(legacy)
+    assert reg.hash_algorithm == "md5"
+    assert reg.generate_id("Z", "Kitchen") == old_id
+    assert reg.resolve(old_id)["lookup_key"] == "CIBD22X:Kitchen:"
+    new_id = reg.generate_id("S", "Wall 1", context=old_id)
+    assert new_id == f"S-{_md5_8(f'S:Wall 1:{old_id}')}-wall_1"
+
+
+def test_generate_id_fast_matches_generate_id():
+    calls = [
+        ("Z", "Zone A", "", "CIBD22"),
+        ("S", "Wall/North #1", "Z-1", "CIBD22"),
+        ("O", "Window", "S-1", "HBJSON"),
+        ("Z", "Zone A", "", "CIBD22"),  # already registered
+    ]
+    for algorithm in ("blake2b", "md5"):
+        slow, fast = IDRegistry(algorithm), IDRegistry(algorithm)
+        for prefix, name, context, fmt in calls:
+            assert fast.generate_id_fast(prefix, name, context, fmt) == slow.generate_id(
+                prefix, name, context=context, source_format=fmt)
+        assert fast.forward_map == slow.forward_map
+        assert fast.reverse_map == slow.reverse_map
+
+
+def test_export_json_load_export_is_stable():
+    reg = IDRegistry()
+    zid = reg.generate_id("Z", "Zone A", source_format="CIBD22")
+    sid = reg.generate_id("S", "Wall 1", context=zid, source_format="CIBD22")
+    exported = reg.export_registry()
+
+    reloaded = load_registry(json.loads(json.dumps(exported)))
+    assert reloaded.export_registry() == exported
+    assert reloaded.generate_id("S", "Wall 1", context=zid, source_format="CIBD22") == sid
+
+
+def test_resolve_after_load_restores_lookup_key():
+    reg = IDRegistry()
+    zid = reg.generate_id("Z", "Zone A", source_format="CIBD22")
+    reloaded = load_registry(json.loads(json.dumps(reg.export_registry())))
+    assert reloaded.resolve(zid) == {
+        "source_format": "CIBD22",
+        "source_id": "Zone A",
+        "context": "",
+        "lookup_key": "CIBD22:Zone A:",
+    }
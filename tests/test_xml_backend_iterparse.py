@@ -0,0 +1,77 @@
+# tests/test_xml_backend_iterparse.py
+import pytest
+from xml.etree import ElementTree as StdET
+
+from emtools.utils import xml_backend
+from emtools.utils.xml_backend import iterparse_indexed
+
+DOC = """<?xml version="1.0" encoding="utf-8"?>
+<SDDXML xmlns="urn:test" version="2" units="IP">
+  <Proj>
+    <Name>Project</Name>
+    <Bldg>
+      <Story>
+        <Notes><Note>unused</Note></Notes>
+        <Spc><Name>S1</Name><Sub><Leaf>1</Leaf></Sub></Spc>
+      </Story>
+    </Bldg>
+    <Lib><Mat><Name>M1</Name></Mat></Lib>
+    <Rpt><Rpt><Spc><Name>Hidden</Name></Spc></Rpt></Rpt>
+  </Proj>
+</SDDXML>
+"""
+
+
+def _local(elem):
+    return elem.tag.split("}")[-1]
+
+
+def _child_tags(elem):
+    return [_local(ch) for ch in elem]
+
+
+@pytest.fixture(params=["etree", "lxml"])
+def xml_file(request, monkeypatch, tmp_path):
+    if request.param == "lxml":
+        lxml_etree = pytest.importorskip("lxml.etree")
+        monkeypatch.setattr(xml_backend, "ET", lxml_etree)
+        monkeypatch.setattr(xml_backend, "HAVE_LXML", True)
+    else:
+        monkeypatch.setattr(xml_backend, "ET", StdET)
+        monkeypatch.setattr(xml_backend, "HAVE_LXML", False)
+    path = tmp_path / "model.xml"
+    path.write_text(DOC, encoding="utf-8")
+    return str(path)
+
+
+def test_prune_drops_subtrees_outside_indexed_elements(xml_file):
+    root, _ = iterparse_indexed(xml_file, ["Spc"], skip_tags=["Rpt"], prune_unindexed=True)
+    proj = root[0]
+    assert _child_tags(proj) == ["Bldg"]
+    assert _child_tags(proj[0][0]) == ["Spc"]
+
+
+def test_prune_keeps_subtree_with_indexed_descendant(xml_file):
+    root, index = iterparse_indexed(xml_file, ["Spc"], skip_tags=["Rpt"], prune_unindexed=True)
+    spaces = index.find_all("Spc")
+    assert len(spaces) == 1
+    spc = spaces[0]
+    assert _child_tags(spc) == ["Name", "Sub"]
+    assert spc[0].text == "S1"
+    assert _child_tags(spc[1]) == ["Leaf"]
+    # Still reachable from the root through its kept ancestors
+    assert root[0][0][0][0] is spc
+
+
+def test_nested_skip_sections_are_removed_and_not_indexed(xml_file):
+    root, index = iterparse_indexed(xml_file, ["Spc", "Mat"], skip_tags=["Rpt"])
+    assert _child_tags(root[0]) == ["Name", "Bldg", "Lib"]
+    assert [s[0].text for s in index.find_all("Spc")] == ["S1"]
+    assert len(index.find_all("Mat")) == 1
+
+
+def test_root_attributes_survive_pruning(xml_file):
+    root, _ = iterparse_indexed(xml_file, ["Spc"], skip_tags=["Rpt"], prune_unindexed=True)
+    assert _local(root) == "SDDXML"
+    assert root.get("version") == "2"
+    assert root.get("units") == "IP"
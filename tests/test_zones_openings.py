@@ -0,0 +1,77 @@
+# tests/test_zones_openings.py
+import io
+
+from emtools.parsers.zones import find_zone_nodes, parse_openings, parse_surfaces, parse_zones
+from emtools.translators.cibd22x_importer import translate_cibd22x_to_v6
+from emtools.utils.id_registry import IDRegistry
+from emtools.utils.xml_backend import parse_xml_root
+
+DOC = """<?xml version="1.0" encoding="utf-8"?>
+<SDDXML>
+  <Proj>
+    <ResZn><Name>Living</Name>
+      <ResExtWall><Name>North</Name><Area>100</Area>
+        <ResWin><Name>N1</Name><Area>12</Area></ResWin>
+        <ResWin><Name>N2</Name><Area>12</Area></ResWin>
+      </ResExtWall>
+      <ResExtWall><Name>South</Name><Area>100</Area>
+        <Door><Name>D1</Name><Area>20</Area></Door>
+      </ResExtWall>
+    </ResZn>
+    <ResZn><Name>Bed</Name>
+      <ResExtWall><Name>East</Name><Area>80</Area>
+        <ResWin><Name>E1</Name><Area>10</Area></ResWin>
+      </ResExtWall>
+    </ResZn>
+  </Proj>
+</SDDXML>
+"""
+
+
+def _codes(em, code):
+    return [d for d in em["diagnostics"] if d["code"] == code]
+
+
+def test_multi_surface_model_records_one_openings_summary():
+    em = translate_cibd22x_to_v6(io.BytesIO(DOC.encode("utf-8")))
+    parsed = _codes(em, "I-OPENINGS-PARSED")
+    assert len(parsed) == 1
+    assert parsed[0]["context"] == {"windows": 3, "doors": 1, "skylights": 0}
+
+
+def test_openings_on_missing_surface_are_counted_as_orphaned():
+    root = parse_xml_root(io.BytesIO(DOC.encode("utf-8")))
+    em = {"geometry": {}, "diagnostics": []}
+    registry = IDRegistry()
+    zone_nodes = find_zone_nodes(root)
+    parse_zones(root, em, registry, zone_nodes=zone_nodes)
+    parse_surfaces(root, em, registry, zone_nodes=zone_nodes)
+    # Drop the North wall so its two windows have no parent surface
+    walls = em["geometry"]["surfaces"]["walls"]
+    walls[:] = [s for s in walls if not s["id"].endswith("-north")]
+
+    parse_openings(root, em, registry, zone_nodes=zone_nodes)
+
+    assert len(_codes(em, "W-SURFACE-NOT-FOUND")) == 1
+    orphaned = _codes(em, "W-OPENINGS-ORPHANED")
+    assert len(orphaned) == 1
+    assert orphaned[0]["message"].startswith("2 openings")
+    assert len(em["geometry"]["openings"]["windows"]) == 1
+
+
+def test_surfaces_of_duplicate_zone_names_attach_to_first_zone():
+    doc = b"""<SDDXML><Proj>
+      <ResZn><Name>Living</Name><ResExtWall><Name>A</Name></ResExtWall></ResZn>
+      <ResZn><Name>Living</Name><ResExtWall><Name>B</Name></ResExtWall></ResZn>
+    </Proj></SDDXML>"""
+    root = parse_xml_root(io.BytesIO(doc))
+    em = {"geometry": {}, "diagnostics": []}
+    registry = IDRegistry()
+    zone_nodes = find_zone_nodes(root)
+    parse_zones(root, em, registry, zone_nodes=zone_nodes)
+    parse_surfaces(root, em, registry, zone_nodes=zone_nodes)
+
+    first, second = em["geometry"]["zones"]
+    assert first["id"] == second["id"]
+    assert len(first["surfaces"]) == 2
+    assert second["surfaces"] == []